@@ -1,77 +1,970 @@
-# Backend/A_STT.py
-
-import wave
-import numpy as np
-from transformers import pipeline
-
-
-# -------------------------------------------------
-# Better model (much higher accuracy)
-# -------------------------------------------------
-asr = pipeline(
-    "automatic-speech-recognition",
-    model="openai/whisper-base",   # ← upgrade from small
-    device=-1
-)
-
-
-# -------------------------------------------------
-# Resample WITHOUT torchaudio (pure numpy)
-# -------------------------------------------------
-def resample(audio, orig_sr, target_sr=16000):
-    if orig_sr == target_sr:
-        return audio
-
-    duration = len(audio) / orig_sr
-    new_len = int(duration * target_sr)
-
-    old_idx = np.linspace(0, len(audio), num=len(audio))
-    new_idx = np.linspace(0, len(audio), num=new_len)
-
-    return np.interp(new_idx, old_idx, audio).astype(np.float32)
-
-
-# -------------------------------------------------
-# Chunking improves whisper accuracy
-# -------------------------------------------------
-def chunk_audio(audio, sr, chunk_seconds=25):
-    size = chunk_seconds * sr
-    for i in range(0, len(audio), size):
-        yield audio[i:i+size]
-
-
-# -------------------------------------------------
-# MAIN
-# -------------------------------------------------
-def transcribe_audio(path: str) -> str:
-    """
-    Streamlit-Cloud safe:
-    ✔ no ffmpeg
-    ✔ no torchaudio
-    ✔ no soundfile
-    ✔ numpy only
-    ✔ better accuracy
-    """
-
-    # -------- read wav --------
-    with wave.open(path, "rb") as wf:
-        frames = wf.readframes(wf.getnframes())
-        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-        sr = wf.getframerate()
-        channels = wf.getnchannels()
-
-    # -------- stereo → mono --------
-    if channels == 2:
-        audio = audio.reshape(-1, 2).mean(axis=1)
-
-    # -------- resample to 16k --------
-    audio = resample(audio, sr, 16000)
-
-    # -------- chunk for better quality --------
-    texts = []
-
-    for chunk in chunk_audio(audio, 16000, 25):
-        result = asr({"array": chunk, "sampling_rate": 16000})
-        texts.append(result["text"])
-
-    return " ".join(texts)
+# Backend/A_STT.py
+
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from Backend import metrics
+from Backend.cache import hash_file
+from Backend.decoder import open_audio, probe
+
+
+# -------------------------------------------------
+# ASR engines
+# whisper sizes in fp32, or int8 (dynamic quantization of the
+# Linear layers — most of whisper's CPU time); each engine is
+# loaded lazily, once per process, and shared by every caller:
+# importing this module never touches torch
+# -------------------------------------------------
+ENGINES = {}
+
+
+def register_engine(name, model, int8=False):
+    """
+    Make `name` selectable per request / meeting type.
+    """
+    ENGINES[name] = {"model": model, "int8": int8}
+
+
+for _size in ("tiny", "base", "small"):
+    register_engine(_size, f"openai/whisper-{_size}")
+    register_engine(f"{_size}-int8", f"openai/whisper-{_size}", int8=True)
+
+DEFAULT_ENGINE = os.environ.get("ASR_ENGINE", "base")
+
+
+def _meeting_engines(spec):
+    # "standup=tiny-int8,review=small"
+    pairs = (item.split("=", 1) for item in spec.split(",") if "=" in item)
+    return {k.strip(): v.strip() for k, v in pairs}
+
+
+# per meeting type, when a request does not name an engine
+MEETING_ENGINES = _meeting_engines(os.environ.get("ASR_MEETING_ENGINES", ""))
+
+# local snapshots (e.g. <MODEL_DIR>/whisper-base) win over the hub cache
+MODEL_DIR = os.environ.get(
+    "MEETING_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+)
+
+# never reach the network for weights (air-gapped nodes)
+OFFLINE = os.environ.get("MEETING_OFFLINE") == "1"
+
+_asr = OrderedDict()    # name → ASREngine, least recently used first
+_asr_lock = threading.Lock()
+_load_lock = threading.Lock()
+
+
+def resolve_model(name):
+    """
+    Local directory for `name` if one exists under MODEL_DIR,
+    otherwise the hub id (served from the HF cache when offline).
+    """
+    local = os.path.join(MODEL_DIR, name.split("/")[-1])
+    return local if os.path.isdir(local) else name
+
+
+def resolve_engine(engine=None, meeting_type=None):
+    """
+    Engine name for a request: explicit > meeting type > default.
+    """
+    name = engine or MEETING_ENGINES.get(meeting_type) or DEFAULT_ENGINE
+
+    if name not in ENGINES:
+        raise ValueError(f"Unknown ASR engine {name!r}; choose from {', '.join(ENGINES)}")
+
+    return name
+
+
+def engine_id(engine=None):
+    """
+    Model identity for cache keys (fp32 keeps the bare hub id).
+    """
+    spec = ENGINES[resolve_engine(engine)]
+    return spec["model"] + ("+int8" if spec["int8"] else "")
+
+
+# one engine object per name serves file transcription, the
+# /jobs workers and live capture alike; least recently used
+# engines are dropped once loaded weights exceed the budget
+ASR_MEMORY_BUDGET = int(float(os.environ.get("ASR_MEMORY_BUDGET_MB", "0")) * 1024 * 1024)
+
+
+class ASREngine:
+    """
+    One loaded whisper pipeline. Calls are serialized: the
+    pipeline is not thread-safe, and torch already spreads one
+    forward pass over every core.
+    """
+
+    def __init__(self, name):
+        spec = ENGINES[name]
+        self.name = name
+
+        if OFFLINE:
+            os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+        from transformers import pipeline
+
+        self.pipe = pipeline(
+            "automatic-speech-recognition",
+            model=resolve_model(spec["model"]),
+            device=-1
+        )
+
+        if spec["int8"]:
+            import torch
+
+            self.pipe.model = torch.ao.quantization.quantize_dynamic(
+                self.pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        self.nbytes = model_bytes(self.pipe.model)
+        self._lock = threading.Lock()
+
+    def transcribe_batch(self, arrays, sr=16000):
+        """
+        Texts for a list of mono float32 arrays at `sr`.
+        """
+        inputs = [
+            {"array": np.asarray(a, dtype=np.float32), "sampling_rate": sr}
+            for a in arrays
+        ]
+
+        with self._lock:
+            results = self.pipe(inputs, batch_size=len(inputs))
+
+        return [r["text"] for r in results]
+
+    def transcribe(self, audio, sr=16000):
+        return self.transcribe_batch([audio], sr)[0]
+
+
+def model_bytes(model):
+    """
+    Bytes held by a torch module's weights, including int8
+    packed weights (exposed as weight() / bias(), not parameters).
+    """
+    tensors = list(model.parameters()) + list(model.buffers())
+
+    for m in model.modules():
+        for attr in ("weight", "bias"):
+            packed = getattr(m, attr, None)
+            if callable(packed):
+                t = packed()
+                if t is not None:
+                    tensors.append(t)
+
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+def loaded_bytes():
+    return sum(e.nbytes for e in list(_asr.values()))
+
+
+def _evict(keep):
+    # caller holds _asr_lock; _asr is ordered oldest use first
+    while ASR_MEMORY_BUDGET and loaded_bytes() > ASR_MEMORY_BUDGET and len(_asr) > 1:
+        oldest = next(n for n in _asr if n != keep)
+        del _asr[oldest]        # freed once in-flight calls finish
+
+
+def get_asr(engine=None):
+    """
+    The shared ASREngine for `engine`, loaded on first use.
+    """
+    name = resolve_engine(engine)
+
+    with _asr_lock:
+        asr = _asr.get(name)
+        if asr is not None:
+            _asr.move_to_end(name)
+            return asr
+
+    # one load at a time, without blocking users of loaded engines
+    with _load_lock:
+        with _asr_lock:
+            asr = _asr.get(name)
+
+        if asr is None:
+            asr = ASREngine(name)
+
+            with _asr_lock:
+                _asr[name] = asr
+                _evict(name)
+
+    return asr
+
+
+def warmup(engine=None):
+    """
+    Load the whisper pipeline now instead of on the first request.
+    """
+    get_asr(engine)
+
+
+metrics.gauge("asr_engine_bytes", "Weights of loaded ASR engines", fn=loaded_bytes)
+
+# chunks per forward pass; tune per host (see stats["chunks_per_sec"])
+DEFAULT_BATCH_SIZE = int(os.environ.get("ASR_BATCH_SIZE", "1"))
+
+# sharded mode: worker processes x torch threads each
+DEFAULT_WORKERS = int(os.environ.get("ASR_WORKERS", "0")) or os.cpu_count() or 1
+DEFAULT_THREADS_PER_WORKER = int(os.environ.get("ASR_THREADS_PER_WORKER", "1"))
+
+# transcribe_audio shards recordings at least this long (0 = never)
+PARALLEL_SECONDS = float(os.environ.get("ASR_PARALLEL_SECONDS", "0"))
+
+# chunks per shard sent to a worker (~100 s of speech)
+SHARD_CHUNKS = 4
+
+# longest kernel np.correlate runs vectorized (see _strided_correlate)
+CORRELATE_TAPS = 11
+
+# wav frames decoded per read when streaming
+READ_BLOCK_FRAMES = 1 << 18
+
+# voice activity detection (energy based)
+VAD_FRAME_MS = 30
+VAD_MIN_DB = -45.0          # frames quieter than this are never speech
+VAD_MARGIN_DB = 10.0        # speech must sit this far above the noise floor
+VAD_HANGOVER_MS = 300       # padding kept around detected speech
+VAD_MIN_PAUSE_MS = 240      # silence long enough to cut a chunk at
+
+
+# -------------------------------------------------
+# Resample WITHOUT torchaudio (pure numpy)
+# polyphase FIR: anti-aliased, float32, streamable
+# -------------------------------------------------
+def resample(audio, orig_sr, target_sr=16000):
+    if orig_sr == target_sr:
+        return audio
+
+    resampler = StreamingResampler(orig_sr, target_sr)
+    audio = np.asarray(audio, dtype=np.float32)
+
+    block = READ_BLOCK_FRAMES
+    out = [
+        resampler.process(audio[i:i + block])
+        for i in range(0, len(audio), block)
+    ]
+    out.append(resampler.flush())
+
+    return np.concatenate(out)
+
+
+def resample_linear(audio, orig_sr, target_sr=16000):
+    """
+    Previous np.interp resampler (no low-pass filter).
+    Kept as the baseline for benchmarks/bench_resample.py.
+    """
+    if orig_sr == target_sr:
+        return audio
+
+    duration = len(audio) / orig_sr
+    new_len = int(duration * target_sr)
+
+    old_idx = np.linspace(0, len(audio), num=len(audio))
+    new_idx = np.linspace(0, len(audio), num=new_len)
+
+    return np.interp(new_idx, old_idx, audio).astype(np.float32)
+
+
+# -------------------------------------------------
+# Chunking improves whisper accuracy
+# -------------------------------------------------
+def chunk_audio(audio, sr, chunk_seconds=25):
+    size = chunk_seconds * sr
+    for i in range(0, len(audio), size):
+        yield audio[i:i+size]
+
+
+# -------------------------------------------------
+# Streaming pipeline (bounded memory)
+# read → downmix → resample → chunk, one block at a time
+# -------------------------------------------------
+class StreamingResampler:
+    """
+    Rational-ratio polyphase resampler (up L, down M) with a
+    Kaiser-windowed sinc low-pass, so 44.1/48 kHz input does not
+    alias into the 16 kHz band whisper sees.
+    Filter history is kept between `process` calls; `flush` drains
+    the group delay. Total output length is floor(N * L / M).
+    """
+
+    # rows per matmul (bounds any temporary copy of the window view)
+    STEP = 8192
+
+    def __init__(self, orig_sr, target_sr, zero_crossings=10, rolloff=0.9, beta=8.0):
+        self.passthrough = orig_sr == target_sr
+
+        g = math.gcd(int(orig_sr), int(target_sr))
+        self.up = int(target_sr) // g
+        self.down = int(orig_sr) // g
+
+        self.taps, self.delay = _polyphase_filter(self.up, self.down, zero_crossings, rolloff, beta)
+        self.width = self.taps.shape[1]
+
+        self._in_count = 0      # input samples seen
+        self._next = 0          # next output index
+        self._base = -(self.width - 1)   # input index of self._buf[0]
+        self._buf = np.zeros(self.width - 1, dtype=np.float32)
+
+    def _emit(self, available):
+        """
+        Compute every output whose newest input index < `available`.
+        Outputs n, n+up, n+2up... share a phase and read input windows
+        `down` samples apart, so each phase is one strided matmul.
+        """
+        up, down = self.up, self.down
+
+        # newest input for output n is (n*down + delay) // up
+        stop = (available * up - self.delay + down - 1) // down
+        stop = max(stop, self._next)
+        count = stop - self._next
+
+        out = np.empty(count, dtype=np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(self._buf, self.width)
+
+        for r in range(min(up, count)):
+            t = (self._next + r) * down + self.delay
+            first = t // up - (self.width - 1) - self._base
+            taps = self.taps[t % up]
+            n = len(range(r, count, up))
+
+            # integer ratios (48k→16k, 8k→16k): a few sub-filter
+            # correlations, instead of copying a window per output
+            if down <= self.width:
+                out[r::up] = _strided_correlate(self._buf, first, n, down, taps)
+                continue
+
+            for j in range(0, n, self.STEP):
+                rows = windows[first + j * down:first + (n - 1) * down + 1:down][:self.STEP]
+                out[r + j * up:r + (j + len(rows)) * up:up] = rows @ taps
+
+        self._next = stop
+
+        # keep only the history the next output needs
+        keep = (stop * down + self.delay) // up - (self.width - 1)
+        drop = min(max(keep - self._base, 0), len(self._buf))
+        self._buf = self._buf[drop:]
+        self._base += drop
+
+        return out
+
+    def process(self, block):
+        if self.passthrough:
+            return block
+
+        block = np.asarray(block, dtype=np.float32)
+        self._buf = np.concatenate([self._buf, block])
+        self._in_count += len(block)
+
+        return self._emit(self._in_count)
+
+    def flush(self):
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+
+        total = self._in_count * self.up // self.down
+        pad = total - self._next
+
+        if pad <= 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # zero-pad past the end so the filter tail can be evaluated
+        tail = self.width + pad * self.down // self.up + 1
+        self._buf = np.concatenate([self._buf, np.zeros(tail, dtype=np.float32)])
+        available = self._base + len(self._buf)
+
+        out = self._emit(available)
+        return out[:pad]
+
+
+def _strided_correlate(x, first, n, stride, taps):
+    """
+    out[i] = x[first + i*stride:][:len(taps)] @ taps for i < n.
+    Taps k = j*stride + p only ever meet x[first + p + (i+j)*stride],
+    so this is `stride` correlations of decimated input, each cut
+    into CORRELATE_TAPS-tap pieces: np.correlate vectorizes short
+    kernels but falls back to one dot call per output above ~11.
+    """
+    out = np.zeros(n, dtype=np.float32)
+
+    for p in range(min(stride, len(taps))):
+        sub = taps[p::stride]
+        xs = np.ascontiguousarray(x[first + p:first + p + (n - 1 + len(sub)) * stride:stride])
+
+        for k in range(0, len(sub), CORRELATE_TAPS):
+            piece = sub[k:k + CORRELATE_TAPS]
+            out += np.correlate(xs[k:k + n - 1 + len(piece)], piece, "valid")
+
+    return out
+
+
+def _polyphase_filter(up, down, zero_crossings, rolloff, beta):
+    """
+    Kaiser-windowed sinc split into `up` phases.
+    Row p holds the taps for output phase p, reversed so a row
+    dot-multiplies an oldest→newest input window directly.
+    Returns (taps, delay) with delay in upsampled samples.
+    """
+    ratio = max(up, down)
+    cutoff = rolloff * 0.5 / ratio          # cycles per upsampled sample
+
+    half = int(math.ceil(zero_crossings * ratio / rolloff))
+    t = np.arange(-half, half + 1)
+    h = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(2 * half + 1, beta)
+    h *= up / h.sum()                        # unity DC gain per phase
+
+    # pad to a whole number of phases
+    width = -(-len(h) // up)
+    h = np.concatenate([h, np.zeros(width * up - len(h))])
+
+    # taps[p, k] = h[p + k*up]; reversed along k
+    taps = h.reshape(width, up).T[:, ::-1].astype(np.float32).copy()
+    return taps, half
+
+
+def rechunk(blocks, size):
+    """
+    Regroup a stream of 1-D blocks into chunks of exactly `size`
+    samples (the last one may be shorter), like `chunk_audio`.
+    """
+    buf = np.empty(size, dtype=np.float32)
+    fill = 0
+
+    for block in blocks:
+        while len(block):
+            take = min(size - fill, len(block))
+            buf[fill:fill + take] = block[:take]
+            fill += take
+            block = block[take:]
+
+            if fill == size:
+                yield buf
+                buf = np.empty(size, dtype=np.float32)
+                fill = 0
+
+    if fill:
+        yield buf[:fill]
+
+
+def stream_audio(path, target_sr=16000, block_frames=READ_BLOCK_FRAMES):
+    """
+    Yield mono float32 blocks of `path` resampled to `target_sr`.
+    Any format Backend.decoder reads (WAV/FLAC/OGG, mp3/m4a via ffmpeg).
+    """
+    with open_audio(path) as dec:
+        resampler = StreamingResampler(dec.samplerate, target_sr)
+
+        for block in dec.blocks(block_frames):
+            out = resampler.process(block)
+            if len(out):
+                yield out
+
+        tail = resampler.flush()
+        if len(tail):
+            yield tail
+
+
+# -------------------------------------------------
+# Voice activity detection
+# drop silence and cut chunks at pauses, before ASR
+# -------------------------------------------------
+def frame_energy_db(audio, sr, frame_ms=VAD_FRAME_MS):
+    """
+    RMS level in dBFS of each full `frame_ms` frame.
+    """
+    size = int(sr * frame_ms / 1000)
+    n = len(audio) // size
+
+    frames = audio[:n * size].reshape(n, size)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+
+    return 20 * np.log10(rms + 1e-10)
+
+
+def _dilate(mask, radius):
+    if radius <= 0 or not len(mask):
+        return mask
+    return np.convolve(mask, np.ones(2 * radius + 1), "same") > 0
+
+
+def _last_pause(silent, lo, hi, run):
+    """
+    Centre frame of the last `run`-frame silent stretch starting
+    in [lo, hi), or None.
+    """
+    if len(silent) < run:
+        return None
+
+    full = np.convolve(silent, np.ones(run, dtype=int), "valid") == run
+    starts = np.flatnonzero(full[lo:hi])
+
+    if not len(starts):
+        return None
+
+    return lo + starts[-1] + run // 2
+
+
+def vad_chunks(blocks, sr=16000, chunk_seconds=25, stats=None):
+    """
+    Regroup a stream of blocks into speech-only chunks of at most
+    `chunk_seconds`. Chunks end at the latest pause after half the
+    chunk length (hard cut at `chunk_seconds` if nobody pauses),
+    and non-speech frames are dropped before they reach whisper.
+
+    The noise floor is the quietest 10th-percentile frame level seen
+    so far, taken only from windows that contain real pauses (that
+    percentile at least VAD_MARGIN_DB under the window's median), so
+    a window of continuous speech never becomes its own floor. A
+    frame is speech if it is above VAD_MIN_DB and, once a floor is
+    known, floor + VAD_MARGIN_DB; dilated by VAD_HANGOVER_MS.
+    If `stats` is a dict it gets input/speech seconds and speech_ratio.
+    """
+    frame = int(sr * VAD_FRAME_MS / 1000)
+    max_frames = chunk_seconds * sr // frame
+    hangover = VAD_HANGOVER_MS // VAD_FRAME_MS
+    pause = max(1, VAD_MIN_PAUSE_MS // VAD_FRAME_MS)
+
+    floor = np.inf
+    total = 0
+    kept = 0
+    buf = np.zeros(0, dtype=np.float32)
+
+    def split(buf, final):
+        nonlocal floor, kept
+
+        db = frame_energy_db(buf, sr)
+        if len(db):
+            quiet, typical = np.percentile(db, [10, 50])
+            if quiet <= typical - VAD_MARGIN_DB:
+                floor = min(floor, quiet)
+
+        loud = db > max(VAD_MIN_DB, floor + VAD_MARGIN_DB) if np.isfinite(floor) else db > VAD_MIN_DB
+        speech = _dilate(loud, hangover)
+
+        if final:
+            cut = len(db)
+        else:
+            cut = _last_pause(~loud, max_frames // 2, max_frames - pause + 1, pause)
+            if cut is None:
+                cut = max_frames
+
+        frames = buf[:cut * frame].reshape(cut, frame)
+        chunk = frames[speech[:cut]].ravel()
+
+        # partial frame at the very end follows the last full frame
+        if final and len(buf) > cut * frame and cut and speech[cut - 1]:
+            chunk = np.concatenate([chunk, buf[cut * frame:]])
+
+        kept += len(chunk)
+        return chunk, buf[cut * frame:]
+
+    for block in blocks:
+        total += len(block)
+        buf = np.concatenate([buf, block])
+
+        while len(buf) >= max_frames * frame:
+            chunk, buf = split(buf, final=False)
+            if len(chunk):
+                yield chunk
+
+    if len(buf):
+        chunk, _ = split(buf, final=True)
+        if len(chunk):
+            yield chunk
+
+    if stats is not None:
+        stats.update({
+            "input_seconds": total / sr,
+            "speech_seconds": kept / sr,
+            "speech_ratio": kept / total if total else 0.0,
+        })
+
+
+def chunk_blocks(blocks, sr=16000, chunk_seconds=25, vad=False, stats=None):
+    """
+    Regroup 16 kHz blocks into whisper chunks.
+    With `vad`, silence is dropped and chunks end at pauses.
+    """
+    if vad:
+        return vad_chunks(blocks, sr, chunk_seconds, stats)
+
+    return rechunk(blocks, chunk_seconds * sr)
+
+
+def stream_chunks(path, sr=16000, chunk_seconds=25, vad=False, stats=None):
+    """
+    Streaming replacement for resample + chunk_audio:
+    peak memory is O(chunk) whatever the recording length.
+    """
+    return chunk_blocks(stream_audio(path, sr), sr, chunk_seconds, vad, stats)
+
+
+def resampled_length(path, target_sr=16000):
+    """
+    Number of samples `stream_audio` will produce, from the header
+    (0 when the format does not record it).
+    """
+    info = probe(path)
+    if info is None:
+        return 0
+
+    sr, frames = info
+    return frames * target_sr // sr
+
+
+def iter_array(audio, block=READ_BLOCK_FRAMES):
+    for i in range(0, len(audio), block):
+        # copy out of a memmap so pages can be dropped behind us
+        yield np.array(audio[i:i + block], dtype=np.float32)
+
+
+# -------------------------------------------------
+# Batched inference
+# -------------------------------------------------
+def transcribe_chunks(chunks, sr=16000, batch_size=None, stats=None, on_text=None, engine=None):
+    """
+    Run audio chunks through whisper `batch_size` at a time.
+    Returns the texts in chunk order.
+    If `stats` is a dict it is filled with chunks / audio seconds /
+    elapsed seconds / chunks_per_sec for sizing batches per host.
+    `on_text(text)` is called for each chunk as soon as its batch
+    is decoded.
+    """
+
+    batch_size = max(1, batch_size or DEFAULT_BATCH_SIZE)
+    asr = get_asr(engine)
+
+    texts = []
+    batch = []
+    audio_seconds = 0.0
+    start = time.perf_counter()
+
+    def flush():
+        results = asr.transcribe_batch(batch, sr)
+        batch.clear()
+
+        for text in results:
+            texts.append(text)
+            if on_text is not None:
+                on_text(text)
+
+    for chunk in chunks:
+        audio_seconds += len(chunk) / sr
+        batch.append(chunk)
+
+        if len(batch) == batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    if stats is not None:
+        elapsed = time.perf_counter() - start
+        stats.update({
+            "chunks": len(texts),
+            "batch_size": batch_size,
+            "audio_seconds": audio_seconds,
+            "elapsed_seconds": elapsed,
+            "chunks_per_sec": len(texts) / elapsed if elapsed > 0 else 0.0,
+        })
+
+    return texts
+
+
+# -------------------------------------------------
+# Sharded multi-process transcription
+# -------------------------------------------------
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _init_worker(threads, engine=None):
+    # pin torch's intra-op pool before torch is imported, then load once
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    os.environ["MKL_NUM_THREADS"] = str(threads)
+
+    import torch
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+
+    get_asr(engine)
+
+
+def _transcribe_shard(chunks, batch_size, engine=None):
+    return transcribe_chunks(chunks, 16000, batch_size=batch_size, engine=engine)
+
+
+def get_pool(workers=None, threads_per_worker=None, engine=None):
+    """
+    Process pool whose workers each hold one whisper model.
+    Pools are cached per (workers, threads, engine) so models load once.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    key = (
+        workers or DEFAULT_WORKERS,
+        threads_per_worker or DEFAULT_THREADS_PER_WORKER,
+        resolve_engine(engine),
+    )
+
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ProcessPoolExecutor(
+                max_workers=key[0],
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(key[1], key[2])
+            )
+
+        return _pools[key]
+
+
+def shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(cancel_futures=True)
+        _pools.clear()
+
+
+def _shards(chunks, size):
+    shard = []
+
+    for chunk in chunks:
+        shard.append(chunk)
+        if len(shard) == size:
+            yield shard
+            shard = []
+
+    if shard:
+        yield shard
+
+
+def transcribe_parallel(
+    path: str,
+    workers=None,
+    threads_per_worker=None,
+    batch_size=None,
+    stats=None,
+    vad=True,
+    engine=None
+) -> str:
+    """
+    Split a long recording into speech-aligned shards (VAD chunks,
+    SHARD_CHUNKS per shard) and transcribe them on a process pool.
+    At most 2 shards per worker are in flight, so memory stays
+    bounded; text is stitched back in recording order.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    if stats is None:
+        stats = {}
+
+    workers = workers or DEFAULT_WORKERS
+    pool = get_pool(workers, threads_per_worker, engine)
+
+    start = time.perf_counter()
+    futures = []
+    pending = set()
+    samples = 0
+
+    chunks = stream_chunks(path, 16000, 25, vad=vad, stats=stats)
+
+    for shard in _shards(chunks, SHARD_CHUNKS):
+        if len(pending) >= 2 * workers:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        future = pool.submit(_transcribe_shard, shard, batch_size, engine)
+        futures.append(future)
+        pending.add(future)
+        samples += sum(len(c) for c in shard)
+
+    texts = []
+    for future in futures:
+        texts.extend(future.result())
+
+    elapsed = time.perf_counter() - start
+    audio_seconds = samples / 16000
+    recording_seconds = stats.get("input_seconds", audio_seconds)
+
+    stats.update({
+        "shards": len(futures),
+        "workers": workers,
+        "chunks": len(texts),
+        "audio_seconds": audio_seconds,
+        "elapsed_seconds": elapsed,
+        "realtime_factor": elapsed / recording_seconds if recording_seconds else 0.0,
+    })
+
+    metrics.observe("transcribe_parallel", elapsed)
+    record_audio_metrics(stats)
+
+    return " ".join(texts)
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+class ReadProgress:
+    """
+    Counts the 16 kHz samples pulled from a block stream, so
+    partial text can be reported against the recording length.
+    """
+
+    def __init__(self, blocks, total):
+        self._it = iter(blocks)
+        self.total = total
+        self.done = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        block = next(self._it)
+        self.done += len(block)
+        return block
+
+    def seconds(self, sr=16000):
+        return self.done / sr
+
+    def percent(self):
+        return min(100.0, 100.0 * self.done / self.total) if self.total else 0.0
+
+
+def record_audio_metrics(stats):
+    if not metrics.ENABLED or not stats.get("audio_seconds"):
+        return
+
+    metrics.AUDIO_SECONDS.inc(stats.get("input_seconds", stats["audio_seconds"]))
+    metrics.SPEECH_SECONDS.inc(stats["audio_seconds"])
+    metrics.REALTIME_FACTOR.observe(
+        stats["elapsed_seconds"] / stats.get("input_seconds", stats["audio_seconds"])
+    )
+
+
+def transcribe_audio(
+    path: str,
+    batch_size=None,
+    stats=None,
+    vad=True,
+    cache=None,
+    on_progress=None,
+    engine=None,
+    parallel=None
+) -> str:
+    """
+    Streamlit-Cloud safe:
+    ✔ no torchaudio
+    ✔ WAV (any width) / FLAC / OGG via soundfile,
+      ffmpeg only for the rest (mp3, m4a ...)
+    ✔ numpy resampling
+    ✔ better accuracy
+    ✔ silence skipped (vad=True) — fewer hallucinations
+    ✔ cache (Backend.cache.TranscriptCache) skips repeat uploads
+    ✔ `path` may be a file path or an in-memory binary file
+    ✔ on_progress(text, seconds_read, percent) per decoded chunk
+    ✔ engine: a name from ENGINES (default DEFAULT_ENGINE)
+    ✔ parallel: shard across worker processes (transcribe_parallel);
+      default: recordings of PARALLEL_SECONDS or more
+    """
+    if stats is None:
+        stats = {}
+
+    engine = resolve_engine(engine)
+    stats["engine"] = engine
+
+    # -------- cache lookup --------
+    audio_key = cached = None
+
+    if cache is not None:
+        audio_key = hash_file(path)
+        cache_key = cache.key(audio_key, engine_id(engine), f"vad={vad}")
+
+        text = cache.get_transcript(cache_key)
+        stats["cache"] = "hit" if text is not None else "miss"
+        metrics.inc(metrics.CACHE_LOOKUPS, 1, stats["cache"])
+
+        if text is not None:
+            if on_progress is not None:
+                on_progress(text, resampled_length(path) / 16000, 100.0)
+            return text
+
+        cached = cache.get_audio(audio_key) if cache.store_audio else None
+
+    if parallel is None:
+        parallel = use_parallel(path)
+
+    if parallel:
+        # -------- long recording: shards on the process pool --------
+        text = transcribe_parallel(path, batch_size=batch_size, stats=stats, vad=vad, engine=engine)
+
+        if on_progress is not None:
+            on_progress(text, stats.get("input_seconds", stats["audio_seconds"]), 100.0)
+    else:
+        text = _transcribe_stream(path, cache, audio_key, cached, batch_size, stats, vad, on_progress, engine)
+
+    # -------- what skipping silence saved --------
+    if vad and stats.get("audio_seconds"):
+        skipped = stats["input_seconds"] - stats["speech_seconds"]
+        stats["skipped_seconds"] = skipped
+        stats["asr_seconds_saved"] = skipped * stats["elapsed_seconds"] / stats["audio_seconds"]
+
+    if cache is not None:
+        cache.put_transcript(cache_key, text, model=engine_id(engine), vad=vad)
+
+    return text
+
+
+def use_parallel(path):
+    """
+    Whether transcribe_audio shards `path` across processes by
+    default: it is at least PARALLEL_SECONDS long (0 = never) and
+    there is more than one worker.
+    """
+    if PARALLEL_SECONDS <= 0 or DEFAULT_WORKERS < 2:
+        return False
+    return resampled_length(path) >= PARALLEL_SECONDS * 16000
+
+
+def _transcribe_stream(path, cache, audio_key, cached, batch_size, stats, vad, on_progress, engine):
+    # in-process path: decode → chunks → ASR, streamed
+    if cached is not None:
+        blocks = iter_array(cached)
+    elif cache is not None and cache.store_audio and resampled_length(path):
+        blocks = cache.tee_audio(audio_key, stream_audio(path), resampled_length(path))
+    else:
+        blocks = stream_audio(path)
+
+    # -------- partial results --------
+    if on_progress is not None:
+        total = len(cached) if cached is not None else resampled_length(path)
+        blocks = ReadProgress(blocks, total)
+
+        def on_text(text):
+            on_progress(text, blocks.seconds(), blocks.percent())
+    else:
+        on_text = None
+
+    # -------- read → mono → 16k → speech chunks, streamed --------
+    # decode runs lazily inside the ASR loop; TimedIter splits the two
+    chunks = metrics.TimedIter(chunk_blocks(blocks, 16000, 25, vad=vad, stats=stats))
+
+    with metrics.span("transcribe"):
+        texts = transcribe_chunks(
+            chunks, 16000, batch_size=batch_size, stats=stats, on_text=on_text, engine=engine
+        )
+
+    metrics.observe("decode", chunks.seconds)
+    metrics.observe("asr", stats["elapsed_seconds"] - chunks.seconds)
+    record_audio_metrics(stats)
+
+    return " ".join(texts)
@@ -1,83 +1,262 @@
-import re
-
-
-def extract_actions(text: str):
-    """
-    Returns structured action items:
-    [
-      {"task": "...", "owner": "..."}
-    ]
-    """
-
-    actions = []
-
-    action_keywords = [
-        " will ",
-        " must ",
-        " by ",
-        " start", " starts",
-        " prepare", " prepares",
-        " draft", " drafts",
-        " deliver", " delivers",
-        " escalate",
-        " action item",
-    ]
-
-    for line in text.split("\n"):
-        sentence = line.strip()
-
-        if not sentence:
-            continue
-
-        lower = sentence.lower()
-
-        # ---------- Step 1: detect action ----------
-        if not any(k in lower for k in action_keywords):
-            continue
-
-        original = sentence
-
-        # ---------- Step 2: remove speaker label ----------
-        if ":" in sentence:
-            sentence = sentence.split(":", 1)[1].strip()
-
-        # ---------- Step 3: extract owner ----------
-        owner = ""
-
-        # Pattern 1 → "Rahul will prepare..."
-        m = re.match(r"^([A-Z][a-zA-Z]+)\s+(will|must|to|can|should|starts?|prepares?|drafts?|delivers?)", sentence)
-        if m:
-            owner = m.group(1)
-
-        # Pattern 2 → "Meera, can you draft..."
-        if not owner:
-            m = re.match(r"^([A-Z][a-zA-Z]+),", sentence)
-            if m:
-                owner = m.group(1)
-
-        # Pattern 3 → "Arjun’s team..."
-        if not owner:
-            m = re.match(r"^([A-Z][a-zA-Z]+)['’]s", sentence)
-            if m:
-                owner = m.group(1)
-
-        if not owner:
-            owner = "Unassigned"
-
-        # ---------- Step 4: clean task ----------
-        task = sentence
-
-        # remove "Action item:"
-        task = re.sub(r"(?i)action item[:\-]?", "", task)
-
-        # remove owner name at start
-        task = re.sub(rf"^{owner}\b[,:\s]*", "", task)
-
-        task = task.strip()
-
-        actions.append({
-            "task": task,
-            "owner": owner
-        })
-
-    return actions
+import re
+from functools import lru_cache
+
+from Backend.deadlines import parse_deadline
+from Backend.F_llm import ACTION, get_rules
+
+
+# =========================================================
+# Action-item engine
+# One compiled trigger scan finds candidate lines for every
+# rule set; only those lines are parsed, and each action gets
+# task, owner and a normalized deadline.
+#   SPEAKER → "Name: I will ..."     (B_speaker)
+#   LINE    → keyword lines          (C_action.extract_actions)
+#   KEYWORD → meeting-type rules     (F_llm.generate_insights,
+#                                     InsightSession, extract_actions)
+# =========================================================
+SPEAKER = "speaker"
+LINE = "line"
+KEYWORD = "keyword"
+
+PROFILES = (SPEAKER, LINE, KEYWORD)
+
+SPEAKER_TRIGGERS = [
+    "i will", "i'll", "i can", "let me",
+    "i plan to", "i shall", "i am going to"
+]
+
+LINE_KEYWORDS = [
+    " will ",
+    " must ",
+    " by ",
+    " start", " starts",
+    " prepare", " prepares",
+    " draft", " drafts",
+    " deliver", " delivers",
+    " escalate",
+    " action item",
+]
+
+SPEAKER_RE = re.compile(r"(\w+):\s(.+)")
+
+# "Rahul will prepare..." / "Meera, can you..." / "Arjun’s team..."
+OWNER_RE = re.compile(
+    r"^([A-Z][a-zA-Z]+)"
+    r"(?:\s+(?:will|must|to|can|should|starts?|prepares?|drafts?|delivers?)|,|['’]s)"
+)
+
+# keyword rules: a capitalized first word is the owner
+RULE_OWNER_RE = re.compile(r"^([A-Z][a-z]+)")
+
+ACTION_LABEL_RE = re.compile(r"(?i)action item[:\-]?")
+LEADING_NAME_RE = re.compile(r"^([A-Z][a-zA-Z]+)\b[,:\s]*")
+
+# keyword-rule actions kept per text
+MAX_KEYWORD_ACTIONS = 10
+
+
+def _alternation(literals):
+    literals = sorted({l.lower() for l in literals}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(l) for l in literals))
+
+
+def _prefilter(literals):
+    """
+    Alternation that matches every line any of `literals` matches,
+    reduced to the fewest, space-trimmed words: a leading space or
+    a long alternative makes the regex try far more positions.
+    """
+    words = {l.strip().lower() for l in literals}
+    words = [w for w in words if not any(o != w and o in w for o in words)]
+    return _alternation(words)
+
+
+class ActionEngine:
+    """
+    Action extraction for one meeting type's keyword rules.
+    """
+
+    def __init__(self, meeting_type="discussion"):
+        self.rules = get_rules(meeting_type)
+
+        self.speaker_re = _alternation(SPEAKER_TRIGGERS)
+        self.line_re = _alternation(LINE_KEYWORDS)
+
+        self.triggers = {
+            SPEAKER: SPEAKER_TRIGGERS,
+            LINE: LINE_KEYWORDS,
+            KEYWORD: self.rules.action_keywords,
+        }
+        self._candidate_res = {}
+
+    def candidate_re(self, profiles):
+        """
+        Any trigger of the given rule sets; lines without one are skipped.
+        """
+        key = frozenset(profiles)
+
+        if key not in self._candidate_res:
+            self._candidate_res[key] = _prefilter(
+                [t for p in PROFILES if p in key for t in self.triggers[p]]
+            )
+
+        return self._candidate_res[key]
+
+    # -----------------------------------------------------
+    # per-line rules
+    # -----------------------------------------------------
+    def _speaker(self, line, reference=None):
+        if ":" not in line:
+            return None
+
+        m = SPEAKER_RE.search(line)
+        if m and self.speaker_re.search(m.group(2).lower()):
+            task = m.group(2).strip()
+            return {
+                "task": task,
+                "owner": m.group(1),
+                "deadline": parse_deadline(task, reference)
+            }
+
+        return None
+
+    def _line(self, line, lower, reference=None):
+        sentence = line.strip()
+
+        if not sentence or not self.line_re.search(lower.strip()):
+            return None
+
+        # remove speaker label
+        if ":" in sentence:
+            sentence = sentence.split(":", 1)[1].strip()
+
+        m = OWNER_RE.match(sentence)
+        owner = m.group(1) if m else "Unassigned"
+
+        task = ACTION_LABEL_RE.sub("", sentence)
+
+        # remove owner name at start
+        m = LEADING_NAME_RE.match(task)
+        if m and m.group(1) == owner:
+            task = task[m.end():]
+
+        task = task.strip()
+        return {
+            "task": task,
+            "owner": owner,
+            "deadline": parse_deadline(task, reference)
+        }
+
+    def _keyword(self, line, reference=None):
+        line = line.strip()
+        if len(line) < 15:
+            return None
+
+        m = self.rules.action_re.search(line)
+        if not m:
+            return None
+
+        task = m.group(1)
+
+        # detect owner
+        m = RULE_OWNER_RE.match(line)
+        owner = m.group(1) if m else "Unassigned"
+
+        return {
+            "task": task.strip(),
+            "owner": owner,
+            "deadline": parse_deadline(task, reference)
+        }
+
+    def _tagged(self, line):
+        # same ACTION tag generate_insights filters on (re.I in
+        # action_re alone also folds e.g. "ſ" to "s")
+        return any(flags & ACTION for _, flags in self.rules.matcher.scan(line))
+
+    # -----------------------------------------------------
+    # one pass
+    # -----------------------------------------------------
+    def _candidates(self, text, profiles):
+        """
+        Yield (line, lowered line) for lines containing a trigger.
+        """
+        search = self.candidate_re(profiles).search
+        lower = text.lower()
+
+        # lower() changed some lengths (rare unicode): check every line
+        if len(lower) != len(text):
+            for line in text.split("\n"):
+                if search(line.lower()):
+                    yield line, line.lower()
+            return
+
+        pos = 0
+
+        while True:
+            m = search(lower, pos)
+            if m is None:
+                return
+
+            start = lower.rfind("\n", 0, m.start()) + 1
+            end = lower.find("\n", m.end())
+            if end == -1:
+                end = len(lower)
+
+            yield text[start:end], lower[start:end]
+            pos = end + 1
+
+    def extract(self, text, profiles=PROFILES, reference=None):
+        """
+        {profile: [{"task", "owner", "deadline"}]} from one scan.
+        """
+        out = {p: [] for p in profiles}
+
+        speaker = out.get(SPEAKER)
+        line_actions = out.get(LINE)
+        keyword = out.get(KEYWORD)
+
+        for line, lower in self._candidates(text, profiles):
+            if speaker is not None:
+                action = self._speaker(line, reference)
+                if action:
+                    speaker.append(action)
+
+            if line_actions is not None:
+                action = self._line(line, lower, reference)
+                if action:
+                    line_actions.append(action)
+
+            if keyword is not None and len(keyword) < MAX_KEYWORD_ACTIONS:
+                action = self._keyword(line, reference)
+                if action and self._tagged(line):
+                    keyword.append(action)
+
+                # cap noise — stop early if nothing else is collected
+                if len(keyword) == MAX_KEYWORD_ACTIONS and len(out) == 1:
+                    break
+
+        return out
+
+
+@lru_cache(maxsize=None)
+def get_engine(meeting_type="discussion"):
+    # cached with get_rules: clear both after changing MEETING_KEYWORDS
+    return ActionEngine(meeting_type)
+
+
+def extract_actions(text: str, reference=None):
+    """
+    Returns structured action items:
+    [
+      {"task": "...", "owner": "...", "deadline": "YYYY-MM-DD" | ""}
+    ]
+    """
+    return get_engine().extract(text, (LINE,), reference)[LINE]
+
+
+def extract_all_actions(text, meeting_type="discussion", reference=None):
+    """
+    Speaker, line and keyword-rule actions in one pass.
+    """
+    return get_engine(meeting_type).extract(text, PROFILES, reference)
@@ -1,84 +1,179 @@
-# =========================================================
-# Professional PDF Export
-# =========================================================
-
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    ListFlowable,
-    ListItem
-)
-from reportlab.lib.styles import getSampleStyleSheet
-
-
-def generate_pdf(data, filename, title="Meeting Report"):
-
-    doc = SimpleDocTemplate(filename)
-    styles = getSampleStyleSheet()
-
-    elements = []
-
-    # -----------------------------------------------------
-    # helpers
-    # -----------------------------------------------------
-    def heading(text):
-        elements.append(Spacer(1, 18))
-        elements.append(Paragraph(text, styles["Heading1"]))
-
-    def bullets(items):
-        if not items:
-            elements.append(Paragraph("None", styles["BodyText"]))
-            return
-
-        lst = []
-        for x in items:
-            lst.append(ListItem(Paragraph(str(x), styles["BodyText"])))
-
-        elements.append(ListFlowable(lst, bulletType="bullet"))
-
-    # -----------------------------------------------------
-    # Title
-    # -----------------------------------------------------
-    elements.append(Paragraph(title, styles["Title"]))
-    elements.append(Spacer(1, 20))
-
-    # -----------------------------------------------------
-    # Summary
-    # -----------------------------------------------------
-    heading("Summary")
-    elements.append(Paragraph(data["summary"], styles["BodyText"]))
-
-    # -----------------------------------------------------
-    # Key Points
-    # -----------------------------------------------------
-    heading("Key Points")
-    bullets(data["key_points"])
-
-    # -----------------------------------------------------
-    # Decisions
-    # -----------------------------------------------------
-    heading("Decisions")
-    bullets(data["decisions"])
-
-    # -----------------------------------------------------
-    # Action Items
-    # -----------------------------------------------------
-    heading("Action Items")
-
-    actions = []
-
-    for a in data["action_items"]:
-        line = a["task"]
-
-        if a.get("owner"):
-            line += f" — {a['owner']}"
-
-        if a.get("deadline"):
-            line += f" ({a['deadline']})"
-
-        actions.append(line)
-
-    bullets(actions)
-
-    doc.build(elements)
+# =========================================================
+# Professional PDF Export
+# styles built once per process; reports render to memory,
+# one at a time or many per call (separate or combined)
+# =========================================================
+
+import io
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.platypus import (
+    SimpleDocTemplate,
+    Paragraph,
+    Spacer,
+    PageBreak
+)
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+from Backend import metrics
+
+
+# =========================================================
+# Template (built once, shared by every report)
+# =========================================================
+class ReportTemplate:
+    """
+    Paragraph styles for a report. Flowables themselves are
+    stateful during layout, so only styles are shared.
+    """
+
+    def __init__(self):
+        styles = getSampleStyleSheet()
+
+        self.title = styles["Title"]
+        self.heading = styles["Heading1"]
+        self.body = styles["BodyText"]
+
+        # a bulleted paragraph lays out ~2x faster than a ListFlowable
+        self.bullet = ParagraphStyle(
+            "ReportBullet",
+            parent=self.body,
+            leftIndent=18,
+            bulletIndent=6,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_template():
+    return ReportTemplate()
+
+
+def _para(text, style, **kw):
+    # report text is plain text, not reportlab markup
+    return Paragraph(escape(str(text)), style, **kw)
+
+
+def action_line(a):
+    line = a["task"]
+
+    if a.get("owner"):
+        line += f" — {a['owner']}"
+
+    if a.get("deadline"):
+        line += f" ({a['deadline']})"
+
+    return line
+
+
+def report_flowables(data, title="Meeting Report", template=None):
+    """
+    Flowables for one report (also used to stack several
+    reports into one document).
+    """
+    t = template or get_template()
+    elements = []
+
+    # -----------------------------------------------------
+    # helpers
+    # -----------------------------------------------------
+    def heading(text):
+        elements.append(Spacer(1, 18))
+        elements.append(Paragraph(text, t.heading))
+
+    def bullets(items):
+        if not items:
+            elements.append(Paragraph("None", t.body))
+            return
+
+        for x in items:
+            elements.append(_para(x, t.bullet, bulletText="•"))
+
+    # -----------------------------------------------------
+    # Title
+    # -----------------------------------------------------
+    elements.append(_para(title, t.title))
+    elements.append(Spacer(1, 20))
+
+    # -----------------------------------------------------
+    # Summary
+    # -----------------------------------------------------
+    heading("Summary")
+    elements.append(_para(data["summary"], t.body))
+
+    # -----------------------------------------------------
+    # Key Points
+    # -----------------------------------------------------
+    heading("Key Points")
+    bullets(data["key_points"])
+
+    # -----------------------------------------------------
+    # Decisions
+    # -----------------------------------------------------
+    heading("Decisions")
+    bullets(data["decisions"])
+
+    # -----------------------------------------------------
+    # Action Items
+    # -----------------------------------------------------
+    heading("Action Items")
+    bullets([action_line(a) for a in data["action_items"]])
+
+    return elements
+
+
+# =========================================================
+# Rendering
+# =========================================================
+def generate_pdf(data, filename, title="Meeting Report"):
+    """
+    `filename` is a path or a writable binary file object.
+    """
+    doc = SimpleDocTemplate(filename)
+    elements = report_flowables(data, title)
+
+    with metrics.span("pdf"):
+        doc.build(elements)
+
+
+def render_pdf(data, title="Meeting Report"):
+    """
+    Render the report into memory and return the PDF bytes.
+    """
+    buf = io.BytesIO()
+    generate_pdf(data, buf, title)
+    return buf.getvalue()
+
+
+def _titled(reports):
+    for r in reports:
+        if isinstance(r, dict):
+            yield r, "Meeting Report"
+        else:
+            yield r
+
+
+def render_pdfs(reports, combined=False):
+    """
+    Many reports in one call. `reports` holds insight dicts or
+    (insights, title) pairs.
+    combined=False → [pdf bytes] in order
+    combined=True  → one PDF, each report starting a new page
+    """
+    if not combined:
+        return [render_pdf(data, title) for data, title in _titled(reports)]
+
+    elements = []
+
+    for data, title in _titled(reports):
+        if elements:
+            elements.append(PageBreak())
+        elements.extend(report_flowables(data, title))
+
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf)
+
+    with metrics.span("pdf_batch"):
+        doc.build(elements)
+
+    return buf.getvalue()
@@ -1,16 +1,363 @@
-import sounddevice as sd
-import scipy.io.wavfile as wav
-import whisper
-
-model = whisper.load_model("base")
-
-def record_and_transcribe(seconds=10):
-
-    fs = 16000
-    recording = sd.rec(int(seconds * fs), samplerate=fs, channels=1)
-    sd.wait()
-
-    wav.write("live.wav", fs, recording)
-
-    result = model.transcribe("live.wav")
-    return result["text"]
+# =========================================================
+# Backend/E_live_capture.py
+# Live transcription: ring buffer fed by an input stream,
+# overlapping windows transcribed as they fill, partial text
+# emitted with stable-prefix deduplication. No temp files.
+# =========================================================
+
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+SR = 16000
+
+# defaults to the file pipeline's engine, so both share one model
+LIVE_ENGINE = os.environ.get("LIVE_ASR_ENGINE") or None
+
+
+def get_model(engine=None):
+    # the process-wide engine from A_STT, loaded on first use
+    # so importing this module stays cheap
+    from Backend.A_STT import get_asr
+
+    return get_asr(engine or LIVE_ENGINE)
+
+
+def whisper_transcribe(audio, engine=None):
+    return get_model(engine).transcribe(audio, SR)
+
+
+def record_and_transcribe(seconds=10):
+    import sounddevice as sd
+
+    fs = SR
+    recording = sd.rec(int(seconds * fs), samplerate=fs, channels=1, dtype="float32")
+    sd.wait()
+
+    return whisper_transcribe(recording[:, 0])
+
+
+# =========================================================
+# Ring buffer
+# =========================================================
+class RingBuffer:
+    """
+    Fixed-size float32 circular buffer. Writers (audio callback)
+    and the reader (transcriber) share it under one condition;
+    `written` counts every sample ever pushed.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=np.float32)
+        self.written = 0
+        self.last_write = 0.0       # monotonic time of the newest sample
+        self.cond = threading.Condition()
+
+    def write(self, block):
+        block = np.asarray(block, dtype=np.float32)[-self.capacity:]
+        n = len(block)
+
+        with self.cond:
+            start = self.written % self.capacity
+            first = min(n, self.capacity - start)
+
+            self.data[start:start + first] = block[:first]
+            self.data[:n - first] = block[first:]
+
+            self.written += n
+            self.last_write = time.monotonic()
+            self.cond.notify_all()
+
+    def latest(self, n):
+        """
+        Copy of the newest `n` samples (fewer if not yet written).
+        """
+        with self.cond:
+            n = min(n, self.written, self.capacity)
+            end = self.written % self.capacity
+            idx = np.arange(end - n, end) % self.capacity
+            return self.data[idx]
+
+    def read(self, start, end):
+        """
+        Copy of samples [start, end) by absolute position, clipped
+        to what is still held (`end` <= written).
+        """
+        with self.cond:
+            start = max(start, 0, self.written - self.capacity)
+            idx = np.arange(start, end) % self.capacity
+            return self.data[idx]
+
+    def wake(self):
+        """
+        Wake waiting readers without new audio (source finished).
+        """
+        with self.cond:
+            self.cond.notify_all()
+
+
+# =========================================================
+# Audio sources: start(callback, on_finish) / stop() / finished
+# =========================================================
+class AudioSource:
+    """
+    `finished` is set once no more audio will come; `on_finish`
+    (given to start) is then called so readers need not poll.
+    """
+
+    def __init__(self):
+        self.finished = threading.Event()
+        self._on_finish = None
+
+    def _finish(self):
+        if self.finished.is_set():
+            return
+        self.finished.set()
+        if self._on_finish is not None:
+            self._on_finish()
+
+
+class MicSource(AudioSource):
+
+    def __init__(self, block_ms=100):
+        super().__init__()
+        self.blocksize = SR * block_ms // 1000
+        self._stream = None
+
+    def start(self, callback, on_finish=None):
+        import sounddevice as sd
+
+        self._on_finish = on_finish
+
+        def on_audio(indata, frames, t, status):
+            callback(indata[:, 0].copy())
+
+        self._stream = sd.InputStream(
+            samplerate=SR,
+            channels=1,
+            dtype="float32",
+            blocksize=self.blocksize,
+            callback=on_audio
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+        self._finish()
+
+
+class WavReplaySource(AudioSource):
+    """
+    Replays a WAV file at real-time speed (or `speed`x) from a
+    thread, as if it were a microphone — for tests and latency runs.
+    """
+
+    def __init__(self, path, block_ms=100, speed=1.0):
+        super().__init__()
+        self.path = path
+        self.blocksize = SR * block_ms // 1000
+        self.speed = speed
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, callback, on_finish=None):
+        self._on_finish = on_finish
+        self._thread = threading.Thread(target=self._run, args=(callback,), daemon=True)
+        self._thread.start()
+
+    def _run(self, callback):
+        from Backend.A_STT import rechunk, stream_audio
+
+        t0 = time.monotonic()
+        pos = 0
+
+        for block in rechunk(stream_audio(self.path, SR), self.blocksize):
+            if self._stop.is_set():
+                break
+
+            pos += len(block)
+            delay = t0 + pos / SR / self.speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            callback(block)
+
+        self._finish()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._finish()
+
+
+# =========================================================
+# Stable-prefix merging of overlapping window hypotheses
+# =========================================================
+def _norm(word):
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _overlap(committed, words, max_words=12):
+    """
+    Index in `words` just past the longest run that repeats the end
+    of `committed` (the part of the new window we already emitted).
+    """
+    tail = [_norm(w) for w in committed[-max_words:]]
+    norm = [_norm(w) for w in words]
+
+    for k in range(min(len(tail), len(norm)), 0, -1):
+        suffix = tail[-k:]
+        for i in range(0, len(norm) - k + 1):
+            if norm[i:i + k] == suffix:
+                return i + k
+
+    return 0
+
+
+def _common_prefix(a, b):
+    n = 0
+    for x, y in zip(a, b):
+        if _norm(x) != _norm(y):
+            break
+        n += 1
+    return n
+
+
+class LiveTranscriber:
+    """
+    Every `step_seconds` of new audio, transcribe the newest
+    `window_seconds`. Words past what was already committed are
+    committed once two consecutive windows agree on them; the rest
+    is reported as the (unstable) partial.
+
+    Windows never end more than half a window past the previous
+    one: when inference falls behind, it catches up through the
+    backlog instead of skipping it, and when the source finishes
+    the whole unprocessed span is flushed. Only audio older than
+    `max_lag_seconds` is lost (counted in `dropped_seconds`).
+
+    Each event: {"text": newly committed words, "partial": ...,
+                 "latency": seconds from capture of the window's
+                 newest sample to this event}
+    """
+
+    def __init__(self, source, window_seconds=6.0, step_seconds=1.0, transcribe=None, engine=None,
+                 max_lag_seconds=60.0):
+        self.source = source
+        self.window = int(window_seconds * SR)
+        self.step = int(step_seconds * SR)
+        self.hop = max(self.step, self.window // 2)
+        self.transcribe = transcribe or (lambda audio: whisper_transcribe(audio, engine))
+
+        self.buffer = RingBuffer(self.window + int(max_lag_seconds * SR))
+        self.committed = []
+        self.latencies = []
+        self.dropped_seconds = 0.0
+
+        self._pending = []      # uncommitted words from the last window
+
+    def _update(self, audio, captured_at, final=False):
+        words = self.transcribe(audio).split()
+        fresh = words[_overlap(self.committed, words):]
+
+        if final:
+            stable = len(fresh)
+        else:
+            stable = _common_prefix(self._pending, fresh)
+
+        new = fresh[:stable]
+        self._pending = fresh[stable:]
+        self.committed.extend(new)
+
+        latency = time.monotonic() - captured_at
+        self.latencies.append(latency)
+
+        return {
+            "text": " ".join(new),
+            "partial": " ".join(self._pending),
+            "latency": latency,
+        }
+
+    def _catch_up(self, seen, written):
+        # audio the ring buffer no longer holds cannot be transcribed
+        oldest = written - self.buffer.capacity
+        if seen < oldest:
+            self.dropped_seconds += (oldest - seen) / SR
+            return oldest
+        return seen
+
+    def _window_update(self, end, written, last_write, final=False):
+        # the window's newest sample was captured (written - end) samples before the last write
+        audio = self.buffer.read(end - self.window, end)
+        return self._update(audio, last_write - (written - end) / SR, final)
+
+    def stream(self):
+        """
+        Generator of events until the source finishes.
+        """
+        self.source.start(self.buffer.write, self.buffer.wake)
+        seen = 0
+
+        try:
+            while True:
+                with self.buffer.cond:
+                    self.buffer.cond.wait_for(
+                        lambda: self.buffer.written - seen >= self.step or self.source.finished.is_set(),
+                        timeout=1.0
+                    )
+                    written = self.buffer.written
+                    last_write = self.buffer.last_write
+
+                if self.source.finished.is_set():
+                    break
+
+                if written - seen < self.step:
+                    continue
+
+                # the newest window, or one hop on if inference fell behind
+                seen = self._catch_up(seen, written)
+                end = min(written, seen + self.hop)
+                seen = end
+                yield self._window_update(end, written, last_write)
+
+            # flush everything not yet transcribed, hop by hop
+            with self.buffer.cond:
+                written = self.buffer.written
+                last_write = self.buffer.last_write
+
+            if written > seen or self._pending:
+                seen = self._catch_up(seen, written)
+                for end in list(range(seen + self.hop, written, self.hop)) + [written]:
+                    yield self._window_update(end, written, last_write, final=end == written)
+        finally:
+            self.source.stop()
+
+    def run(self, on_text):
+        """
+        Callback flavour of `stream`; returns the full transcript.
+        """
+        for event in self.stream():
+            on_text(event)
+        return self.text()
+
+    def text(self):
+        return " ".join(self.committed)
+
+    def latency_stats(self):
+        if not self.latencies:
+            return {}
+
+        lat = np.array(self.latencies)
+        return {
+            "windows": len(lat),
+            "mean": float(lat.mean()),
+            "p95": float(np.percentile(lat, 95)),
+            "max": float(lat.max()),
+        }
@@ -1,202 +1,644 @@
-# =========================================================
-# Backend/F_llm.py
-# Production-grade Meeting Insight Engine
-# No external LLM / No heavy dependencies
-# Uses: nltk + sumy + regex only
-# =========================================================
-
-import re
-import nltk
-nltk.download('punkt')
-nltk.download('punkt_tab')
-
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.lsa import LsaSummarizer
-
-
-# ---------------------------------------------------------
-# Download once (safe if already present)
-# ---------------------------------------------------------
-nltk.download("punkt", quiet=True)
-
-
-# =========================================================
-# TEXT NORMALIZATION
-# Fix Whisper output + improves all downstream quality
-# =========================================================
-def normalize_text(text: str) -> str:
-    sentences = nltk.sent_tokenize(text)
-
-    clean = []
-
-    for s in sentences:
-        s = s.strip()
-
-        # remove filler noise
-        s = re.sub(r"\b(um|uh|you know|like|basically|okay)\b", "", s, flags=re.I)
-
-        if len(s) > 10:
-            clean.append(s)
-
-    # remove duplicates while preserving order
-    return "\n".join(dict.fromkeys(clean))
-
-
-# =========================================================
-# SUMMARY (LSA extractive — fast + stable)
-# =========================================================
-def summarize(text, sentences=4):
-    """
-    Cleaner extractive summary.
-    Removes very short/noisy lines first.
-    """
-
-    # remove short lines + noise
-    cleaned = "\n".join(
-        l.strip() for l in text.split("\n")
-        if len(l.strip()) > 30
-    )
-
-    parser = PlaintextParser.from_string(cleaned, Tokenizer("english"))
-    summarizer = LsaSummarizer()
-
-    summary = summarizer(parser.document, sentences)
-
-    result = " ".join(str(s) for s in summary)
-
-    # fallback safety
-    if len(result) < 40:
-        return cleaned[:400]
-
-    return result
-
-
-# =========================================================
-# KEY POINTS
-# =========================================================
-def extract_key_points(text):
-    seen = set()
-    points = []
-
-    for l in text.split("\n"):
-        l = l.strip()
-        if len(l) > 40 and l not in seen:
-            points.append(l)
-            seen.add(l)
-
-    return points[:6]
-
-
-
-# =========================================================
-# DECISIONS
-# =========================================================
-def extract_decisions(text: str):
-    decision_keywords = [
-        "decided",
-        "agreed",
-        "approved",
-        "confirmed",
-        "finalized",
-        "selected",
-        "deadline",
-        "must deliver",
-    ]
-
-    results = []
-
-    for l in text.split("\n"):
-        lower = l.lower()
-        if any(k in lower for k in decision_keywords):
-            results.append(l.strip())
-
-    return results
-
-
-# =========================================================
-# ACTION ITEMS (structured)
-# returns:
-# [{"task": "...", "owner": "...", "deadline": "..."}]
-# =========================================================
-def extract_actions(text):
-    actions = []
-
-    pattern = r"""
-        ^(?:[A-Z][a-z]+)?      # optional owner
-        [,:]?\s*
-        (.*?\b(?:will|must|should|please|by|prepare|send|deliver|update|start)\b.*)
-    """
-
-    for line in text.split("\n"):
-        line = line.strip()
-        if len(line) < 15:
-            continue
-
-        m = re.search(pattern, line, re.IGNORECASE | re.VERBOSE)
-        if not m:
-            continue
-
-        task = m.group(1)
-
-        # detect owner
-        owner_match = re.match(r"^([A-Z][a-z]+)", line)
-        owner = owner_match.group(1) if owner_match else "Unassigned"
-
-        actions.append({
-            "task": task.strip(),
-            "owner": owner
-        })
-
-    return actions[:10]   # cap noise
-
-# =========================================================
-# UTIL
-# =========================================================
-def unique(items):
-    seen = set()
-    out = []
-
-    for i in items:
-        key = str(i)
-        if key not in seen:
-            out.append(i)
-            seen.add(key)
-
-    return out
-
-
-# =========================================================
-# MAIN PIPELINE
-# =========================================================
-def generate_insights(transcript, title="", meeting_type="discussion"):
-    """
-    Main public function used by Streamlit/FastAPI
-    """
-
-    if not transcript or len(transcript) < 20:
-        return {
-            "summary": "",
-            "key_points": [],
-            "decisions": [],
-            "action_items": []
-        }
-
-    text = normalize_text(transcript)
-
-    summary = summarize(text)
-    key_points = unique(extract_key_points(text))
-    decisions = unique(extract_decisions(text))
-    actions = unique(extract_actions(text))
-
-    # small meeting-type tuning
-    if meeting_type == "standup":
-        key_points = key_points[:3]
-
-    return {
-        "summary": summary,
-        "key_points": key_points,
-        "decisions": decisions,
-        "action_items": actions
-    }
-
+# =========================================================
+# Backend/F_llm.py
+# Production-grade Meeting Insight Engine
+# No external LLM / No heavy dependencies
+# Uses: nltk + numpy/scipy.sparse + regex only
+# =========================================================
+
+import bisect
+import os
+import re
+import threading
+from functools import lru_cache
+
+import nltk
+import numpy as np
+
+from Backend import metrics
+from Backend.document import Document
+
+
+# ---------------------------------------------------------
+# Tokenizer data
+# resolved from a local data dir on first use — no network
+# calls at import; downloads only if missing and not offline
+# ---------------------------------------------------------
+NLTK_DATA_DIR = os.environ.get(
+    "MEETING_NLTK_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nltk_data")
+)
+
+OFFLINE = os.environ.get("MEETING_OFFLINE") == "1"
+
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab/english/",
+}
+
+_nltk_ready = False
+_nltk_lock = threading.Lock()
+
+
+def ensure_nltk_data(download=None):
+    """
+    Make sure the punkt tokenizers are available.
+    Checks NLTK_DATA_DIR plus nltk's default paths first; fetches
+    into NLTK_DATA_DIR only when `download` (default: not OFFLINE).
+    """
+    global _nltk_ready
+
+    if _nltk_ready:
+        return
+
+    if download is None:
+        download = not OFFLINE
+
+    with _nltk_lock:
+        if _nltk_ready:
+            return
+
+        if NLTK_DATA_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLTK_DATA_DIR)
+
+        for name, resource in NLTK_RESOURCES.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                if not download:
+                    raise LookupError(
+                        f"nltk resource '{name}' not found in {NLTK_DATA_DIR}; "
+                        f"run nltk.download('{name}', download_dir='{NLTK_DATA_DIR}') "
+                        f"on a connected machine and copy it over"
+                    )
+                nltk.download(name, download_dir=NLTK_DATA_DIR, quiet=True)
+
+                # download() reports failure by returning False; only
+                # trust what can actually be loaded
+                try:
+                    nltk.data.find(resource)
+                except LookupError:
+                    raise LookupError(
+                        f"nltk resource '{name}' could not be downloaded into {NLTK_DATA_DIR}; "
+                        f"check network access or set MEETING_OFFLINE=1 with the data copied there"
+                    ) from None
+
+        _nltk_ready = True
+
+
+def warmup():
+    """
+    Resolve tokenizer data now instead of on the first request.
+    """
+    ensure_nltk_data()
+
+
+# =========================================================
+# TEXT NORMALIZATION
+# Fix Whisper output + improves all downstream quality
+# =========================================================
+FILLER_RE = re.compile(r"\b(um|uh|you know|like|basically|okay)\b", re.I)
+
+# joins sentences for the one-pass filler sub; a non-word char,
+# so \b behaves exactly as at a sentence start/end
+_SEP = "\x00"
+
+
+def normalize_text(text: str) -> str:
+    ensure_nltk_data()
+    sentences = [s.strip() for s in nltk.sent_tokenize(text)]
+
+    # remove filler noise — one regex pass over all sentences
+    if _SEP in text:
+        sentences = [FILLER_RE.sub("", s) for s in sentences]
+    else:
+        sentences = FILLER_RE.sub("", _SEP.join(sentences)).split(_SEP)
+
+    clean = [s for s in sentences if len(s) > 10]
+
+    # remove duplicates while preserving order
+    return "\n".join(dict.fromkeys(clean))
+
+
+def build_document(transcript):
+    """
+    Normalized transcript, tokenized once for every stage.
+    """
+    return Document(normalize_text(transcript))
+
+
+# =========================================================
+# SUMMARY (extractive, sparse — scales to multi-hour meetings)
+# "lsa" (randomized SVD) | "textrank" | "sumy" (old dense LSA)
+# =========================================================
+SUMMARY_METHOD = os.environ.get("SUMMARY_METHOD", "lsa")
+
+
+def summary_sentences(cleaned):
+    """
+    Sentences of each line, as sumy's PlaintextParser splits them.
+    """
+    return [
+        s for line in cleaned.split("\n")
+        for s in nltk.sent_tokenize(line)
+    ]
+
+
+def summarize(text, sentences=4, method=None):
+    """
+    Cleaner extractive summary.
+    Removes very short/noisy lines first.
+    `text` may be a Document, whose tokens are reused.
+    """
+    method = method or SUMMARY_METHOD
+
+    if isinstance(text, Document):
+        if method != "sumy":
+            return summarize_document(text, sentences, method)
+        text = text.text
+
+    ensure_nltk_data()
+
+    # remove short lines + noise
+    cleaned = "\n".join(
+        l.strip() for l in text.split("\n")
+        if len(l.strip()) > 30
+    )
+
+    if method == "sumy":
+        from sumy.parsers.plaintext import PlaintextParser
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.summarizers.lsa import LsaSummarizer
+
+        parser = PlaintextParser.from_string(cleaned, Tokenizer("english"))
+        summary = LsaSummarizer()(parser.document, sentences)
+        result = " ".join(str(s) for s in summary)
+    else:
+        from Backend.summarizer import top_sentences
+
+        result = " ".join(top_sentences(summary_sentences(cleaned), sentences, method))
+
+    # fallback safety
+    if len(result) < 40:
+        return cleaned[:400]
+
+    return result
+
+
+def summarize_document(doc, sentences=4, method="lsa"):
+    """
+    summarize() over a Document: lines are already sentences, and
+    the term matrix comes from the stored token ids.
+    """
+    from Backend.summarizer import rank
+
+    rows = [i for i, s in enumerate(doc.sentences) if len(s.strip()) > 30]
+    lines = [doc.sentences[i].strip() for i in rows]
+
+    if len(rows) <= sentences:
+        picked = lines
+    else:
+        picked = [lines[j] for j in rank(doc.term_matrix(rows), sentences, method)]
+
+    result = " ".join(picked)
+
+    # fallback safety
+    if len(result) < 40:
+        return "\n".join(lines)[:400]
+
+    return result
+
+
+# =========================================================
+# KEYWORD RULES
+# one compiled matcher tags every line with every category
+# in a single pass over the text
+# =========================================================
+DECISION = 1
+ACTION = 2
+
+DECISION_KEYWORDS = [
+    "decided",
+    "agreed",
+    "approved",
+    "confirmed",
+    "finalized",
+    "selected",
+    "deadline",
+    "must deliver",
+]
+
+# whole words
+ACTION_KEYWORDS = [
+    "will", "must", "should", "please", "by",
+    "prepare", "send", "deliver", "update", "start",
+]
+
+# per meeting type overrides, e.g.
+#   MEETING_KEYWORDS["standup"] = {"decision": [...], "action": [...]}
+# call get_rules.cache_clear() after changing it at runtime
+MEETING_KEYWORDS = {}
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher (Aho-Corasick style) on top of one
+    compiled regex: an alternation of every keyword, longest first,
+    searched over the lowercased text from each hit + 1 so
+    overlapping keywords are found too.
+    At a given position only the longest keyword is reported, so
+    each alternative also carries the shorter keywords that are
+    its prefixes; whole-word keywords get their \b checked per hit.
+    """
+
+    def __init__(self, groups):
+        """
+        groups: [(flag, keywords, whole_word)]
+        """
+        entries = {}
+
+        for flag, keywords, whole_word in groups:
+            for k in keywords:
+                entries.setdefault(k.lower(), []).append((flag, whole_word))
+
+        literals = sorted(entries, key=len, reverse=True)
+
+        # literal → [(length, flag, whole_word)] for itself + its prefixes
+        self.rules = {
+            lit: [
+                (len(k), flag, ww)
+                for k in entries if lit.startswith(k)
+                for flag, ww in entries[k]
+            ]
+            for lit in literals
+        }
+
+        alternation = "|".join(re.escape(l) for l in literals)
+
+        # case-sensitive search on lowered text is ~10x faster than re.I
+        self.pattern = re.compile(alternation)
+        self.pattern_i = re.compile(alternation, re.IGNORECASE)
+
+    @staticmethod
+    def _is_word(ch):
+        return ch.isalnum() or ch == "_"
+
+    def _rules_for(self, hit):
+        # re.I also folds chars lower() keeps ("ſ" ~ "s"): not a keyword
+        return self.rules.get(hit.lower(), ())
+
+    def scan(self, text):
+        """
+        Yield (position, flags) for every keyword hit in `text`.
+        """
+        is_word = self._is_word
+        end = len(text)
+
+        lower = text.lower()
+        search = self.pattern.search
+
+        # lower() changed some lengths (rare unicode): keep offsets exact
+        if len(lower) != end:
+            lower = text
+            search = self.pattern_i.search
+
+        p = 0
+
+        while True:
+            m = search(lower, p)
+            if m is None:
+                break
+
+            p = m.start()
+            flags = 0
+
+            for length, flag, whole_word in self._rules_for(m.group()):
+                if whole_word:
+                    if p and is_word(text[p - 1]):
+                        continue
+                    if p + length < end and is_word(text[p + length]):
+                        continue
+                flags |= flag
+
+            if flags:
+                yield p, flags
+
+            p += 1
+
+    def tag_lines(self, text):
+        """
+        [(line, flags)] for text.split("\n"), from one scan.
+        """
+        lines = text.split("\n")
+
+        starts = []
+        pos = 0
+        for l in lines:
+            starts.append(pos)
+            pos += len(l) + 1
+
+        flags = [0] * len(lines)
+        for p, f in self.scan(text):
+            flags[bisect.bisect_right(starts, p) - 1] |= f
+
+        return list(zip(lines, flags))
+
+    def tag_document(self, doc):
+        """
+        tag_lines(doc.text), using the Document's sentence offsets.
+        """
+        flags = np.zeros(len(doc), dtype=np.int64)
+        hits = list(self.scan(doc.text))
+
+        if hits:
+            positions, hit_flags = zip(*hits)
+            np.bitwise_or.at(flags, doc.sentence_at(positions), hit_flags)
+
+        return list(zip(doc.sentences, flags.tolist()))
+
+
+class Rules:
+    """
+    Compiled keyword rules for one meeting type.
+    """
+
+    def __init__(self, decision_keywords, action_keywords):
+        self.action_keywords = list(action_keywords)
+        self.matcher = KeywordMatcher([
+            (DECISION, decision_keywords, False),
+            (ACTION, action_keywords, True),
+        ])
+
+        self.action_re = re.compile(
+            r"""
+            ^(?:[A-Z][a-z]+)?      # optional owner
+            [,:]?\s*
+            (.*?\b(?:""" + "|".join(re.escape(k) for k in action_keywords) + r""")\b.*)
+            """,
+            re.IGNORECASE | re.VERBOSE
+        )
+
+
+@lru_cache(maxsize=None)
+def get_rules(meeting_type="discussion"):
+    overrides = MEETING_KEYWORDS.get(meeting_type, {})
+
+    return Rules(
+        overrides.get("decision", DECISION_KEYWORDS),
+        overrides.get("action", ACTION_KEYWORDS),
+    )
+
+
+# =========================================================
+# KEY POINTS
+# =========================================================
+def key_points_from(lines):
+    seen = set()
+    points = []
+
+    for l in lines:
+        l = l.strip()
+        if len(l) > 40 and l not in seen:
+            points.append(l)
+            seen.add(l)
+            if len(points) == 6:
+                break
+
+    return points
+
+
+def extract_key_points(text):
+    return key_points_from(text.split("\n"))
+
+
+# =========================================================
+# DECISIONS
+# =========================================================
+def decisions_from(tagged):
+    return [l.strip() for l, flags in tagged if flags & DECISION]
+
+
+def extract_decisions(text: str, meeting_type="discussion"):
+    return decisions_from(get_rules(meeting_type).matcher.tag_lines(text))
+
+
+# =========================================================
+# ACTION ITEMS (structured)
+# returns:
+# [{"task": "...", "owner": "...", "deadline": "..."}]
+# =========================================================
+def extract_actions(text, meeting_type="discussion", reference=None):
+    # the one action path, shared with B_speaker / C_action; that
+    # module builds on the rules here, so it is imported late
+    from Backend.C_action import KEYWORD, get_engine
+
+    return get_engine(meeting_type).extract(text, (KEYWORD,), reference)[KEYWORD]
+
+# =========================================================
+# UTIL
+# =========================================================
+def unique(items):
+    seen = set()
+    out = []
+
+    for i in items:
+        key = str(i)
+        if key not in seen:
+            out.append(i)
+            seen.add(key)
+
+    return out
+
+
+# =========================================================
+# MAIN PIPELINE
+# =========================================================
+def generate_insights(transcript, title="", meeting_type="discussion"):
+    """
+    Main public function used by Streamlit/FastAPI
+    """
+
+    if not transcript or len(transcript) < 20:
+        return {
+            "summary": "",
+            "key_points": [],
+            "decisions": [],
+            "action_items": []
+        }
+
+    # sentences, offsets and token ids, shared by every stage
+    with metrics.span("normalize"):
+        doc = build_document(transcript)
+
+    # one keyword pass tags every line for decisions + actions
+    with metrics.span("tag_lines"):
+        rules = get_rules(meeting_type)
+        tagged = rules.matcher.tag_document(doc)
+
+    with metrics.span("summarize"):
+        summary = summarize(doc)
+
+    with metrics.span("extract"):
+        key_points = unique(key_points_from(l for l, _ in tagged))
+        decisions = unique(decisions_from(tagged))
+        actions = unique(extract_actions(doc.text, meeting_type))
+
+    # small meeting-type tuning
+    if meeting_type == "standup":
+        key_points = key_points[:3]
+
+    return {
+        "summary": summary,
+        "key_points": key_points,
+        "decisions": decisions,
+        "action_items": actions
+    }
+
+
+# =========================================================
+# INCREMENTAL SESSION (live meetings)
+# =========================================================
+class InsightSession:
+    """
+    Insights over a transcript that only grows.
+
+    `append` tokenizes just the new text (plus the still-open last
+    sentence), then cleans, dedups and keyword-tags only the newly
+    completed sentences; dedup sets live in memory. The summary is
+    recomputed once `summary_every` new characters have arrived
+    (or on `insights(fresh=True)`), so each update is O(new text).
+
+    insights(fresh=True) == generate_insights(session.transcript, ...)
+    """
+
+    def __init__(self, title="", meeting_type="discussion", summary_every=2000):
+        self.title = title
+        self.meeting_type = meeting_type
+        self.summary_every = summary_every
+        self.rules = get_rules(meeting_type)
+
+        self.transcript = ""
+        self._tail = ""             # raw text of the open last sentence
+
+        self._clean = []            # unique cleaned sentences, in order
+        self._seen = set()
+
+        self._key_points = []
+        self._kp_seen = set()
+        self._decisions = []
+        self._dec_seen = set()
+        self._actions = []          # first 10 matches, before unique()
+
+        self._summary = ""
+        self._summary_chars = 0     # len(transcript) at last summary
+
+    # -----------------------------------------------------
+    # input
+    # -----------------------------------------------------
+    def append(self, text, sep=" "):
+        if not text:
+            return
+
+        if self.transcript:
+            text = sep + text
+
+        self.transcript += text
+        self._tail += text
+
+        ensure_nltk_data()
+        spans = list(_sentence_spans(self._tail))
+
+        # every sentence but the last is final
+        for start, end in spans[:-1]:
+            self._add(self._tail[start:end], commit=True)
+
+        if spans:
+            self._tail = self._tail[spans[-1][0]:]
+
+    # -----------------------------------------------------
+    # per-sentence work
+    # -----------------------------------------------------
+    def _add(self, sentence, commit):
+        """
+        Fold one raw sentence into the results. With commit=False
+        nothing is stored: the new items are returned instead.
+        """
+        sentence = FILLER_RE.sub("", sentence.strip())
+
+        extra = {"clean": [], "key_points": [], "decisions": [], "actions": []}
+
+        if len(sentence) <= 10 or sentence in self._seen:
+            return extra
+
+        extra["clean"].append(sentence)
+
+        for line, flags in self.rules.matcher.tag_lines(sentence):
+            l = line.strip()
+
+            if (len(self._key_points) + len(extra["key_points"]) < 6
+                    and len(l) > 40 and l not in self._kp_seen
+                    and l not in extra["key_points"]):
+                extra["key_points"].append(l)
+
+            if flags & DECISION and l not in self._dec_seen and l not in extra["decisions"]:
+                extra["decisions"].append(l)
+
+        budget = 10 - len(self._actions)
+        if budget > 0:
+            extra["actions"] = extract_actions(sentence, self.meeting_type)[:budget]
+
+        if commit:
+            self._seen.add(sentence)
+            self._clean.extend(extra["clean"])
+            self._key_points.extend(extra["key_points"])
+            self._kp_seen.update(extra["key_points"])
+            self._decisions.extend(extra["decisions"])
+            self._dec_seen.update(extra["decisions"])
+            self._actions.extend(extra["actions"])
+
+        return extra
+
+    # -----------------------------------------------------
+    # output
+    # -----------------------------------------------------
+    def insights(self, fresh=False):
+        if len(self.transcript) < 20:
+            return {
+                "summary": "",
+                "key_points": [],
+                "decisions": [],
+                "action_items": []
+            }
+
+        # the open sentence counts now but is not committed
+        tail = self._add(self._tail, commit=False)
+
+        due = len(self.transcript) - self._summary_chars >= self.summary_every
+        if fresh or due or not self._summary:
+            self._summary = summarize("\n".join(self._clean + tail["clean"]))
+            self._summary_chars = len(self.transcript)
+
+        key_points = self._key_points + tail["key_points"]
+
+        if self.meeting_type == "standup":
+            key_points = key_points[:3]
+
+        return {
+            "summary": self._summary,
+            "key_points": key_points,
+            "decisions": self._decisions + tail["decisions"],
+            "action_items": unique(self._actions + tail["actions"])
+        }
+
+
+def _sentence_spans(text):
+    """
+    (start, end) offsets of nltk.sent_tokenize's sentences.
+    """
+    return _punkt().span_tokenize(text)
+
+
+@lru_cache(maxsize=1)
+def _punkt():
+    from nltk.tokenize import PunktTokenizer
+
+    return PunktTokenizer("english")
@@ -1,58 +1,503 @@
-import os 
-os.environ["PATH"] += os.pathsep + r"C:\ffmpeg\bin"
-
-from fastapi import FastAPI, Form, UploadFile, File
-from fastapi.responses import JSONResponse
-import os, traceback
-
-from Backend.A_STT import transcribe_audio
-from Backend.F_llm import generate_insights
-from Backend.D_pdf_export import generate_pdf
-
-app = FastAPI()
-
-@app.post("/process")
-async def process(
-    transcript: str = Form(None),
-    audio: UploadFile = File(None),
-    title: str = Form(None),
-    meeting_type: str = Form(None)
-):
-    try:
-        if audio is not None:
-            # ✅ Preserve original extension (.mp3, .wav, etc.)
-            suffix = os.path.splitext(audio.filename)[-1] or ".mp3"
-            audio_path = f"temp_upload{suffix}"
-
-            # Save uploaded file
-            with open(audio_path, "wb") as f:
-                f.write(await audio.read())
-
-            # Debug check
-            print("Saved audio at:", audio_path)
-            print("File exists?", os.path.exists(audio_path))
-
-            # Transcribe audio
-            transcript = transcribe_audio(audio_path)
-
-            # Clean up
-            os.remove(audio_path)
-
-        if not transcript:
-            return JSONResponse(
-                status_code=400,
-                content={"error": "No transcript or audio provided"}
-            )
-
-        # Generate insights
-        insights = generate_insights(transcript)
-
-        # Generate PDF
-        pdf_path = "report.pdf"
-        generate_pdf(insights, pdf_path)
-
-        return {"insights": insights, "pdf_path": pdf_path}
-
-    except Exception as e:
-        print(traceback.format_exc())
-        return JSONResponse(status_code=500, content={"error": str(e)})
+import os 
+os.environ["PATH"] += os.pathsep + r"C:\ffmpeg\bin"
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Form, Header, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+import asyncio, io, json, os, shutil, tempfile, threading, traceback, uuid
+
+from Backend import A_STT, F_llm, metrics
+from Backend.A_STT import transcribe_audio
+from Backend.F_llm import generate_insights
+from Backend.D_pdf_export import render_pdf
+from Backend.cache import get_cache
+from Backend.jobs import JobQueue, audio_duration, DONE, FAILED
+from Backend.uploads import UploadError, UploadStore
+
+# set to 0 on transcript-only deployments to skip loading whisper
+WARMUP_ASR = os.environ.get("WARMUP_ASR", "1") == "1"
+
+# concurrent ASR jobs for /jobs
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+
+# rendered PDFs kept in memory for GET /reports/{id}
+MAX_REPORTS = int(os.environ.get("MAX_REPORTS", "200"))
+
+JOB_DIR = os.path.join(tempfile.gettempdir(), "meeting_jobs")
+UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "meeting_uploads")
+
+# bytes per read when copying a /jobs upload to its workspace
+COPY_BLOCK = 1 << 20
+
+
+# =========================================================
+# In-memory report store (bounded, oldest evicted first)
+# =========================================================
+class ReportStore:
+
+    def __init__(self, max_reports=MAX_REPORTS):
+        self.max_reports = max_reports
+        self._reports = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, pdf, report_id=None):
+        report_id = report_id or uuid.uuid4().hex
+
+        with self._lock:
+            self._reports[report_id] = pdf
+            while len(self._reports) > self.max_reports:
+                self._reports.popitem(last=False)
+
+        return report_id
+
+    def get(self, report_id):
+        with self._lock:
+            return self._reports.get(report_id)
+
+
+reports = ReportStore()
+
+
+# =========================================================
+# Pipeline (blocking — run off the event loop)
+# audio may be a path or an in-memory file; the PDF is
+# rendered to bytes, so nothing shares a filename on disk
+# =========================================================
+def run_pipeline(transcript=None, audio=None, title=None, meeting_type=None,
+                 on_progress=None, engine=None):
+    with metrics.span("pipeline"):
+        return _run_pipeline(transcript, audio, title, meeting_type, on_progress, engine)
+
+
+def _run_pipeline(transcript, audio, title, meeting_type, on_progress=None, engine=None):
+    if audio is not None:
+        transcript = transcribe_audio(
+            audio,
+            cache=get_cache(),
+            on_progress=on_progress,
+            engine=A_STT.resolve_engine(engine, meeting_type)
+        )
+
+    if not transcript:
+        raise ValueError("No transcript or audio provided")
+
+    insights = generate_insights(transcript, title or "", meeting_type or "discussion")
+    pdf = render_pdf(insights, title or "Meeting Report")
+
+    return insights, pdf
+
+
+def report_response(insights, report_id):
+    return {
+        "insights": insights,
+        "report_id": report_id,
+        "pdf_url": f"/reports/{report_id}",
+    }
+
+
+def engine_error(engine, meeting_type):
+    """
+    400 response for an unknown engine, None if it resolves.
+    """
+    try:
+        A_STT.resolve_engine(engine, meeting_type)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+
+    return None
+
+
+def run_job(job):
+    payload = dict(job.payload)
+    workspace = payload.pop("workspace", None)
+
+    try:
+        insights, pdf = run_pipeline(**payload)
+        reports.put(pdf, job.id)
+        return report_response(insights, job.id)
+    finally:
+        if workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+jobs = JobQueue(run_job, workers=JOB_WORKERS)
+
+metrics.gauge("job_queue_depth", "Jobs waiting in /jobs", fn=jobs.depth)
+
+uploads = UploadStore(UPLOAD_DIR)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # load models / tokenizer data before the first request; both
+    # may hit disk or the network, so keep them off the event loop
+    await run_in_threadpool(F_llm.warmup)
+    if WARMUP_ASR:
+        await run_in_threadpool(A_STT.warmup)
+
+    os.makedirs(JOB_DIR, exist_ok=True)
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    jobs.start()
+    yield
+    jobs.stop()
+    await run_in_threadpool(A_STT.shutdown_pools)
+
+
+app = FastAPI(lifespan=lifespan)
+
+@app.post("/process")
+async def process(
+    transcript: str = Form(None),
+    audio: UploadFile = File(None),
+    title: str = Form(None),
+    meeting_type: str = Form(None),
+    output: str = Form("json"),
+    engine: str = Form(None)
+):
+    """
+    output="json" → insights + /reports/{id} link
+    output="pdf"  → the PDF itself
+    engine        → ASR engine name (see GET /engines)
+    """
+    try:
+        if audio is None and not transcript:
+            return JSONResponse(
+                status_code=400,
+                content={"error": "No transcript or audio provided"}
+            )
+
+        error = engine_error(engine, meeting_type) if audio is not None else None
+        if error:
+            return error
+
+        # upload stays in memory; ASR reads it straight from the buffer
+        if audio is not None:
+            audio = io.BytesIO(await audio.read())
+
+        insights, pdf = await run_in_threadpool(
+            run_pipeline, transcript, audio, title, meeting_type, None, engine
+        )
+
+        if output == "pdf":
+            return Response(
+                pdf,
+                media_type="application/pdf",
+                headers={"Content-Disposition": 'attachment; filename="meeting_report.pdf"'}
+            )
+
+        return report_response(insights, reports.put(pdf))
+
+    except Exception as e:
+        print(traceback.format_exc())
+        return JSONResponse(status_code=500, content={"error": str(e)})
+
+
+# =========================================================
+# Streaming variant of /process (server-sent events)
+#   event: transcript  {"index", "text"}     per decoded chunk
+#   event: progress    {"percent", "audio_seconds"}
+#   event: insights    same body as /process
+#   event: error       {"error"}
+# audio comes as a form file or a completed /uploads id
+# =========================================================
+def sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def pipeline_events(transcript, audio, title, meeting_type, cleanup=None, engine=None):
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def emit(event, data):
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    index = 0
+
+    def on_progress(text, seconds, percent):
+        nonlocal index
+        emit("transcript", {"index": index, "text": text})
+        emit("progress", {"percent": round(percent, 1), "audio_seconds": round(seconds, 1)})
+        index += 1
+
+    def work():
+        try:
+            insights, pdf = run_pipeline(
+                transcript, audio, title, meeting_type, on_progress, engine
+            )
+            emit("insights", report_response(insights, reports.put(pdf)))
+        except Exception as e:
+            print(traceback.format_exc())
+            emit("error", {"error": str(e)})
+        finally:
+            if cleanup:
+                cleanup()
+            emit(None, None)
+
+    # keeps running if the client goes away; the report is still stored
+    task = asyncio.ensure_future(run_in_threadpool(work))
+
+    while True:
+        event, data = await events.get()
+        if event is None:
+            break
+        yield sse(event, data)
+
+    await task
+
+
+@app.post("/process/stream")
+async def process_stream(
+    transcript: str = Form(None),
+    audio: UploadFile = File(None),
+    upload_id: str = Form(None),
+    title: str = Form(None),
+    meeting_type: str = Form(None),
+    engine: str = Form(None)
+):
+    cleanup = None
+
+    error = engine_error(engine, meeting_type) if upload_id or audio is not None else None
+    if error:
+        return error
+
+    if upload_id:
+        try:
+            audio = await run_in_threadpool(uploads.complete, upload_id)
+        except UploadError as e:
+            return upload_error(e)
+
+        cleanup = lambda: uploads.discard(upload_id)
+
+    elif audio is not None:
+        audio = io.BytesIO(await audio.read())
+
+    elif not transcript:
+        return JSONResponse(
+            status_code=400,
+            content={"error": "No transcript or audio provided"}
+        )
+
+    return StreamingResponse(
+        pipeline_events(transcript, audio, title, meeting_type, cleanup, engine),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/reports/{report_id}")
+async def get_report(report_id: str):
+    pdf = reports.get(report_id)
+    if pdf is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown report"})
+
+    return Response(pdf, media_type="application/pdf")
+
+
+# =========================================================
+# Job API
+# POST /jobs → job id at once; poll GET /jobs/{id}
+# audio jobs are scheduled shortest-first by header duration
+# =========================================================
+def save_job_audio(audio):
+    """
+    Copy an UploadFile into a new job workspace in COPY_BLOCK
+    pieces (never whole in memory); returns (path, duration).
+    Blocking — run it in the threadpool.
+    """
+    workspace = tempfile.mkdtemp(dir=JOB_DIR)
+    suffix = os.path.splitext(audio.filename or "")[-1] or ".mp3"
+    audio_path = os.path.join(workspace, "upload" + suffix)
+
+    audio.file.seek(0)
+    with open(audio_path, "wb") as f:
+        shutil.copyfileobj(audio.file, f, COPY_BLOCK)
+
+    return audio_path, audio_duration(audio_path)
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    transcript: str = Form(None),
+    audio: UploadFile = File(None),
+    title: str = Form(None),
+    meeting_type: str = Form(None),
+    engine: str = Form(None)
+):
+    if audio is None and not transcript:
+        return JSONResponse(
+            status_code=400,
+            content={"error": "No transcript or audio provided"}
+        )
+
+    error = engine_error(engine, meeting_type) if audio is not None else None
+    if error:
+        return error
+
+    payload = {
+        "transcript": transcript,
+        "title": title,
+        "meeting_type": meeting_type,
+        "engine": engine,
+    }
+    cost = 0.0
+
+    # queued audio waits on disk, in a workspace private to this job
+    if audio is not None:
+        payload["audio"], cost = await run_in_threadpool(save_job_audio, audio)
+        payload["workspace"] = os.path.dirname(payload["audio"])
+
+    job = jobs.submit(payload, cost)
+
+    return {"job_id": job.id, "status": job.status, "queue_depth": jobs.depth()}
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown job"})
+
+    return job.info()
+
+
+@app.get("/jobs/{job_id}/result")
+async def job_result(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown job"})
+
+    if job.status == FAILED:
+        return JSONResponse(status_code=500, content={"error": job.error})
+
+    if job.status != DONE:
+        return JSONResponse(status_code=202, content=job.info())
+
+    return job.result
+
+
+# =========================================================
+# Chunked upload API (large recordings, resumable)
+#   POST /uploads                   → upload_id, chunk_size
+#   PUT  /uploads/{id}?offset=N     → raw chunk body,
+#        X-Chunk-SHA256 header      → new offset
+#   GET  /uploads/{id}              → offset to resume from
+#   POST /uploads/{id}/complete     → same as /process, or a
+#        job id with queue=true
+# =========================================================
+def upload_error(e):
+    return JSONResponse(status_code=e.status, content={"error": str(e), **e.info})
+
+
+@app.post("/uploads", status_code=201)
+async def init_upload(filename: str = Form(""), size: int = Form(None)):
+    # create() also sweeps stale uploads (rmtree)
+    return await run_in_threadpool(uploads.create, filename, size)
+
+
+@app.get("/uploads/{upload_id}")
+async def upload_status(upload_id: str):
+    try:
+        return uploads.info(upload_id)
+    except UploadError as e:
+        return upload_error(e)
+
+
+@app.put("/uploads/{upload_id}")
+async def append_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int,
+    checksum: str = Header(..., alias="X-Chunk-SHA256")
+):
+    # the body is streamed to disk, never held whole in memory
+    try:
+        offset = await uploads.append(upload_id, offset, request.stream(), checksum)
+    except UploadError as e:
+        return upload_error(e)
+
+    return {"upload_id": upload_id, "offset": offset}
+
+
+@app.delete("/uploads/{upload_id}")
+async def cancel_upload(upload_id: str):
+    try:
+        uploads.meta(upload_id)
+    except UploadError as e:
+        return upload_error(e)
+
+    await run_in_threadpool(uploads.discard, upload_id)
+    return {"upload_id": upload_id, "status": "cancelled"}
+
+
+@app.post("/uploads/{upload_id}/complete")
+async def complete_upload(
+    upload_id: str,
+    sha256: str = Form(None),
+    title: str = Form(None),
+    meeting_type: str = Form(None),
+    output: str = Form("json"),
+    queue: bool = Form(False),
+    engine: str = Form(None)
+):
+    error = engine_error(engine, meeting_type)
+    if error:
+        return error
+
+    try:
+        path = await run_in_threadpool(uploads.complete, upload_id, sha256)
+    except UploadError as e:
+        return upload_error(e)
+
+    payload = {"audio": path, "title": title, "meeting_type": meeting_type, "engine": engine}
+
+    # queued: the upload directory becomes the job workspace
+    if queue:
+        payload["workspace"] = os.path.dirname(path)
+        job = jobs.submit(payload, audio_duration(path))
+
+        return JSONResponse(
+            status_code=202,
+            content={"job_id": job.id, "status": job.status, "queue_depth": jobs.depth()}
+        )
+
+    try:
+        insights, pdf = await run_in_threadpool(run_pipeline, **payload)
+
+        if output == "pdf":
+            return Response(
+                pdf,
+                media_type="application/pdf",
+                headers={"Content-Disposition": 'attachment; filename="meeting_report.pdf"'}
+            )
+
+        return report_response(insights, reports.put(pdf))
+
+    except Exception as e:
+        print(traceback.format_exc())
+        return JSONResponse(status_code=500, content={"error": str(e)})
+
+    finally:
+        await run_in_threadpool(uploads.discard, upload_id)
+
+
+# =========================================================
+# ASR engines selectable per request (form field `engine`)
+# =========================================================
+@app.get("/engines")
+async def list_engines():
+    return {
+        "engines": A_STT.ENGINES,
+        "default": A_STT.DEFAULT_ENGINE,
+        "meeting_types": A_STT.MEETING_ENGINES,
+    }
+
+
+# =========================================================
+# Prometheus scrape endpoint
+# stage histograms, audio / cache counters, queue depth
+# =========================================================
+@app.get("/metrics")
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
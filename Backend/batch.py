@@ -0,0 +1,290 @@
+# =========================================================
+# Backend/batch.py
+# Offline batch processing (backfills) — no HTTP, no UI
+#
+#   python -m Backend.batch recordings/ --out reports/
+#   python -m Backend.batch manifest.jsonl --workers 4
+#
+# Input: a directory (audio, *.txt, recursive) or a manifest
+# with one item per line — a path, or JSON like
+#   {"path": "a.wav", "title": "...", "meeting_type": "standup"}
+# Per item: <out>/<name>.json (+ <name>.pdf), <name> being the
+# relative path with its extension (a/standup.wav → a__standup.wav)
+# so standup.wav and standup.txt never share outputs. Finished items
+# are skipped on re-run, so an interrupted batch just resumes.
+# =========================================================
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+AUDIO_EXTS = (".wav", ".flac", ".ogg", ".mp3", ".m4a")
+TEXT_EXTS = (".txt",)
+
+
+# =========================================================
+# Inputs
+# =========================================================
+def _item(path, root, title=None, meeting_type=None):
+    name = os.path.relpath(path, root)
+
+    return {
+        "path": path,
+        "name": name.replace(os.sep, "__"),
+        "kind": "audio" if path.lower().endswith(AUDIO_EXTS) else "text",
+        "title": title or os.path.splitext(os.path.basename(name))[0],
+        "meeting_type": meeting_type,
+    }
+
+
+def scan_directory(root):
+    items = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for f in sorted(filenames):
+            if f.lower().endswith(AUDIO_EXTS + TEXT_EXTS):
+                items.append(_item(os.path.join(dirpath, f), root))
+
+    return items
+
+
+def read_manifest(path):
+    """
+    Relative paths are resolved against the manifest's directory.
+    """
+    root = os.path.dirname(os.path.abspath(path))
+    items = []
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            entry = json.loads(line) if line.startswith("{") else {"path": line}
+            entry_path = os.path.join(root, entry["path"])
+
+            items.append(_item(
+                entry_path, root,
+                entry.get("title"),
+                entry.get("meeting_type"),
+            ))
+
+    return items
+
+
+def load_items(source):
+    """
+    Items from a directory or manifest; ValueError if two items
+    would write the same outputs (e.g. a manifest listing a file twice).
+    """
+    items = scan_directory(source) if os.path.isdir(source) else read_manifest(source)
+
+    seen = {}
+    for item in items:
+        if item["name"] in seen:
+            raise ValueError(
+                f"{item['path']} and {seen[item['name']]} map to the same output name {item['name']!r}"
+            )
+        seen[item["name"]] = item["path"]
+
+    return items
+
+
+def outputs(item, out_dir):
+    base = os.path.join(out_dir, item["name"])
+    return base + ".json", base + ".pdf"
+
+
+def is_done(item, out_dir, pdf=True):
+    # the JSON is written last, so its presence marks a finished item
+    json_path, pdf_path = outputs(item, out_dir)
+    return os.path.exists(json_path) and (not pdf or os.path.exists(pdf_path))
+
+
+# =========================================================
+# Worker side
+# =========================================================
+def _init_worker(threads, audio, engine=None):
+    if audio:
+        # pins torch threads and loads whisper once per worker
+        from Backend.A_STT import _init_worker as init_asr
+        init_asr(threads, engine)
+
+    from Backend.F_llm import warmup
+    warmup()
+
+
+def _write_atomic(path, write):
+    tmp = path + ".part"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def process_item(item, out_dir, meeting_type="discussion", pdf=True, engine=None):
+    """
+    transcribe (audio) → insights → PDF → JSON, for one file.
+    """
+    from Backend.A_STT import resolve_engine, transcribe_audio
+    from Backend.D_pdf_export import generate_pdf
+    from Backend.F_llm import generate_insights
+    from Backend.cache import get_cache
+    from Backend.jobs import audio_duration
+
+    start = time.perf_counter()
+    meeting_type = item["meeting_type"] or meeting_type
+    audio_seconds = 0.0
+
+    if item["kind"] == "audio":
+        audio_seconds = audio_duration(item["path"])
+        # files already run in parallel here; no nested shard pools
+        transcript = transcribe_audio(
+            item["path"], cache=get_cache(), engine=resolve_engine(engine, meeting_type), parallel=False
+        )
+    else:
+        with open(item["path"], encoding="utf-8") as f:
+            transcript = f.read()
+
+    insights = generate_insights(transcript, item["title"], meeting_type)
+
+    json_path, pdf_path = outputs(item, out_dir)
+
+    if pdf:
+        _write_atomic(pdf_path, lambda p: generate_pdf(insights, p, item["title"]))
+
+    def write_json(p):
+        with open(p, "w", encoding="utf-8") as f:
+            json.dump({
+                "source": item["path"],
+                "title": item["title"],
+                "meeting_type": meeting_type,
+                "audio_seconds": audio_seconds,
+                "transcript": transcript,
+                "insights": insights,
+            }, f, indent=2, ensure_ascii=False)
+
+    _write_atomic(json_path, write_json)
+
+    return {
+        "name": item["name"],
+        "audio_seconds": audio_seconds,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# =========================================================
+# Driver
+# =========================================================
+def run_batch(items, out_dir, workers=None, threads_per_worker=1,
+              meeting_type="discussion", pdf=True, engine=None, log=print):
+    """
+    Process every unfinished item across a process pool.
+    Returns a summary dict (counts, failures, throughput).
+    """
+    from Backend.jobs import audio_duration
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    todo = [i for i in items if not is_done(i, out_dir, pdf)]
+    skipped = len(items) - len(todo)
+
+    # longest recordings first so the pool does not end on one straggler
+    todo.sort(
+        key=lambda i: audio_duration(i["path"]) if i["kind"] == "audio" else 0.0,
+        reverse=True
+    )
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo) or 1))
+    has_audio = any(i["kind"] == "audio" for i in todo)
+
+    log(f"{len(items)} items, {skipped} already done, {len(todo)} to process on {workers} workers")
+
+    done = []
+    failed = []
+    start = time.perf_counter()
+
+    if todo:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(threads_per_worker, has_audio, engine)
+        ) as pool:
+            futures = {
+                pool.submit(process_item, item, out_dir, meeting_type, pdf, engine): item
+                for item in todo
+            }
+
+            for n, future in enumerate(as_completed(futures), 1):
+                item = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed.append({"name": item["name"], "error": repr(e)})
+                    log(f"[{n}/{len(todo)}] FAILED {item['name']}: {e!r}")
+                    traceback.print_exception(e, file=sys.stderr)
+                    continue
+
+                done.append(result)
+                log(f"[{n}/{len(todo)}] {item['name']} ({result['seconds']:.1f}s)")
+
+    elapsed = time.perf_counter() - start
+    audio_seconds = sum(r["audio_seconds"] for r in done)
+
+    return {
+        "items": len(items),
+        "skipped": skipped,
+        "processed": len(done),
+        "failed": failed,
+        "elapsed_seconds": elapsed,
+        "audio_seconds": audio_seconds,
+        "files_per_minute": len(done) / elapsed * 60 if elapsed else 0.0,
+        # hours of audio transcribed per wall-clock hour
+        "audio_hours_per_hour": audio_seconds / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Batch meeting insights for recordings / transcripts")
+    ap.add_argument("source", help="directory of audio/.txt files, or a manifest file")
+    ap.add_argument("--out", default="reports", help="output directory (default: reports)")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    ap.add_argument("--threads-per-worker", type=int, default=1)
+    ap.add_argument("--meeting-type", default="discussion")
+    ap.add_argument("--no-pdf", action="store_true", help="write JSON only")
+    ap.add_argument("--engine", default=None, help="ASR engine, e.g. tiny-int8 (default: per meeting type)")
+    args = ap.parse_args(argv)
+
+    try:
+        items = load_items(args.source)
+    except ValueError as e:
+        ap.error(str(e))
+
+    summary = run_batch(
+        items,
+        args.out,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        meeting_type=args.meeting_type,
+        pdf=not args.no_pdf,
+        engine=args.engine,
+    )
+
+    print(
+        f"\nprocessed {summary['processed']}, skipped {summary['skipped']}, "
+        f"failed {len(summary['failed'])} in {summary['elapsed_seconds']:.1f}s\n"
+        f"{summary['files_per_minute']:.2f} files/min, "
+        f"{summary['audio_hours_per_hour']:.2f} audio-hours/hour"
+    )
+
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+# =========================================================
+# Backend/cache.py
+# Content-addressed cache for transcripts + decoded audio
+# key = sha256(audio bytes) [+ model identity for transcripts]
+# =========================================================
+
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+
+CACHE_DIR = os.environ.get(
+    "MEETING_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+)
+
+# total size of the cache directory before LRU eviction
+CACHE_MAX_BYTES = int(float(os.environ.get("MEETING_CACHE_MAX_MB", "2048")) * 1024 * 1024)
+
+# also keep the decoded 16 kHz float32 audio (as .npy, memory-mapped)
+CACHE_AUDIO = os.environ.get("MEETING_CACHE_AUDIO", "0") == "1"
+
+HASH_BLOCK = 1 << 20
+
+
+def hash_file(path):
+    """
+    sha256 of the file contents, read in 1 MB blocks.
+    `path` may also be a seekable binary file object.
+    """
+    h = hashlib.sha256()
+
+    if hasattr(path, "read"):
+        path.seek(0)
+        for block in iter(lambda: path.read(HASH_BLOCK), b""):
+            h.update(block)
+        path.seek(0)
+        return h.hexdigest()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            h.update(block)
+
+    return h.hexdigest()
+
+
+class TranscriptCache:
+    """
+    On-disk cache:
+      <root>/<kk>/<key>.json   transcript (+ metadata)
+      <root>/<kk>/<key>.npy    decoded 16 kHz float32 audio
+    Recency is the file mtime (touched on every hit); once the
+    directory grows past `max_bytes` the oldest entries go first.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, store_audio=CACHE_AUDIO):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.store_audio = store_audio
+
+        self.hits = 0
+        self.misses = 0
+        self.audio_hits = 0
+        self.audio_misses = 0
+
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    # -----------------------------------------------------
+    # keys / paths
+    # -----------------------------------------------------
+    @staticmethod
+    def key(audio_key, *identity):
+        """
+        Transcript key: audio hash + model identity (name, settings).
+        """
+        h = hashlib.sha256(audio_key.encode())
+        for part in identity:
+            h.update(b"\0" + str(part).encode())
+        return h.hexdigest()
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, key[:2], key + ext)
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    # -----------------------------------------------------
+    # transcripts
+    # -----------------------------------------------------
+    def get_transcript(self, key):
+        path = self._path(key, ".json")
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = json.load(f)["transcript"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        self._touch(path)
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put_transcript(self, key, text, **meta):
+        path = self._path(key, ".json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"transcript": text, **meta}, f)
+        os.replace(tmp, path)
+
+        self.evict()
+
+    # -----------------------------------------------------
+    # decoded audio
+    # -----------------------------------------------------
+    def get_audio(self, key):
+        """
+        Read-only memmap of the cached 16 kHz audio, or None.
+        """
+        path = self._path(key, ".npy")
+
+        try:
+            audio = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            with self._lock:
+                self.audio_misses += 1
+            return None
+
+        self._touch(path)
+        with self._lock:
+            self.audio_hits += 1
+        return audio
+
+    def tee_audio(self, key, blocks, length):
+        """
+        Pass `blocks` through unchanged while writing them into
+        <key>.npy; the file is only published if exactly `length`
+        samples arrive.
+        """
+        path = self._path(key, ".npy")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(length,))
+        filled = 0
+
+        try:
+            for block in blocks:
+                take = min(len(block), length - filled)
+                out[filled:filled + take] = block[:take]
+                filled += len(block)
+                yield block
+
+            out.flush()
+            del out
+
+            if filled == length:
+                os.replace(tmp, path)
+                self.evict()
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # -----------------------------------------------------
+    # eviction / stats
+    # -----------------------------------------------------
+    def _entries(self):
+        for d in os.scandir(self.root):
+            if not d.is_dir():
+                continue
+            for e in os.scandir(d.path):
+                if e.name.endswith((".json", ".npy")):
+                    st = e.stat()
+                    yield st.st_mtime, st.st_size, e.path
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Drop least recently used entries until under max_bytes.
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "audio_hits": self.audio_hits,
+            "audio_misses": self.audio_misses,
+            "bytes": self.size(),
+            "max_bytes": self.max_bytes,
+        }
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Process-wide cache using the MEETING_CACHE_* settings.
+    """
+    global _cache
+    if _cache is None:
+        _cache = TranscriptCache()
+    return _cache
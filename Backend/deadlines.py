@@ -0,0 +1,174 @@
+# =========================================================
+# Backend/deadlines.py
+# Deadline phrases → ISO dates, one compiled regex
+#   "by Feb 20th", "by next Monday", "by end of week",
+#   "by mid-March", "by the 15th", "tomorrow", "by Q2" ...
+# Relative dates resolve against `reference` (default: today);
+# phrases with no calendar meaning ("end of sprint") are kept
+# as text.
+# =========================================================
+
+import calendar
+import datetime
+import re
+from functools import lru_cache
+
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+)
+_WEEKDAY = r"(?:mon|tue(?:s)?|wed(?:nes)?|thu(?:r(?:s)?)?|fri|sat(?:ur)?|sun)(?:day)?"
+_ORD = r"(?:st|nd|rd|th)?"
+
+# matched against lowercased text
+DEADLINE_RE = re.compile(rf"""
+    \b(?:
+        (?:by|before|until|till|due(?:\s+(?:on|by))?|no\s+later\s+than|deadline(?:\s+is)?:?)\s+
+        (?:the\s+)?
+        (?:
+            (?P<iso>\d{{4}}-\d{{2}}-\d{{2}})
+          | (?P<md_month>{_MONTH})\s+(?P<md_day>\d{{1,2}}){_ORD}
+          | (?P<dm_day>\d{{1,2}}){_ORD}\s+(?:of\s+)?(?P<dm_month>{_MONTH})
+          | (?P<part>mid-?|early\s+|late\s+|end\s+of\s+)?(?P<month>{_MONTH})
+          | (?P<which>next\s+|this\s+)?(?P<weekday>{_WEEKDAY})
+          | (?P<ordinal>\d{{1,2}})(?:st|nd|rd|th)
+          | (?P<week>next|this)\s+week
+          | (?P<quarter>q[1-4])
+          | end\s+of\s+(?:the\s+)?(?P<period>day|week|month|quarter|year|sprint)
+          | (?P<rel>today|tonight|tomorrow|eod|eow|eom)
+        )
+      | (?P<bare>today|tonight|tomorrow|eod)
+    )\b
+""", re.VERBOSE)
+
+_PREFIX_RE = re.compile(r"^(?:by|before|until|till|due|no\s+later\s+than)\s+")
+
+
+# ---------------------------------------------------------
+# calendar helpers
+# ---------------------------------------------------------
+def _month_end(year, month):
+    return datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _friday(day):
+    # Friday of `day`'s week, or `day` itself on a weekend
+    return max(day, day + datetime.timedelta(days=4 - day.weekday()))
+
+
+def _upcoming(day, reference):
+    # a month/day already passed this year means next year
+    return day if day >= reference else day.replace(year=day.year + 1)
+
+
+def _resolve(m, ref):
+    g = m.groupdict()
+    one_day = datetime.timedelta(days=1)
+
+    if g["iso"]:
+        return datetime.date.fromisoformat(g["iso"])
+
+    if g["md_month"] or g["dm_month"]:
+        month = MONTHS[(g["md_month"] or g["dm_month"])[:3]]
+        day = int(g["md_day"] or g["dm_day"])
+        return _upcoming(datetime.date(ref.year, month, day), ref)
+
+    if g["month"]:
+        month = MONTHS[g["month"][:3]]
+        part = (g["part"] or "").strip(" -")
+
+        if part == "mid":
+            day = datetime.date(ref.year, month, 15)
+        elif part in ("late", "end of"):
+            day = _month_end(ref.year, month)
+        else:
+            day = datetime.date(ref.year, month, 1)
+
+        return day if _month_end(ref.year, month) >= ref else day.replace(year=ref.year + 1)
+
+    if g["weekday"]:
+        wd = WEEKDAYS[g["weekday"][:3]]
+        which = (g["which"] or "").strip()
+        monday = ref - datetime.timedelta(days=ref.weekday())
+
+        if which == "next":
+            return monday + datetime.timedelta(days=7 + wd)
+        if which == "this" and monday + datetime.timedelta(days=wd) >= ref:
+            return monday + datetime.timedelta(days=wd)
+
+        # strictly after the reference day
+        return ref + datetime.timedelta(days=(wd - ref.weekday() - 1) % 7 + 1)
+
+    if g["ordinal"]:
+        day = int(g["ordinal"])
+        year, month = ref.year, ref.month
+        if day < ref.day:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return datetime.date(year, month, day)
+
+    if g["week"]:
+        friday = _friday(ref)
+        return friday + datetime.timedelta(days=7) if g["week"] == "next" else friday
+
+    if g["quarter"]:
+        q = int(g["quarter"][1])
+        day = _month_end(ref.year, 3 * q)
+        return day if day >= ref else day.replace(year=ref.year + 1)
+
+    period = g["period"]
+    rel = g["rel"] or g["bare"]
+
+    if period == "day" or rel in ("today", "tonight", "eod"):
+        return ref
+    if rel == "tomorrow":
+        return ref + one_day
+    if period == "week" or rel == "eow":
+        return _friday(ref)
+    if period == "month" or rel == "eom":
+        return _month_end(ref.year, ref.month)
+    if period == "quarter":
+        return _month_end(ref.year, 3 * ((ref.month - 1) // 3 + 1))
+    if period == "year":
+        return datetime.date(ref.year, 12, 31)
+
+    return None
+
+
+def parse_deadline(text, reference=None, lower=None):
+    """
+    First deadline in `text` as "YYYY-MM-DD", the bare phrase
+    when it has no date ("end of sprint"), or "" if none.
+    `lower` may pass text.lower() when the caller already has it.
+    """
+    m = DEADLINE_RE.search(lower if lower is not None else text.lower())
+    if m is None:
+        return ""
+
+    return normalize_deadline(m.group(), reference or datetime.date.today())
+
+
+@lru_cache(maxsize=4096)
+def normalize_deadline(phrase, reference):
+    """
+    One matched phrase → ISO date or bare phrase (few distinct
+    phrases per meeting, so this is mostly cache hits).
+    """
+    m = DEADLINE_RE.match(phrase)
+
+    try:
+        day = _resolve(m, reference)
+    except ValueError:          # "Feb 30th", "the 31st" in a short month
+        day = None
+
+    if day is None:
+        return _PREFIX_RE.sub("", phrase)
+
+    return day.isoformat()
@@ -0,0 +1,303 @@
+# =========================================================
+# Backend/decoder.py
+# Audio decoding for the ASR pipeline
+#   soundfile → WAV (any PCM width, float), FLAC, OGG
+#   wave      → PCM WAV (8/16/24/32-bit) without soundfile
+#   ffmpeg    → anything else (mp3, m4a, aac, ...) when on PATH
+# Every decoder streams mono float32 blocks at its own rate:
+# samples are converted straight into float32 buffers and
+# N channels are averaged in one vectorized reduce.
+# =========================================================
+
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+
+import numpy as np
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):      # OSError: libsndfile missing
+    sf = None
+
+
+FFMPEG = shutil.which("ffmpeg")
+
+# ffmpeg decodes and resamples in one go; whisper's rate
+FFMPEG_SAMPLERATE = 16000
+
+FEED_BLOCK = 1 << 20
+
+# bytes of ffmpeg's stderr (the end) quoted in decode errors
+ERR_TAIL = 4096
+
+# libsndfile 1.2 returns corrupt samples when MP3 is read in
+# blocks (a single whole-file read is fine); stream these
+# through ffmpeg instead, headers are still read for probe()
+BLOCK_UNSAFE = {"MP3"}
+
+
+def _rewind(src):
+    if hasattr(src, "seek"):
+        src.seek(0)
+    return src
+
+
+def downmix(frames):
+    """
+    (frames, channels) float32 → mono, averaged over channels.
+    """
+    if frames.ndim == 1:
+        return frames
+
+    mono = frames.sum(axis=1, dtype=np.float32)
+    mono *= np.float32(1.0 / frames.shape[1])
+    return mono
+
+
+def pcm_to_float(raw, width):
+    """
+    Little-endian PCM bytes (width 1–4) → float32 in [-1, 1).
+    """
+    if width == 1:
+        # 8-bit WAV is unsigned
+        x = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+        x -= 128.0
+        x *= np.float32(1 / 128)
+        return x
+
+    if width == 3:
+        # widen to int32 (low byte zero), shift back keeping the sign
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        wide = np.zeros((len(b), 4), dtype=np.uint8)
+        wide[:, 1:] = b
+        ints = wide.view("<i4").ravel()
+        ints >>= 8
+        x = ints.astype(np.float32)
+        x *= np.float32(1 / (1 << 23))
+        return x
+
+    dtype = {2: "<i2", 4: "<i4"}.get(width)
+    if dtype is None:
+        raise ValueError(f"Unsupported PCM sample width: {width} bytes")
+
+    x = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    x *= np.float32(1 / (1 << (8 * width - 1)))
+    return x
+
+
+def read_pcm_blocks(wf, block_frames):
+    """
+    Mono float32 blocks from an open `wave` reader.
+    """
+    channels = wf.getnchannels()
+    width = wf.getsampwidth()
+
+    while True:
+        raw = wf.readframes(block_frames)
+        if not raw:
+            break
+
+        block = pcm_to_float(raw, width)
+        if channels > 1:
+            block = downmix(block.reshape(-1, channels))
+
+        yield block
+
+
+# =========================================================
+# Decoders
+# =========================================================
+class Decoder:
+    """
+    samplerate / channels of the source, `frames` if the
+    container says (None otherwise); blocks() yields mono float32.
+    """
+
+    format = None
+    samplerate = None
+    channels = None
+    frames = None
+
+    def blocks(self, block_frames):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SoundFileDecoder(Decoder):
+
+    def __init__(self, src):
+        self._f = sf.SoundFile(_rewind(src))
+        self.format = self._f.format
+        self.samplerate = self._f.samplerate
+        self.channels = self._f.channels
+        self.frames = self._f.frames if self._f.seekable() else None
+
+    def blocks(self, block_frames):
+        if self.channels == 1:
+            while True:
+                block = self._f.read(block_frames, dtype="float32")
+                if not len(block):
+                    break
+                yield block
+            return
+
+        # libsndfile converts into one reused interleaved buffer;
+        # only the downmixed block is new memory
+        buf = np.empty((block_frames, self.channels), dtype=np.float32)
+
+        while True:
+            frames = self._f.read(out=buf)
+            if not len(frames):
+                break
+            yield downmix(frames)
+
+    def close(self):
+        self._f.close()
+
+
+class WaveDecoder(Decoder):
+
+    def __init__(self, src):
+        self._wf = wave.open(_rewind(src), "rb")
+        self.format = "WAV"
+        self.samplerate = self._wf.getframerate()
+        self.channels = self._wf.getnchannels()
+        self.frames = self._wf.getnframes()
+
+    def blocks(self, block_frames):
+        return read_pcm_blocks(self._wf, block_frames)
+
+    def close(self):
+        self._wf.close()
+
+
+class FFmpegDecoder(Decoder):
+    """
+    ffmpeg subprocess writing mono float32 at FFMPEG_SAMPLERATE
+    to a pipe; file objects are fed through stdin. stderr goes to
+    a temp file, so however much ffmpeg warns it never blocks on
+    a pipe nobody reads while stdout is being drained.
+    """
+
+    def __init__(self, src, samplerate=FFMPEG_SAMPLERATE):
+        if FFMPEG is None:
+            raise ValueError("ffmpeg is not installed")
+
+        self.samplerate = samplerate
+        self.channels = 1
+        self._src = src if hasattr(src, "read") else None
+        self._err = tempfile.TemporaryFile()
+
+        cmd = [
+            FFMPEG, "-v", "error",
+            "-i", "pipe:0" if self._src is not None else str(src),
+            "-f", "f32le", "-ac", "1", "-ar", str(samplerate), "pipe:1",
+        ]
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if self._src is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=self._err,
+        )
+
+        if self._src is not None:
+            self._feeder = threading.Thread(target=self._feed, daemon=True)
+            self._feeder.start()
+
+    def _feed(self):
+        try:
+            _rewind(self._src)
+            for block in iter(lambda: self._src.read(FEED_BLOCK), b""):
+                self._proc.stdin.write(block)
+        except (BrokenPipeError, ValueError):
+            pass                            # ffmpeg stopped early / closed
+        finally:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    def blocks(self, block_frames):
+        size = 4 * block_frames
+
+        while True:
+            raw = self._proc.stdout.read(size)
+            if not raw:
+                break
+            yield np.frombuffer(raw, dtype="<f4")
+
+        if self._proc.wait() != 0:
+            size = self._err.seek(0, 2)
+            self._err.seek(max(0, size - ERR_TAIL))
+            err = self._err.read().decode(errors="replace").strip()
+            raise ValueError(f"ffmpeg could not decode the audio: {err}")
+
+    def close(self):
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+        self._proc.stdout.close()
+        self._err.close()
+
+
+def _open_container(src):
+    # decoders that read the header themselves; None if neither can
+    try:
+        return SoundFileDecoder(src) if sf is not None else WaveDecoder(src)
+    except (RuntimeError, wave.Error, EOFError):     # sf.LibsndfileError is a RuntimeError
+        return None
+
+
+def open_audio(src):
+    """
+    Decoder for a path or a seekable binary file object.
+    """
+    dec = _open_container(src)
+    if dec is not None:
+        if dec.format not in BLOCK_UNSAFE:
+            return dec
+        dec.close()
+
+    if FFMPEG is not None:
+        return FFmpegDecoder(src)
+
+    raise ValueError(
+        "Unsupported audio format: install ffmpeg for mp3/m4a/aac and "
+        "other formats libsndfile cannot stream"
+    )
+
+
+def probe(src):
+    """
+    (samplerate, frames) from the header without decoding, or
+    None when unknown (formats only ffmpeg reads).
+    """
+    dec = _open_container(src)
+    if dec is None:
+        return None
+
+    with dec:
+        info = (dec.samplerate, dec.frames) if dec.frames is not None else None
+
+    _rewind(src)
+    return info
+
+
+def duration(src):
+    """
+    Length in seconds, 0.0 if the header does not say.
+    """
+    info = probe(src)
+    return info[1] / info[0] if info else 0.0
@@ -0,0 +1,93 @@
+# =========================================================
+# Backend/document.py
+# Tokenize-once representation of a normalized transcript
+# - sentences: one per line of the normalized text
+# - offsets:   start of each sentence in `text` (int64 array)
+# - tokens:    word ids per sentence, CSR style (int32 arrays)
+# - vocab:     word → id, in order of first appearance
+# Every F_llm stage reads from one Document: keyword tagging
+# uses the offsets, the summarizer builds its sparse term
+# matrix from the token ids without re-tokenizing.
+# =========================================================
+
+import numpy as np
+from scipy import sparse
+
+from Backend.summarizer import WORD_RE, weight
+
+
+class Document:
+
+    __slots__ = ("text", "sentences", "starts", "token_ids", "token_ptr", "vocab")
+
+    def __init__(self, text):
+        """
+        `text` is normalized text (normalize_text's output).
+        """
+        self.text = text
+        self.sentences = text.split("\n")
+
+        lengths = np.fromiter(map(len, self.sentences), dtype=np.int64, count=len(self.sentences))
+        self.starts = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1] + 1, out=self.starts[1:])
+
+        vocab = {}
+        ids = []
+        ptr = [0]
+
+        for s in self.sentences:
+            ids.extend([vocab.setdefault(w, len(vocab)) for w in WORD_RE.findall(s.lower())])
+            ptr.append(len(ids))
+
+        self.token_ids = np.array(ids, dtype=np.int32)
+        self.token_ptr = np.array(ptr, dtype=np.int64)
+        self.vocab = vocab
+
+    def __len__(self):
+        return len(self.sentences)
+
+    def tokens(self, i):
+        return self.token_ids[self.token_ptr[i]:self.token_ptr[i + 1]]
+
+    def sentence_at(self, positions):
+        """
+        Sentence index for each character offset in `text`.
+        """
+        return np.searchsorted(self.starts, positions, side="right") - 1
+
+    def nbytes(self):
+        """
+        Bytes held by the arrays (the text / sentence strings aside).
+        """
+        return self.starts.nbytes + self.token_ids.nbytes + self.token_ptr.nbytes
+
+    def term_matrix(self, rows=None):
+        """
+        Weighted sentence x term CSR for `rows` (default: all),
+        equal to summarizer.term_matrix of those sentences:
+        columns are numbered by first appearance within the rows.
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        rows = np.asarray(rows, dtype=np.int64)
+
+        lo, hi = self.token_ptr[rows], self.token_ptr[rows + 1]
+        counts = hi - lo
+
+        # token positions of the selected rows, concatenated
+        take = np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        ids = self.token_ids[take]
+
+        # renumber columns in order of first appearance
+        uniq, first = np.unique(ids, return_index=True)
+        cols = np.empty(len(uniq), dtype=np.int32)
+        cols[np.argsort(first, kind="stable")] = np.arange(len(uniq), dtype=np.int32)
+        cols = cols[np.searchsorted(uniq, ids)]
+
+        x = sparse.csr_matrix(
+            (np.ones(len(ids), dtype=np.float32), (np.repeat(np.arange(len(rows)), counts), cols)),
+            shape=(len(rows), len(uniq))
+        )
+        x.sum_duplicates()
+
+        return weight(x)
@@ -0,0 +1,209 @@
+# =========================================================
+# Backend/jobs.py
+# In-process job queue for /jobs
+# bounded worker pool + shortest-job-first scheduling with aging
+# =========================================================
+
+import heapq
+import itertools
+import os
+import threading
+import time
+import traceback
+import uuid
+
+from Backend.decoder import duration
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# seconds of audio a queued job is credited per second it waits,
+# so a long recording overtakes newer short ones after
+# (its length - theirs) / JOB_AGING seconds instead of starving
+JOB_AGING = float(os.environ.get("JOB_AGING", "1.0"))
+
+
+def audio_duration(path):
+    """
+    Duration in seconds from the file header (no decoding).
+    Unknown formats count as 0 so they are not starved.
+    """
+    try:
+        return duration(path)
+    except OSError:
+        return 0.0
+
+
+class Job:
+    def __init__(self, payload, cost=0.0):
+        self.id = uuid.uuid4().hex
+        self.payload = payload
+        self.cost = cost                # seconds of audio → SJF priority
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    def info(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "audio_seconds": self.cost,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "error": self.error,
+        }
+
+
+# =========================================================
+# Backends
+# a backend owns ordering + job storage; swap it for a
+# shared store (redis, db) without touching the workers
+# =========================================================
+class QueueBackend:
+
+    def push(self, job):
+        raise NotImplementedError
+
+    def pop(self, timeout=None):
+        """
+        Next job to run, or None after `timeout` seconds.
+        """
+        raise NotImplementedError
+
+    def get(self, job_id):
+        raise NotImplementedError
+
+    def save(self, job):
+        raise NotImplementedError
+
+    def depth(self):
+        raise NotImplementedError
+
+
+class InMemoryBackend(QueueBackend):
+    """
+    Heap ordered by aged cost, then submission order: short
+    standups run before a two-hour all-hands queued earlier, but
+    every second of waiting takes `aging` seconds off a job's cost.
+    cost - aging * (now - submitted) ranks jobs the same as
+    cost + aging * submitted, so the heap key never changes.
+    Finished jobs are kept up to `max_jobs`, oldest dropped first.
+    """
+
+    def __init__(self, max_jobs=1000, aging=JOB_AGING, clock=time.monotonic):
+        self.max_jobs = max_jobs
+        self.aging = aging
+        self.clock = clock
+        self._heap = []
+        self._jobs = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def push(self, job):
+        with self._cond:
+            self._jobs[job.id] = job
+            key = job.cost + self.aging * self.clock()
+            heapq.heappush(self._heap, (key, next(self._seq), job.id))
+            self._trim()
+            self._cond.notify()
+
+    def pop(self, timeout=None):
+        with self._cond:
+            if not self._heap:
+                self._cond.wait(timeout)
+            if not self._heap:
+                return None
+
+            _, _, job_id = heapq.heappop(self._heap)
+            return self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def save(self, job):
+        with self._cond:
+            self._jobs[job.id] = job
+
+    def depth(self):
+        with self._cond:
+            return len(self._heap)
+
+    def _trim(self):
+        if len(self._jobs) <= self.max_jobs:
+            return
+
+        finished = sorted(
+            (j for j in self._jobs.values() if j.status in (DONE, FAILED)),
+            key=lambda j: j.finished
+        )
+        for j in finished[:len(self._jobs) - self.max_jobs]:
+            del self._jobs[j.id]
+
+
+# =========================================================
+# Queue + workers
+# =========================================================
+class JobQueue:
+    """
+    `handler(job) -> result` runs on `workers` threads.
+    """
+
+    def __init__(self, handler, workers=2, backend=None):
+        self.handler = handler
+        self.workers = workers
+        self.backend = backend or InMemoryBackend()
+
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    def submit(self, payload, cost=0.0):
+        job = Job(payload, cost)
+        self.backend.push(job)
+        return job
+
+    def get(self, job_id):
+        return self.backend.get(job_id)
+
+    def depth(self):
+        return self.backend.depth()
+
+    def _run(self):
+        while not self._stop.is_set():
+            job = self.backend.pop(timeout=0.5)
+            if job is None:
+                continue
+
+            job.status = RUNNING
+            job.started = time.time()
+            self.backend.save(job)
+
+            try:
+                job.result = self.handler(job)
+                job.status = DONE
+            except Exception as e:
+                print(traceback.format_exc())
+                job.error = str(e)
+                job.status = FAILED
+
+            job.finished = time.time()
+            self.backend.save(job)
@@ -0,0 +1,298 @@
+# =========================================================
+# Backend/metrics.py
+# Per-stage latency / memory spans + counters, rendered in
+# Prometheus text format for GET /metrics (no client library)
+#
+#   with metrics.span("asr"):
+#       ...
+#
+# MEETING_METRICS=0 turns every call into a no-op (one global
+# check + a shared null context). Metrics are per process:
+# pool workers (transcribe_parallel, Backend.batch) keep their own.
+# =========================================================
+
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("MEETING_METRICS", "1") == "1"
+
+PREFIX = "meeting_"
+
+SECONDS_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 30, 60, 120, 300, 600,
+)
+
+# 1 MB .. 4 GB
+BYTES_BUCKETS = tuple(float(1 << s) for s in range(20, 33, 2))
+
+RTF_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5)
+
+_NULL = nullcontext()
+
+
+# ---------------------------------------------------------
+# Process memory (cheap enough to read around every stage)
+# ---------------------------------------------------------
+try:
+    _PAGE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE = 4096
+
+
+def rss_bytes():
+    """
+    Current resident set size, 0 where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    # KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+# =========================================================
+# Metric types
+# =========================================================
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{v}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _num(v):
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, *labels):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [
+                (self.name, self.labelnames, labels, v)
+                for labels, v in sorted(self._values.items())
+            ]
+
+
+class Gauge(Counter):
+    """
+    Set directly, or read from `fn()` at scrape time.
+    """
+    kind = "gauge"
+
+    def __init__(self, name, help, labels=(), fn=None):
+        super().__init__(name, help, labels)
+        self.fn = fn
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        if self.fn is not None:
+            return [(self.name, (), (), self.fn())]
+        return super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=SECONDS_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}       # labels → [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        i = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+
+            if i < len(self.buckets):
+                series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        out = []
+        names = self.labelnames + ("le",)
+
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, c in zip(self.buckets, counts):
+                    cumulative += c
+                    out.append((self.name + "_bucket", names, labels + (bound,), cumulative))
+                out.append((self.name + "_bucket", names, labels + (float("inf"),), count))
+                out.append((self.name + "_sum", self.labelnames, labels, total))
+                out.append((self.name + "_count", self.labelnames, labels, count))
+
+        return out
+
+
+# =========================================================
+# Registry
+# =========================================================
+class Registry:
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self):
+        """
+        Prometheus text exposition format (version 0.0.4).
+        """
+        lines = []
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for m in metrics:
+            lines.append(f"# HELP {m.name} {m.help}")
+            lines.append(f"# TYPE {m.name} {m.kind}")
+
+            for name, names, labels, value in m.samples():
+                lines.append(f"{name}{_labels(names, (_num(v) for v in labels))} {_num(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def counter(name, help, labels=()):
+    return registry.register(Counter(PREFIX + name, help, labels))
+
+
+def gauge(name, help, labels=(), fn=None):
+    return registry.register(Gauge(PREFIX + name, help, labels, fn))
+
+
+def histogram(name, help, labels=(), buckets=SECONDS_BUCKETS):
+    return registry.register(Histogram(PREFIX + name, help, labels, buckets))
+
+
+def render():
+    return registry.render()
+
+
+# ---------------------------------------------------------
+# Built-in metrics
+# ---------------------------------------------------------
+STAGE_SECONDS = histogram("stage_seconds", "Wall time per pipeline stage", ("stage",))
+STAGE_MEMORY = histogram(
+    "stage_memory_bytes", "Resident memory growth per pipeline stage",
+    ("stage",), BYTES_BUCKETS
+)
+STAGE_ERRORS = counter("stage_errors_total", "Pipeline stages that raised", ("stage",))
+
+AUDIO_SECONDS = counter("audio_seconds_total", "Seconds of audio transcribed")
+SPEECH_SECONDS = counter("speech_seconds_total", "Seconds of audio sent to ASR after VAD")
+REALTIME_FACTOR = histogram(
+    "asr_realtime_factor", "Transcription wall time / audio duration", (), RTF_BUCKETS
+)
+CACHE_LOOKUPS = counter("cache_lookups_total", "Transcript cache lookups", ("result",))
+
+gauge("process_resident_memory_bytes", "Current resident memory", fn=rss_bytes)
+gauge("process_peak_resident_memory_bytes", "Peak resident memory", fn=peak_rss_bytes)
+
+
+# =========================================================
+# Instrumentation helpers
+# =========================================================
+def span(stage):
+    """
+    Context manager timing `stage` and its RSS growth.
+    """
+    if not ENABLED:
+        return _NULL
+    return _span(stage)
+
+
+@contextmanager
+def _span(stage):
+    rss = rss_bytes()
+    start = time.perf_counter()
+
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(1, stage)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage)
+        STAGE_MEMORY.observe(max(0, rss_bytes() - rss), stage)
+
+
+def observe(stage, seconds):
+    """
+    Record a stage whose time was measured elsewhere.
+    """
+    if ENABLED:
+        STAGE_SECONDS.observe(seconds, stage)
+
+
+def inc(metric, amount=1, *labels):
+    if ENABLED:
+        metric.inc(amount, *labels)
+
+
+class TimedIter:
+    """
+    Wraps a (lazy) iterable and adds up the time spent producing
+    items — separates decode time from the consumer's time when
+    the two are pipelined through one generator.
+    """
+
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self._it)
+        finally:
+            self.seconds += time.perf_counter() - start
@@ -0,0 +1,205 @@
+# =========================================================
+# Backend/uploads.py
+# Chunked, resumable uploads for /uploads
+#   init → append chunks (each with a sha256) → complete
+# chunks are streamed to disk, so server memory per upload
+# stays O(read size); the acknowledged offset is simply the
+# file size, which survives a dropped connection or restart
+# =========================================================
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from fastapi.concurrency import run_in_threadpool
+
+from Backend.cache import hash_file
+
+
+# largest chunk accepted by one append
+MAX_CHUNK_BYTES = int(os.environ.get("UPLOAD_MAX_CHUNK_BYTES", str(16 << 20)))
+
+# chunk size suggested to clients
+CHUNK_BYTES = int(os.environ.get("UPLOAD_CHUNK_BYTES", str(4 << 20)))
+
+# unfinished uploads idle this long are removed
+UPLOAD_TTL = int(os.environ.get("UPLOAD_TTL", str(24 * 3600)))
+
+DATA = "data"
+META = "meta.json"
+
+
+class UploadError(Exception):
+    """
+    Rejected upload request; `status` is the HTTP status to send.
+    """
+
+    def __init__(self, message, status=400, **info):
+        super().__init__(message)
+        self.status = status
+        self.info = info
+
+
+class UploadStore:
+    """
+    One directory per upload under `root`: the bytes received
+    so far (`data`) and the init metadata (`meta.json`).
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._busy = set()
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # paths / metadata
+    # -----------------------------------------------------
+    def _dir(self, upload_id):
+        # ids are uuid4 hex; anything else could escape root
+        if len(upload_id) != 32 or not all(c in "0123456789abcdef" for c in upload_id):
+            raise UploadError("Unknown upload", 404)
+        return os.path.join(self.root, upload_id)
+
+    def path(self, upload_id):
+        return os.path.join(self._dir(upload_id), DATA)
+
+    def meta(self, upload_id):
+        try:
+            with open(os.path.join(self._dir(upload_id), META)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise UploadError("Unknown upload", 404) from None
+
+    def offset(self, upload_id):
+        return os.path.getsize(self.path(upload_id))
+
+    def info(self, upload_id):
+        meta = self.meta(upload_id)
+        offset = self.offset(upload_id)
+
+        return {
+            "upload_id": upload_id,
+            "filename": meta["filename"],
+            "size": meta["size"],
+            "offset": offset,
+            "complete": meta["size"] is not None and offset == meta["size"],
+            "chunk_size": CHUNK_BYTES,
+        }
+
+    # -----------------------------------------------------
+    # lifecycle
+    # -----------------------------------------------------
+    def create(self, filename="", size=None):
+        self.sweep()
+
+        upload_id = uuid.uuid4().hex
+        d = os.path.join(self.root, upload_id)
+        os.makedirs(d)
+
+        open(os.path.join(d, DATA), "wb").close()
+        with open(os.path.join(d, META), "w") as f:
+            json.dump({"filename": filename or "", "size": size, "created": time.time()}, f)
+
+        return self.info(upload_id)
+
+    async def append(self, upload_id, offset, blocks, checksum):
+        """
+        Write `blocks` (async iterable of bytes, e.g. the request
+        body stream) at `offset`, which must equal the bytes already
+        received. The chunk is kept only if its sha256 matches
+        `checksum`; otherwise the file is cut back and the client
+        resends from the same offset.
+        """
+        path = self.path(upload_id)
+        meta = self.meta(upload_id)
+
+        with self._lock:
+            if upload_id in self._busy:
+                raise UploadError("Upload busy", 409)
+            self._busy.add(upload_id)
+
+        try:
+            # body blocks arrive on the event loop; every file
+            # operation runs in the threadpool so the loop never blocks
+            current = await run_in_threadpool(os.path.getsize, path)
+            if offset != current:
+                raise UploadError("Offset mismatch", 409, offset=current)
+
+            h = hashlib.sha256()
+            written = 0
+
+            f = await run_in_threadpool(open, path, "r+b")
+            try:
+                await run_in_threadpool(f.seek, current)
+
+                try:
+                    async for block in blocks:
+                        written += len(block)
+                        if written > MAX_CHUNK_BYTES:
+                            raise UploadError("Chunk too large", 413, max_chunk=MAX_CHUNK_BYTES)
+                        if meta["size"] is not None and current + written > meta["size"]:
+                            raise UploadError("Chunk exceeds declared size", 400, offset=current)
+
+                        h.update(block)
+                        await run_in_threadpool(f.write, block)
+
+                    if h.hexdigest() != checksum.lower():
+                        raise UploadError("Checksum mismatch", 422, offset=current)
+
+                except BaseException:
+                    # partial or corrupt chunk: back to the last acked offset
+                    await run_in_threadpool(f.truncate, current)
+                    raise
+            finally:
+                await run_in_threadpool(f.close)
+
+            await run_in_threadpool(os.utime, os.path.join(self._dir(upload_id), META))
+            return current + written
+
+        finally:
+            with self._lock:
+                self._busy.discard(upload_id)
+
+    def complete(self, upload_id, sha256=None):
+        """
+        Check the upload is whole (and matches `sha256` if given);
+        return the path of the assembled file.
+        """
+        meta = self.meta(upload_id)
+        path = self.path(upload_id)
+        offset = os.path.getsize(path)
+
+        if meta["size"] is not None and offset != meta["size"]:
+            raise UploadError("Upload incomplete", 409, offset=offset, size=meta["size"])
+
+        if sha256:
+            if hash_file(path) != sha256.lower():
+                raise UploadError("File checksum mismatch", 422, offset=offset)
+
+        return path
+
+    def discard(self, upload_id):
+        shutil.rmtree(self._dir(upload_id), ignore_errors=True)
+
+    def sweep(self, ttl=UPLOAD_TTL):
+        """
+        Remove uploads with no activity for `ttl` seconds.
+        """
+        cutoff = time.time() - ttl
+
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return
+
+        for name in names:
+            meta = os.path.join(self.root, name, META)
+            try:
+                if os.path.getmtime(meta) < cutoff:
+                    shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+            except OSError:
+                pass
@@ -1,68 +1,171 @@
-import streamlit as st
-import requests
-
-API = "http://localhost:8000"
-
-st.set_page_config(layout="wide")
-st.title("📊 AI Meeting Insight Generator")
-
-title = st.text_input("Meeting Title")
-
-meeting_type = st.selectbox(
-    "Meeting Type",
-    ["standup", "planning", "review", "discussion"]
-)
-
-# Option 1: Paste transcript
-transcript = st.text_area("Paste transcript", height=300)
-
-# Option 2: Upload audio file
-audio_file = st.file_uploader("Upload meeting audio", type=["mp3", "wav", "m4a"])
-
-
-def display(insights):
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("Summary")
-        st.write(insights.get("summary", ""))
-
-        st.subheader("Key Points")
-        for k in insights.get("key_points", []):
-            st.write("•", k)
-
-    with col2:
-        st.subheader("Decisions")
-        for d in insights.get("decisions", []):
-            st.write("•", d)
-
-        st.subheader("Action Items")
-        for a in insights.get("action_items", []):
-            if isinstance(a, dict):
-                st.write(f"• {a.get('task','')} — {a.get('owner','')}")
-            else:
-                st.write(f"• {a}")
-
-
-if st.button("Generate Insights"):
-    # Always call /process
-    if audio_file is not None:
-        # Send audio file
-        files = {"audio": audio_file}
-        data = {"title": title, "meeting_type": meeting_type}
-        res = requests.post(API + "/process", data=data, files=files)
-    else:
-        # Send transcript text
-        data = {"transcript": transcript, "title": title, "meeting_type": meeting_type}
-        res = requests.post(API + "/process", data=data)
-
-    st.write("Status:", res.status_code)
-
-    if res.status_code == 200:
-        result = res.json()
-        display(result["insights"])
-
-        with open(result["pdf_path"], "rb") as f:
-            st.download_button("Download PDF", f, "meeting_report.pdf")
-    else:
-        st.error(res.text)
+import streamlit as st
+import hashlib
+import json
+import requests
+
+API = "http://localhost:8000"
+
+# attempts per chunk before giving up on an upload
+UPLOAD_RETRIES = 5
+
+st.set_page_config(layout="wide")
+st.title("📊 AI Meeting Insight Generator")
+
+title = st.text_input("Meeting Title")
+
+meeting_type = st.selectbox(
+    "Meeting Type",
+    ["standup", "planning", "review", "discussion"]
+)
+
+
+@st.cache_data(ttl=300)
+def engine_names():
+    try:
+        return list(requests.get(API + "/engines", timeout=10).json()["engines"])
+    except requests.RequestException:
+        return []
+
+
+# "auto" lets the server pick per meeting type
+engine = st.selectbox("Transcription Engine", ["auto"] + engine_names())
+
+# Option 1: Paste transcript
+transcript = st.text_area("Paste transcript", height=300)
+
+# Option 2: Upload audio file
+audio_file = st.file_uploader("Upload meeting audio", type=["wav", "flac", "ogg", "mp3", "m4a"])
+
+
+def upload_audio(f, progress=None):
+    """
+    Send `f` through the chunked /uploads API and return the
+    upload id. A failed chunk is retried from the offset the
+    server last acknowledged, so a dropped connection only
+    costs that chunk.
+    """
+    size = f.size
+    res = requests.post(API + "/uploads", data={"filename": f.name, "size": size})
+    res.raise_for_status()
+
+    info = res.json()
+    upload_id, chunk_size = info["upload_id"], info["chunk_size"]
+    offset, failures = 0, 0
+
+    while offset < size:
+        f.seek(offset)
+        chunk = f.read(chunk_size)
+
+        try:
+            res = requests.put(
+                f"{API}/uploads/{upload_id}",
+                params={"offset": offset},
+                data=chunk,
+                headers={"X-Chunk-SHA256": hashlib.sha256(chunk).hexdigest()},
+                timeout=60,
+            )
+            if res.status_code == 200:
+                offset, failures = res.json()["offset"], 0
+                if progress:
+                    progress.progress(offset / size, f"Uploading… {offset >> 20} / {size >> 20} MB")
+                continue
+        except requests.RequestException:
+            pass
+
+        failures += 1
+        if failures > UPLOAD_RETRIES:
+            raise RuntimeError("Upload failed, please try again")
+
+        # resume from whatever the server actually kept
+        status = requests.get(f"{API}/uploads/{upload_id}", timeout=30)
+        status.raise_for_status()
+        offset = status.json()["offset"]
+
+    return upload_id
+
+
+def display(insights):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Summary")
+        st.write(insights.get("summary", ""))
+
+        st.subheader("Key Points")
+        for k in insights.get("key_points", []):
+            st.write("•", k)
+
+    with col2:
+        st.subheader("Decisions")
+        for d in insights.get("decisions", []):
+            st.write("•", d)
+
+        st.subheader("Action Items")
+        for a in insights.get("action_items", []):
+            if isinstance(a, dict):
+                line = f"• {a.get('task','')} — {a.get('owner','')}"
+                if a.get("deadline"):
+                    line += f" — ⏰ {a['deadline']}"
+                st.write(line)
+            else:
+                st.write(f"• {a}")
+
+
+def stream_events(res):
+    """
+    Yield (event, data) from a text/event-stream response.
+    """
+    event, data = "message", []
+
+    for line in res.iter_lines(decode_unicode=True):
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].strip())
+
+
+if st.button("Generate Insights"):
+    data = {"title": title, "meeting_type": meeting_type}
+    if engine != "auto":
+        data["engine"] = engine
+
+    # audio → chunked /uploads, transcript as a form field
+    if audio_file is not None:
+        data["upload_id"] = upload_audio(audio_file, st.progress(0.0, "Uploading…"))
+    else:
+        data["transcript"] = transcript
+
+    # partial transcript shows up as each chunk is decoded
+    progress = st.progress(0.0, "Transcribing…") if audio_file is not None else None
+    partial = st.empty()
+    texts = []
+    result = None
+
+    res = requests.post(API + "/process/stream", data=data, stream=True)
+
+    if res.status_code != 200:
+        st.error(res.text)
+        st.stop()
+
+    for event, payload in stream_events(res):
+        if event == "transcript":
+            texts.append(payload["text"])
+            partial.text_area("Transcript (live)", " ".join(texts), height=200)
+        elif event == "progress" and progress is not None:
+            progress.progress(payload["percent"] / 100, f"Transcribing… {payload['percent']:.0f}%")
+        elif event == "insights":
+            result = payload
+        elif event == "error":
+            st.error(payload["error"])
+
+    if result is not None:
+        if progress is not None:
+            progress.progress(1.0, "Done")
+        display(result["insights"])
+
+        pdf = requests.get(API + result["pdf_url"])
+        st.download_button("Download PDF", pdf.content, "meeting_report.pdf")
@@ -1,183 +1,255 @@
-# =========================================================
-# Streamlit Frontend — Production UI
-# =========================================================
-
-import streamlit as st
-import os
-
-from Backend.A_STT import transcribe_audio
-from Backend.F_llm import generate_insights
-from Backend.D_pdf_export import generate_pdf
-
-
-# ---------------------------------------------------------
-# Page config
-# ---------------------------------------------------------
-st.set_page_config(
-    page_title="Meeting Insight Generator",
-    page_icon="📊",
-    layout="wide"
-)
-
-st.title("📊 AI Meeting Insight Generator")
-st.caption("Turn meetings into summaries, decisions, and action items instantly")
-
-
-# =========================================================
-# Sidebar controls
-# =========================================================
-with st.sidebar:
-    st.header("⚙️ Settings")
-
-    title = st.text_input("Meeting Title", "Weekly Sync")
-    meeting_type = st.selectbox(
-        "Meeting Type",
-        ["discussion", "standup", "planning", "review"]
-    )
-
-    st.divider()
-
-    st.info(
-        "Tips:\n"
-        "- Paste transcript for fastest results\n"
-        "- WAV audio works best\n"
-        "- Longer meetings may take 5–10s"
-    )
-
-
-# =========================================================
-# Input Section
-# =========================================================
-tab1, tab2 = st.tabs(["📝 Transcript", "🎙 Audio Upload"])
-
-transcript = ""
-audio_file = None
-
-with tab1:
-    transcript = st.text_area(
-        "Paste transcript",
-        height=300,
-        placeholder="Paste meeting notes or transcript here..."
-    )
-
-with tab2:
-    audio_file = st.file_uploader(
-        "Upload WAV file",
-        type=["wav"]
-    )
-
-
-# =========================================================
-# Display helpers
-# =========================================================
-def metric_cards(insights):
-    c1, c2, c3 = st.columns(3)
-
-    c1.metric("Key Points", len(insights["key_points"]))
-    c2.metric("Decisions", len(insights["decisions"]))
-    c3.metric("Action Items", len(insights["action_items"]))
-
-
-def display_section(title, items):
-    st.subheader(title)
-
-    if not items:
-        st.caption("No items detected")
-        return
-
-    for x in items:
-        st.write("•", x)
-
-
-def display_actions(actions):
-    st.subheader("📌 Action Items")
-
-    if not actions:
-        st.caption("No actions detected")
-        return
-
-    for a in actions:
-        owner = a.get("owner", "")
-        deadline = a.get("deadline", "")
-
-        line = f"• {a['task']}"
-        if owner:
-            line += f" — 👤 {owner}"
-        if deadline:
-            line += f" — ⏰ {deadline}"
-
-        st.write(line)
-
-
-def display(insights):
-    metric_cards(insights)
-
-    st.divider()
-
-    st.subheader("🧾 Summary")
-    st.write(insights["summary"])
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        display_section("📍 Key Points", insights["key_points"])
-
-    with col2:
-        display_section("✅ Decisions", insights["decisions"])
-
-    st.divider()
-    display_actions(insights["action_items"])
-
-
-# =========================================================
-# Generate button
-# =========================================================
-generate_btn = st.button("🚀 Generate Insights", use_container_width=True)
-
-if generate_btn:
-    try:
-        # -------- audio -> transcript --------
-        if audio_file is not None:
-            suffix = os.path.splitext(audio_file.name)[-1]
-            tmp = f"temp{suffix}"
-
-            with open(tmp, "wb") as f:
-                f.write(audio_file.read())
-
-            with st.spinner("🎙 Transcribing audio..."):
-                transcript = transcribe_audio(tmp)
-            st.success("Transcription complete ✅")
-
-            with st.expander("📜 View Transcript"):
-                st.text_area("Transcript", transcript, height=200)
-
-            os.remove(tmp)
-
-        if not transcript:
-            st.error("Please provide transcript or audio")
-            st.stop()
-
-        # -------- NLP --------
-        with st.spinner("🧠 Analyzing meeting..."):
-            insights = generate_insights(transcript, title, meeting_type)
-        st.success("Insights generated successfully ✅")
-
-        # -------- PDF --------
-        with st.spinner("📄 Generating PDF report..."):
-            pdf_path = "meeting_report.pdf"
-            generate_pdf(insights, pdf_path, title)
-
-        # -------- display --------
-        display(insights)
-
-        with open(pdf_path, "rb") as f:
-            st.download_button(
-                "⬇ Download PDF Report",
-                f,
-                "meeting_report.pdf",
-                use_container_width=True
-            )
-
-    except Exception as e:
-        st.error(str(e))
-
+# =========================================================
+# Streamlit Frontend — Production UI
+# =========================================================
+
+import streamlit as st
+import hashlib
+import io
+import os
+
+from Backend import A_STT, F_llm
+from Backend.A_STT import transcribe_audio
+from Backend.F_llm import generate_insights
+from Backend.D_pdf_export import render_pdf
+from Backend.cache import get_cache, hash_file
+
+# cached results survive reruns; bounded and expiring
+CACHE_TTL = int(os.environ.get("UI_CACHE_TTL", "3600"))          # seconds
+CACHE_ENTRIES = int(os.environ.get("UI_CACHE_ENTRIES", "32"))
+
+
+# ---------------------------------------------------------
+# Page config
+# ---------------------------------------------------------
+st.set_page_config(
+    page_title="Meeting Insight Generator",
+    page_icon="📊",
+    layout="wide"
+)
+
+st.title("📊 AI Meeting Insight Generator")
+st.caption("Turn meetings into summaries, decisions, and action items instantly")
+
+
+# =========================================================
+# Cached resources / results
+# Streamlit reruns this script on every interaction: models
+# load once per server, results are keyed by content hash
+# =========================================================
+@st.cache_resource(show_spinner="🎙 Loading speech model...")
+def load_asr(engine):
+    return A_STT.get_asr(engine)
+
+
+@st.cache_resource
+def load_nlp():
+    F_llm.warmup()
+    return True
+
+
+def content_key(*parts):
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(str(p).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+# leading underscore: not hashed by streamlit, the key stands in
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def cached_transcript(audio_key, engine, _audio):
+    load_asr(engine)
+    return transcribe_audio(_audio, cache=get_cache(), engine=engine)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_ENTRIES, show_spinner=False)
+def cached_report(key, _transcript, title, meeting_type):
+    load_nlp()
+    insights = generate_insights(_transcript, title, meeting_type)
+    return insights, render_pdf(insights, title)
+
+
+# =========================================================
+# Sidebar controls
+# =========================================================
+with st.sidebar:
+    st.header("⚙️ Settings")
+
+    title = st.text_input("Meeting Title", "Weekly Sync")
+    meeting_type = st.selectbox(
+        "Meeting Type",
+        ["discussion", "standup", "planning", "review"]
+    )
+
+    # "auto" → ASR_MEETING_ENGINES / ASR_ENGINE
+    engine_choice = st.selectbox(
+        "Transcription Engine",
+        ["auto"] + list(A_STT.ENGINES),
+        help="tiny / *-int8 = fast drafts, small = most accurate"
+    )
+    # a bad ASR_MEETING_ENGINES / ASR_ENGINE only blocks audio, not pasted text
+    try:
+        engine = A_STT.resolve_engine(
+            None if engine_choice == "auto" else engine_choice, meeting_type
+        )
+    except ValueError as e:
+        engine = None
+        st.error(str(e))
+
+    st.divider()
+
+    st.info(
+        "Tips:\n"
+        "- Paste transcript for fastest results\n"
+        "- WAV audio works best\n"
+        "- Longer meetings may take 5–10s"
+    )
+
+
+# =========================================================
+# Input Section
+# =========================================================
+tab1, tab2 = st.tabs(["📝 Transcript", "🎙 Audio Upload"])
+
+transcript = ""
+audio_file = None
+
+with tab1:
+    transcript = st.text_area(
+        "Paste transcript",
+        height=300,
+        placeholder="Paste meeting notes or transcript here..."
+    )
+
+with tab2:
+    audio_file = st.file_uploader(
+        "Upload audio file",
+        type=["wav", "flac", "ogg", "mp3", "m4a"]
+    )
+
+
+# =========================================================
+# Display helpers
+# =========================================================
+def metric_cards(insights):
+    c1, c2, c3 = st.columns(3)
+
+    c1.metric("Key Points", len(insights["key_points"]))
+    c2.metric("Decisions", len(insights["decisions"]))
+    c3.metric("Action Items", len(insights["action_items"]))
+
+
+def display_section(title, items):
+    st.subheader(title)
+
+    if not items:
+        st.caption("No items detected")
+        return
+
+    for x in items:
+        st.write("•", x)
+
+
+def display_actions(actions):
+    st.subheader("📌 Action Items")
+
+    if not actions:
+        st.caption("No actions detected")
+        return
+
+    for a in actions:
+        owner = a.get("owner", "")
+        deadline = a.get("deadline", "")
+
+        line = f"• {a['task']}"
+        if owner:
+            line += f" — 👤 {owner}"
+        if deadline:
+            line += f" — ⏰ {deadline}"
+
+        st.write(line)
+
+
+def display(insights):
+    metric_cards(insights)
+
+    st.divider()
+
+    st.subheader("🧾 Summary")
+    st.write(insights["summary"])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        display_section("📍 Key Points", insights["key_points"])
+
+    with col2:
+        display_section("✅ Decisions", insights["decisions"])
+
+    st.divider()
+    display_actions(insights["action_items"])
+
+
+# =========================================================
+# Generate button
+# =========================================================
+generate_btn = st.button("🚀 Generate Insights", use_container_width=True)
+
+if generate_btn:
+    try:
+        # -------- audio -> transcript --------
+        if audio_file is not None:
+            if engine is None:
+                st.error("No valid transcription engine — pick one in the sidebar")
+                st.stop()
+
+            # transcribe straight from memory — no shared temp file
+            audio = io.BytesIO(audio_file.getvalue())
+
+            with st.spinner("🎙 Transcribing audio..."):
+                transcript = cached_transcript(hash_file(audio), engine, audio)
+            st.success("Transcription complete ✅")
+
+        if not transcript:
+            st.error("Please provide transcript or audio")
+            st.stop()
+
+        # -------- NLP + PDF (cached per transcript/title/type) --------
+        key = content_key(transcript, title, meeting_type)
+
+        with st.spinner("🧠 Analyzing meeting..."):
+            insights, pdf = cached_report(key, transcript, title, meeting_type)
+        st.success("Insights generated successfully ✅")
+
+        # the download click reruns the script: keep the report in session
+        st.session_state["report"] = {
+            "key": key,
+            "transcript": transcript,
+            "from_audio": audio_file is not None,
+            "insights": insights,
+            "pdf": pdf,
+        }
+
+    except Exception as e:
+        st.error(str(e))
+
+
+# =========================================================
+# Last report (persists across reruns)
+# =========================================================
+report = st.session_state.get("report")
+
+if report is not None:
+    if report["from_audio"]:
+        with st.expander("📜 View Transcript"):
+            st.text_area("Transcript", report["transcript"], height=200)
+
+    display(report["insights"])
+
+    st.download_button(
+        "⬇ Download PDF Report",
+        report["pdf"],
+        "meeting_report.pdf",
+        mime="application/pdf",
+        use_container_width=True
+    )
@@ -0,0 +1,157 @@
+# =========================================================
+# Action-item benchmark
+# one ActionEngine pass (speaker + line + keyword rules, with
+# deadlines) vs the previous three extractors run in turn
+#
+#   python -m benchmarks.bench_actions [--words 10000 100000]
+# =========================================================
+
+import argparse
+import re
+import time
+
+from Backend import F_llm
+from Backend.C_action import extract_all_actions
+from benchmarks.synthetic import synthetic_transcript
+
+
+# ---------------------------------------------------------
+# previous implementations (baseline)
+# ---------------------------------------------------------
+def legacy_speaker_actions(transcript):
+    actions = []
+    pattern = r"(\w+):\s(.+)"
+    triggers = [
+        "i will", "i'll", "i can", "let me",
+        "i plan to", "i shall", "i am going to"
+    ]
+
+    for speaker, text in re.findall(pattern, transcript):
+        lower = text.lower()
+        if any(t in lower for t in triggers):
+            actions.append({"task": text.strip(), "owner": speaker})
+
+    return actions
+
+
+def legacy_line_actions(text):
+    actions = []
+    action_keywords = [
+        " will ", " must ", " by ", " start", " starts", " prepare", " prepares",
+        " draft", " drafts", " deliver", " delivers", " escalate", " action item",
+    ]
+
+    for line in text.split("\n"):
+        sentence = line.strip()
+        if not sentence:
+            continue
+
+        lower = sentence.lower()
+        if not any(k in lower for k in action_keywords):
+            continue
+
+        if ":" in sentence:
+            sentence = sentence.split(":", 1)[1].strip()
+
+        owner = ""
+        m = re.match(r"^([A-Z][a-zA-Z]+)\s+(will|must|to|can|should|starts?|prepares?|drafts?|delivers?)", sentence)
+        if m:
+            owner = m.group(1)
+        if not owner:
+            m = re.match(r"^([A-Z][a-zA-Z]+),", sentence)
+            if m:
+                owner = m.group(1)
+        if not owner:
+            m = re.match(r"^([A-Z][a-zA-Z]+)['’]s", sentence)
+            if m:
+                owner = m.group(1)
+        if not owner:
+            owner = "Unassigned"
+
+        task = re.sub(r"(?i)action item[:\-]?", "", sentence)
+        task = re.sub(rf"^{owner}\b[,:\s]*", "", task)
+
+        actions.append({"task": task.strip(), "owner": owner})
+
+    return actions
+
+
+def legacy_keyword_actions(text):
+    rules = F_llm.get_rules()
+    actions = []
+
+    for line, flags in rules.matcher.tag_lines(text):
+        if not flags & F_llm.ACTION:
+            continue
+
+        line = line.strip()
+        if len(line) < 15:
+            continue
+
+        m = rules.action_re.search(line)
+        if not m:
+            continue
+
+        owner = F_llm.OWNER_RE.match(line)
+        actions.append({
+            "task": m.group(1).strip(),
+            "owner": owner.group(1) if owner else "Unassigned",
+        })
+
+        if len(actions) == 10:
+            break
+
+    return actions
+
+
+def legacy(text):
+    return {
+        "speaker": legacy_speaker_actions(text),
+        "line": legacy_line_actions(text),
+        "keyword": legacy_keyword_actions(text),
+    }
+
+
+def without_deadlines(result):
+    return {
+        k: [{"task": a["task"], "owner": a["owner"]} for a in v]
+        for k, v in result.items()
+    }
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    out = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = ap.parse_args()
+
+    print(f"{'words':>9} {'legacy s':>9} {'engine s':>9} {'speedup':>8} {'actions':>8} {'deadlines':>10} same")
+
+    for words in args.words:
+        text = synthetic_transcript(words)
+
+        old_t, old = timed(lambda: legacy(text))
+        new_t, new = timed(lambda: extract_all_actions(text))
+
+        count = sum(len(v) for v in new.values())
+        dated = sum(bool(a["deadline"]) for v in new.values() for a in v)
+
+        print(
+            f"{words:>9} {old_t:>9.4f} {new_t:>9.4f} {old_t / new_t:>7.1f}x "
+            f"{count:>8} {dated:>10} {without_deadlines(new) == old}"
+        )
+
+
+if __name__ == "__main__":
+    main()
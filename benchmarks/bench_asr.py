@@ -0,0 +1,167 @@
+# =========================================================
+# ASR engine benchmark (real-time factor + word error rate)
+# every registered engine — or a chosen few — on one local
+# reference clip with its human transcript
+#
+#   python -m benchmarks.bench_asr --clip standup.wav --reference standup.txt
+#   python -m benchmarks.bench_asr --clip a.flac --engines base base-int8 --out asr.json
+#   python -m benchmarks.bench_asr --clip long.wav --engines base --workers 2 4 8
+#     (+ sharded transcribe_parallel speedup over in-process, per worker count)
+# =========================================================
+
+import argparse
+import json
+import re
+import time
+
+import numpy as np
+
+from Backend import A_STT
+
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def words(text):
+    # case and punctuation do not count as errors
+    return WORD_RE.findall(text.lower())
+
+
+def word_error_rate(reference, hypothesis):
+    """
+    (substitutions + deletions + insertions) / reference words,
+    by word-level edit distance.
+    """
+    ref, hyp = words(reference), words(hypothesis)
+    if not ref:
+        return float(bool(hyp))
+
+    prev = list(range(len(hyp) + 1))
+
+    for i, r in enumerate(ref, 1):
+        row = [i]
+        for j, h in enumerate(hyp, 1):
+            row.append(min(
+                prev[j] + 1,                # deletion
+                row[j - 1] + 1,             # insertion
+                prev[j - 1] + (r != h),     # substitution / match
+            ))
+        prev = row
+
+    return prev[-1] / len(ref)
+
+
+def bench_engine(engine, clip, reference=None, batch_size=None, vad=True):
+    start = time.perf_counter()
+    A_STT.warmup(engine)
+    load = time.perf_counter() - start
+
+    # first call pays one-off allocation / kernel selection
+    A_STT.transcribe_chunks([np.zeros(16000, dtype=np.float32)], engine=engine)
+
+    stats = {}
+    text = A_STT.transcribe_audio(clip, batch_size=batch_size, stats=stats, vad=vad, engine=engine)
+    seconds = stats.get("input_seconds", stats["audio_seconds"])
+
+    return {
+        "engine": engine,
+        "model": A_STT.engine_id(engine),
+        "load_seconds": load,
+        "audio_seconds": seconds,
+        "elapsed_seconds": stats["elapsed_seconds"],
+        "realtime_factor": stats["elapsed_seconds"] / seconds if seconds else None,
+        "wer": word_error_rate(reference, text) if reference is not None else None,
+        "text": text,
+    }
+
+
+def bench_parallel(engine, clip, workers, batch_size=None, vad=True):
+    # pool start-up and model loads happen in a first pass over the
+    # pool, so the timed pass measures steady-state sharding only
+    pool = A_STT.get_pool(workers, engine=engine)
+    for future in [pool.submit(A_STT.warmup, engine) for _ in range(workers)]:
+        future.result()
+
+    stats = {}
+    text = A_STT.transcribe_parallel(
+        clip, workers=workers, batch_size=batch_size, stats=stats, vad=vad, engine=engine
+    )
+
+    return {"workers": workers, "elapsed_seconds": stats["elapsed_seconds"], "text": text}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--clip", required=True, help="audio file (any format Backend.decoder reads)")
+    ap.add_argument("--reference", help="text file with the correct transcript (for WER)")
+    ap.add_argument("--engines", nargs="+", default=list(A_STT.ENGINES))
+    ap.add_argument("--batch-size", type=int, default=None)
+    ap.add_argument("--no-vad", action="store_true")
+    ap.add_argument("--workers", type=int, nargs="*", default=[],
+                    help="also time transcribe_parallel with these worker counts")
+    ap.add_argument("--out", help="write rows (with transcripts) as JSON")
+    args = ap.parse_args()
+
+    reference = None
+    if args.reference:
+        with open(args.reference, encoding="utf-8") as f:
+            reference = f.read()
+
+    print(f"{'engine':>12} {'load s':>8} {'asr s':>8} {'RTF':>7} {'x base':>7} {'WER':>7}")
+
+    rows = []
+    base = None
+
+    for engine in args.engines:
+        try:
+            row = bench_engine(engine, args.clip, reference, args.batch_size, not args.no_vad)
+        except Exception as e:
+            rows.append({"engine": engine, "error": repr(e)})
+            print(f"{engine:>12}   error: {e!r}")
+            continue
+
+        rows.append(row)
+
+        # throughput relative to the fp32 default engine, when it ran
+        if engine == A_STT.DEFAULT_ENGINE:
+            base = row["elapsed_seconds"]
+
+    for row in rows:
+        if "error" in row:
+            continue
+
+        speedup = f"{base / row['elapsed_seconds']:.2f}x" if base else "-"
+        wer = f"{row['wer']:.3f}" if row["wer"] is not None else "-"
+        print(
+            f"{row['engine']:>12} {row['load_seconds']:>8.2f} {row['elapsed_seconds']:>8.2f} "
+            f"{row['realtime_factor']:>7.3f} {speedup:>7} {wer:>7}"
+        )
+
+    if args.workers:
+        print(f"\n{'engine':>12} {'workers':>8} {'asr s':>8} {'speedup':>8} {'per worker':>11}")
+
+    for row in rows:
+        if "error" in row or not args.workers:
+            continue
+
+        row["parallel"] = []
+        for workers in args.workers:
+            p = bench_parallel(row["engine"], args.clip, workers, args.batch_size, not args.no_vad)
+            row["parallel"].append(p)
+
+            # speedup over the in-process run; per worker near 1.0 = linear
+            speedup = row["elapsed_seconds"] / p["elapsed_seconds"]
+            print(
+                f"{row['engine']:>12} {workers:>8} {p['elapsed_seconds']:>8.2f} "
+                f"{speedup:>7.2f}x {speedup / workers:>11.2f}"
+            )
+
+    A_STT.shutdown_pools()
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"clip": args.clip, "results": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# =========================================================
+# ASR memory benchmark (file + live transcription in one process)
+# separate: transformers pipeline for files + openai-whisper
+#           model for live capture (the previous setup)
+# shared:   A_STT.get_asr() serving both paths
+# Each case runs in a fresh spawned process; RSS after loading
+# and after one file + one live call.
+#
+#   python -m benchmarks.bench_asr_memory [--engine base]
+# =========================================================
+
+import argparse
+import multiprocessing
+
+import numpy as np
+
+
+def _rss_mb():
+    from Backend.metrics import rss_bytes
+    return rss_bytes() / 1e6
+
+
+def separate(engine):
+    from transformers import pipeline
+    import whisper
+
+    from Backend import A_STT
+
+    start = _rss_mb()
+    spec = A_STT.ENGINES[engine]
+
+    pipe = pipeline("automatic-speech-recognition", model=A_STT.resolve_model(spec["model"]), device=-1)
+    live = whisper.load_model(spec["model"].split("whisper-")[-1])
+    loaded = _rss_mb()
+
+    audio = np.zeros(16000 * 5, dtype=np.float32)
+    pipe({"array": audio, "sampling_rate": 16000})
+    live.transcribe(audio, fp16=False)
+
+    return {
+        "case": "separate",
+        "baseline_mb": start,
+        "loaded_mb": loaded,
+        "after_calls_mb": _rss_mb(),
+        "weights_mb": (A_STT.model_bytes(pipe.model) + A_STT.model_bytes(live)) / 1e6,
+    }
+
+
+def shared(engine):
+    from Backend import A_STT, E_live_capture
+
+    start = _rss_mb()
+
+    asr = A_STT.get_asr(engine)
+    assert E_live_capture.get_model(engine) is asr
+    loaded = _rss_mb()
+
+    audio = np.zeros(16000 * 5, dtype=np.float32)
+    A_STT.transcribe_chunks([audio], engine=engine)
+    E_live_capture.whisper_transcribe(audio, engine)
+
+    return {
+        "case": "shared",
+        "baseline_mb": start,
+        "loaded_mb": loaded,
+        "after_calls_mb": _rss_mb(),
+        "weights_mb": A_STT.loaded_bytes() / 1e6,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--engine", default="base")
+    args = ap.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+
+    print(f"{'case':>10} {'start MB':>9} {'loaded MB':>10} {'after MB':>9} {'weights MB':>11}")
+
+    for case in (separate, shared):
+        with ctx.Pool(1) as pool:
+            try:
+                r = pool.apply(case, (args.engine,))
+            except Exception as e:
+                print(f"{case.__name__:>10}   error: {e!r}")
+                continue
+
+        print(
+            f"{r['case']:>10} {r['baseline_mb']:>9.0f} {r['loaded_mb']:>10.0f} "
+            f"{r['after_calls_mb']:>9.0f} {r['weights_mb']:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# =========================================================
+# Tokenize-once benchmark
+# generate_insights on one shared Document vs the previous
+# string pipeline (normalize → split lines → re-split and
+# re-tokenize in the summarizer)
+#
+#   python -m benchmarks.bench_document [--words 10000 100000 1000000]
+# =========================================================
+
+import argparse
+import time
+import tracemalloc
+
+from Backend import F_llm
+from Backend.document import Document
+from benchmarks.synthetic import synthetic_transcript
+
+
+# ---------------------------------------------------------
+# previous implementation (baseline)
+# ---------------------------------------------------------
+def legacy_insights(transcript, meeting_type="discussion"):
+    text = F_llm.normalize_text(transcript)
+
+    rules = F_llm.get_rules(meeting_type)
+    tagged = rules.matcher.tag_lines(text)
+
+    return {
+        "summary": F_llm.summarize(text),
+        "key_points": F_llm.unique(F_llm.key_points_from(l for l, _ in tagged)),
+        "decisions": F_llm.unique(F_llm.decisions_from(tagged)),
+        "action_items": F_llm.unique(F_llm.extract_actions(text, meeting_type)),
+    }
+
+
+# tagging + summary on already-normalized text: the stages the
+# Document changes (punkt in normalize_text is common to both)
+def legacy_stages(text, rules):
+    rules.matcher.tag_lines(text)
+    F_llm.summarize(text)
+
+
+def document_stages(text, rules):
+    doc = Document(text)
+    rules.matcher.tag_document(doc)
+    F_llm.summarize(doc)
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    out = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak / 1e6, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, nargs="+", default=[10000, 100000, 1000000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    F_llm.ensure_nltk_data()
+
+    rules = F_llm.get_rules("discussion")
+
+    print(
+        f"{'words':>9} {'legacy s':>9} {'doc s':>8} {'speedup':>8} {'stages':>8} "
+        f"{'legacy MB':>10} {'doc MB':>8} {'arrays MB':>10} same"
+    )
+
+    for words in args.words:
+        transcript = synthetic_transcript(words)
+        text = F_llm.normalize_text(transcript)
+
+        old_t, old_mb, old = measure(lambda: legacy_insights(transcript), args.repeat)
+        new_t, new_mb, new = measure(lambda: F_llm.generate_insights(transcript), args.repeat)
+
+        old_s, _, _ = measure(lambda: legacy_stages(text, rules), args.repeat)
+        new_s, _, _ = measure(lambda: document_stages(text, rules), args.repeat)
+
+        print(
+            f"{words:>9} {old_t:>9.3f} {new_t:>8.3f} {old_t / new_t:>7.2f}x {old_s / new_s:>7.2f}x "
+            f"{old_mb:>10.1f} {new_mb:>8.1f} {Document(text).nbytes() / 1e6:>10.2f} {old == new}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# =========================================================
+# Keyword pass benchmark
+# one-pass KeywordMatcher vs the previous per-line loops
+# (filler removal, decisions, actions, key points)
+#
+#   python -m benchmarks.bench_keywords [--sizes 10000 100000]
+# =========================================================
+
+import argparse
+import random
+import re
+import time
+
+from Backend import F_llm
+
+
+SPEAKERS = ["Priya", "Meera", "Arjun", "Rahul"]
+
+SENTENCES = [
+    "{s}: um I will prepare the test plan by Feb 20th.",
+    "{s}: we agreed to move the launch to March.",
+    "{s}: you know the vendor must deliver docs by Friday.",
+    "{s}: basically the dashboard is the highest priority for the business.",
+    "{s}: okay let me check the numbers after lunch today.",
+    "{s}: the deadline for QA is fixed now.",
+    "{s}: please send the updated roadmap to everyone.",
+    "{s}: I think the integration looks stable so far.",
+    "{s}: like we still have no API documentation from the vendor team.",
+    "{s}: stakeholders approved the KPI tracking module yesterday.",
+]
+
+
+def synthetic_sentences(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        rng.choice(SENTENCES).format(s=rng.choice(SPEAKERS)) + f" ({i})"
+        for i in range(n)
+    ]
+
+
+# ---------------------------------------------------------
+# previous implementation (baseline)
+# ---------------------------------------------------------
+def legacy_fillers(sentences):
+    clean = []
+    for s in sentences:
+        s = s.strip()
+        s = re.sub(r"\b(um|uh|you know|like|basically|okay)\b", "", s, flags=re.I)
+        if len(s) > 10:
+            clean.append(s)
+    return "\n".join(dict.fromkeys(clean))
+
+
+def legacy_key_points(text):
+    seen = set()
+    points = []
+    for l in text.split("\n"):
+        l = l.strip()
+        if len(l) > 40 and l not in seen:
+            points.append(l)
+            seen.add(l)
+    return points[:6]
+
+
+def legacy_decisions(text):
+    decision_keywords = F_llm.DECISION_KEYWORDS
+    results = []
+    for l in text.split("\n"):
+        lower = l.lower()
+        if any(k in lower for k in decision_keywords):
+            results.append(l.strip())
+    return results
+
+
+def legacy_actions(text):
+    actions = []
+    pattern = r"""
+        ^(?:[A-Z][a-z]+)?      # optional owner
+        [,:]?\s*
+        (.*?\b(?:will|must|should|please|by|prepare|send|deliver|update|start)\b.*)
+    """
+    for line in text.split("\n"):
+        line = line.strip()
+        if len(line) < 15:
+            continue
+        m = re.search(pattern, line, re.IGNORECASE | re.VERBOSE)
+        if not m:
+            continue
+        task = m.group(1)
+        owner_match = re.match(r"^([A-Z][a-z]+)", line)
+        owner = owner_match.group(1) if owner_match else "Unassigned"
+        actions.append({"task": task.strip(), "owner": owner})
+    return actions[:10]
+
+
+def legacy(sentences):
+    text = legacy_fillers(sentences)
+    return text, legacy_key_points(text), legacy_decisions(text), legacy_actions(text)
+
+
+# ---------------------------------------------------------
+# current implementation
+# ---------------------------------------------------------
+def current(sentences):
+    stripped = [s.strip() for s in sentences]
+    stripped = F_llm.FILLER_RE.sub("", F_llm._SEP.join(stripped)).split(F_llm._SEP)
+    text = "\n".join(dict.fromkeys(s for s in stripped if len(s) > 10))
+
+    rules = F_llm.get_rules()
+    tagged = rules.matcher.tag_lines(text)
+
+    return (
+        text,
+        F_llm.key_points_from(l for l, _ in tagged),
+        F_llm.decisions_from(tagged),
+        # legacy had no deadline field
+        [{"task": a["task"], "owner": a["owner"]} for a in F_llm.extract_actions(text)],
+    )
+
+
+def best_of(fn, arg, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 30_000, 100_000])
+    args = ap.parse_args()
+
+    print(f"{'sentences':>10} {'legacy s':>9} {'matcher s':>10} {'speedup':>8} {'same':>5}")
+
+    for n in args.sizes:
+        sentences = synthetic_sentences(n)
+
+        t_old, old = best_of(legacy, sentences)
+        t_new, new = best_of(current, sentences)
+
+        print(f"{n:>10} {t_old:>9.3f} {t_new:>10.3f} {t_old / t_new:>7.1f}x {str(old == new):>5}")
+
+
+if __name__ == "__main__":
+    main()
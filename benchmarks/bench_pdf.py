@@ -0,0 +1,109 @@
+# =========================================================
+# PDF export benchmark (reports/sec)
+# previous generate_pdf (fresh styles, ListFlowable, file on
+# disk) vs render_pdfs separate / combined
+#
+#   python -m benchmarks.bench_pdf [--reports 200] [--words 1500]
+# =========================================================
+
+import argparse
+import os
+import tempfile
+import time
+
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import ListFlowable, ListItem, Paragraph, SimpleDocTemplate, Spacer
+
+from Backend.D_pdf_export import render_pdfs
+from Backend.F_llm import generate_insights
+from benchmarks.synthetic import synthetic_transcript
+
+
+# ---------------------------------------------------------
+# previous implementation (baseline)
+# ---------------------------------------------------------
+def legacy_generate_pdf(data, filename, title="Meeting Report"):
+    doc = SimpleDocTemplate(filename)
+    styles = getSampleStyleSheet()
+    elements = []
+
+    def heading(text):
+        elements.append(Spacer(1, 18))
+        elements.append(Paragraph(text, styles["Heading1"]))
+
+    def bullets(items):
+        if not items:
+            elements.append(Paragraph("None", styles["BodyText"]))
+            return
+        lst = [ListItem(Paragraph(str(x), styles["BodyText"])) for x in items]
+        elements.append(ListFlowable(lst, bulletType="bullet"))
+
+    elements.append(Paragraph(title, styles["Title"]))
+    elements.append(Spacer(1, 20))
+
+    heading("Summary")
+    elements.append(Paragraph(data["summary"], styles["BodyText"]))
+
+    heading("Key Points")
+    bullets(data["key_points"])
+
+    heading("Decisions")
+    bullets(data["decisions"])
+
+    heading("Action Items")
+    actions = []
+    for a in data["action_items"]:
+        line = a["task"]
+        if a.get("owner"):
+            line += f" — {a['owner']}"
+        if a.get("deadline"):
+            line += f" ({a['deadline']})"
+        actions.append(line)
+    bullets(actions)
+
+    doc.build(elements)
+
+
+def legacy_batch(reports, out_dir):
+    # one file per report, read back like the old /process did
+    pdfs = []
+    for i, (data, title) in enumerate(reports):
+        path = os.path.join(out_dir, f"report_{i}.pdf")
+        legacy_generate_pdf(data, path, title)
+        with open(path, "rb") as f:
+            pdfs.append(f.read())
+    return pdfs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reports", type=int, default=200)
+    ap.add_argument("--words", type=int, default=1500, help="transcript size per report")
+    args = ap.parse_args()
+
+    reports = [
+        (generate_insights(synthetic_transcript(args.words, seed=i)), f"Meeting {i}")
+        for i in range(args.reports)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [
+            ("legacy (files)", lambda: legacy_batch(reports, tmp)),
+            ("separate", lambda: render_pdfs(reports)),
+            ("combined", lambda: render_pdfs(reports, combined=True)),
+        ]
+
+        print(f"{'mode':>15} {'seconds':>9} {'reports/s':>10} {'speedup':>8}")
+
+        base = None
+        for name, fn in rows:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+
+            base = base or elapsed
+            print(f"{name:>15} {elapsed:>9.3f} {args.reports / elapsed:>10.1f} {base / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
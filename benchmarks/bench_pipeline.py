@@ -0,0 +1,227 @@
+# =========================================================
+# Stage-level pipeline benchmark (offline, synthetic data)
+# audio: read → resample → chunk_audio → VAD chunks → ASR
+# text:  normalize_text → summarize → extractors → PDF
+# Wall time (best of --repeat) and tracemalloc peak per stage,
+# written as JSON so runs can be compared across commits.
+#
+#   python -m benchmarks.bench_pipeline --out before.json
+#   python -m benchmarks.bench_pipeline --out after.json --compare before.json
+#   python -m benchmarks.bench_pipeline --words 1000 1000000 --asr
+# =========================================================
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from Backend import A_STT, F_llm
+from Backend.D_pdf_export import generate_pdf
+from Backend.decoder import open_audio
+from benchmarks.synthetic import synthetic_transcript, synthetic_wav
+
+
+def measure(fn, repeat=1, memory=True):
+    """
+    (best seconds, peak MB or None, last result)
+    """
+    best = float("inf")
+    out = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak /= 1e6
+
+    return best, peak, out
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# =========================================================
+# Stages
+# =========================================================
+def audio_stages(sr, channels, seconds, asr=False):
+    wav = io.BytesIO()
+    synthetic_wav(wav, seconds, sr, channels)
+
+    def read():
+        with open_audio(wav) as dec:
+            return np.concatenate(list(dec.blocks(A_STT.READ_BLOCK_FRAMES)))
+
+    native = read()
+    audio = A_STT.resample(native, sr)
+
+    stages = [
+        ("read_wav", read),
+        ("resample", lambda: A_STT.resample(native, sr)),
+        ("chunk_audio", lambda: list(A_STT.chunk_audio(audio, 16000))),
+        ("vad_chunks", lambda: list(A_STT.chunk_blocks(A_STT.iter_array(audio), vad=True))),
+        ("stream_chunks", lambda: list(A_STT.stream_chunks(wav, vad=True))),
+    ]
+
+    if asr:
+        stages.append(("asr", lambda: A_STT.transcribe_audio(wav)))
+
+    return stages
+
+
+def text_stages(transcript):
+    text = F_llm.normalize_text(transcript)
+    insights = F_llm.generate_insights(transcript)
+
+    def pdf():
+        buf = io.BytesIO()
+        generate_pdf(insights, buf)
+        return buf
+
+    return [
+        ("normalize_text", lambda: F_llm.normalize_text(transcript)),
+        ("summarize", lambda: F_llm.summarize(text)),
+        ("extract_key_points", lambda: F_llm.extract_key_points(text)),
+        ("extract_decisions", lambda: F_llm.extract_decisions(text)),
+        ("extract_actions", lambda: F_llm.extract_actions(text)),
+        ("generate_insights", lambda: F_llm.generate_insights(transcript)),
+        ("generate_pdf", pdf),
+    ]
+
+
+# =========================================================
+# Runner
+# =========================================================
+def run(args, log=print):
+    results = []
+
+    def record(stage, case, fn, units, unit):
+        # ASR / 1M-word stages are too slow to repeat
+        repeat = 1 if stage == "asr" or case.get("words", 0) >= 100_000 else args.repeat
+
+        try:
+            seconds, peak, _ = measure(fn, repeat, memory=not args.no_memory and stage != "asr")
+        except Exception as e:
+            results.append({"stage": stage, **case, "error": repr(e)})
+            log(f"{stage:>20} {json.dumps(case):>40}   error: {e!r}")
+            return
+
+        row = {
+            "stage": stage,
+            **case,
+            "seconds": seconds,
+            "peak_mb": peak,
+            f"{unit}_per_second": units / seconds if seconds else None,
+        }
+        if "seconds_audio" in case:
+            row["realtime_factor"] = seconds / case["seconds_audio"]
+
+        results.append(row)
+        peak_txt = f"{peak:.1f}" if peak is not None else "-"
+        log(f"{stage:>20} {json.dumps(case):>40} {seconds:>10.4f}s {peak_txt:>9} MB")
+
+    log(f"{'stage':>20} {'case':>40} {'time':>11} {'peak':>12}")
+
+    F_llm.ensure_nltk_data()
+
+    for sr in args.rates:
+        for channels in args.channels:
+            case = {"sr": sr, "channels": channels, "seconds_audio": args.seconds}
+            asr = args.asr and (sr, channels) == (args.rates[0], args.channels[0])
+
+            try:
+                stages = audio_stages(sr, channels, args.seconds, asr=asr)
+            except Exception as e:
+                results.append({"stage": "setup", **case, "error": repr(e)})
+                log(f"{'setup':>20} {json.dumps(case):>40}   error: {e!r}")
+                continue
+
+            for stage, fn in stages:
+                record(stage, case, fn, args.seconds, "audio_seconds")
+
+    for words in args.words:
+        transcript = synthetic_transcript(words, speakers=args.speakers)
+        case = {"words": words}
+
+        for stage, fn in text_stages(transcript):
+            record(stage, case, fn, words, "words")
+
+    return results
+
+
+def key(row):
+    return (row["stage"],) + tuple(
+        row.get(k) for k in ("sr", "channels", "seconds_audio", "words")
+    )
+
+
+def compare(results, baseline_path, log=print):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {key(r): r for r in json.load(f)["results"] if "seconds" in r}
+
+    log(f"\nvs {baseline_path} (time ratio, <1 is faster)")
+
+    for row in results:
+        old = baseline.get(key(row))
+        if old and "seconds" in row and old["seconds"]:
+            log(f"{row['stage']:>20} {str(key(row)[1:]):>40} {row['seconds'] / old['seconds']:>8.2f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--speakers", type=int, default=4)
+    ap.add_argument("--rates", type=int, nargs="+", default=[16000, 8000, 44100, 48000])
+    ap.add_argument("--channels", type=int, nargs="+", default=[1, 2])
+    ap.add_argument("--seconds", type=float, default=60)
+    ap.add_argument("--asr", action="store_true", help="also time whisper on the first rate/channels case")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--out", default="bench_pipeline.json")
+    ap.add_argument("--compare", help="earlier --out file to diff against")
+    args = ap.parse_args()
+
+    results = run(args)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "cpus": os.cpu_count(),
+        "args": vars(args),
+        "results": results,
+    }
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\nwrote {args.out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
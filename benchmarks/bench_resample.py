@@ -0,0 +1,107 @@
+# =========================================================
+# Resampler benchmark
+# polyphase StreamingResampler vs the old np.interp resample
+#
+#   python -m benchmarks.bench_resample [--seconds 60]
+# =========================================================
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from Backend.A_STT import StreamingResampler, resample, resample_linear, READ_BLOCK_FRAMES
+
+
+RATES = [8000, 22050, 44100, 48000]
+TARGET_SR = 16000
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    out = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best, out
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def streamed(audio, sr):
+    r = StreamingResampler(sr, TARGET_SR)
+    n = 0
+
+    for i in range(0, len(audio), READ_BLOCK_FRAMES):
+        n += len(r.process(audio[i:i + READ_BLOCK_FRAMES]))
+
+    return n + len(r.flush())
+
+
+def alias_level(fn, sr, freq=None):
+    """
+    Peak output level of a full-scale tone (default: just below the
+    input Nyquist): anything left after resampling to 16 kHz is
+    aliasing.
+    """
+    t = np.arange(sr) / sr
+    tone = np.sin(2 * np.pi * (freq or sr / 2 - 1000) * t).astype(np.float32)
+    out = fn(tone, sr, TARGET_SR)
+
+    return float(np.abs(out[200:-200]).max())
+
+
+# just past the 8 kHz output Nyquist, folds to 7.5 kHz: the
+# hardest tone for a low-pass (inside its transition band)
+EDGE_HZ = 8500
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=60)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'rate':>6} {'method':>10} {'x realtime':>11} {'Msamp/s':>9} {'peak MB':>8} "
+        f"{'alias':>9} {'edge dB':>8}"
+    )
+
+    for sr in RATES:
+        audio = rng.standard_normal(int(sr * args.seconds)).astype(np.float32)
+
+        rows = [
+            ("interp", lambda: resample_linear(audio, sr, TARGET_SR), resample_linear),
+            ("polyphase", lambda: resample(audio, sr, TARGET_SR), resample),
+            ("streamed", lambda: streamed(audio, sr), resample),
+        ]
+
+        for name, fn, one_shot in rows:
+            elapsed, _ = timed(fn)
+
+            # aliasing only applies when downsampling
+            alias = f"{alias_level(one_shot, sr):.2e}" if sr > TARGET_SR else "-"
+            edge = f"{20 * np.log10(alias_level(one_shot, sr, EDGE_HZ)):.1f}" if sr > 2 * EDGE_HZ else "-"
+
+            print(
+                f"{sr:>6} {name:>10} "
+                f"{args.seconds / elapsed:>11.0f} "
+                f"{len(audio) / elapsed / 1e6:>9.1f} "
+                f"{peak_mb(fn):>8.1f} "
+                f"{alias:>9} {edge:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# =========================================================
+# Summarizer scaling benchmark
+# sparse LSA / TextRank vs sumy's dense LsaSummarizer
+#
+#   python -m benchmarks.bench_summarize [--sizes 100 1000 ...]
+# sumy is skipped above --sumy-max (dense SVD is O(n^2) memory)
+# =========================================================
+
+import argparse
+import time
+import tracemalloc
+import warnings
+
+from Backend.summarizer import top_sentences
+from benchmarks.bench_keywords import synthetic_sentences
+
+
+def run_sumy(sentences, count):
+    from sumy.nlp.stemmers import null_stemmer
+    from sumy.models.dom import ObjectDocumentModel, Paragraph, Sentence
+    from sumy.nlp.tokenizers import Tokenizer
+    from sumy.summarizers.lsa import LsaSummarizer
+
+    tokenizer = Tokenizer("english")
+    doc = ObjectDocumentModel([
+        Paragraph([Sentence(s, tokenizer) for s in sentences])
+    ])
+
+    summarizer = LsaSummarizer(null_stemmer)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return [str(s) for s in summarizer(doc, count)]
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000, 50000])
+    ap.add_argument("--sumy-max", type=int, default=5000)
+    ap.add_argument("--count", type=int, default=4)
+    args = ap.parse_args()
+
+    print(f"{'sentences':>10} {'method':>9} {'seconds':>9} {'peak MB':>9}")
+
+    for n in args.sizes:
+        sentences = synthetic_sentences(n)
+
+        methods = {
+            "lsa": lambda: top_sentences(sentences, args.count, "lsa"),
+            "textrank": lambda: top_sentences(sentences, args.count, "textrank"),
+        }
+        if n <= args.sumy_max:
+            methods["sumy"] = lambda: run_sumy(sentences, args.count)
+
+        for name, fn in methods.items():
+            elapsed, peak = measure(fn)
+            print(f"{n:>10} {name:>9} {elapsed:>9.3f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# =========================================================
+# Offline synthetic meetings (no gTTS, no network)
+# - transcripts: speakers, decisions, deadlines, fillers,
+#   any size from a few lines to millions of words
+# - WAVs: speech-like tone bursts with pauses, at any
+#   sample rate / channel count / sample width
+#
+#   python -m benchmarks.synthetic --words 10000 > meeting.txt
+#   python -m benchmarks.synthetic --wav meeting.wav --seconds 60 --sr 44100 --channels 2
+# =========================================================
+
+import argparse
+import random
+import sys
+import wave
+
+import numpy as np
+
+
+SPEAKERS = [
+    "Priya", "Meera", "Arjun", "Rahul", "Sara", "Tom", "Li", "Omar",
+    "Anita", "Kofi", "Elena", "Marco",
+]
+
+TOPICS = [
+    "the analytics dashboard", "the KPI tracking module", "backend integration",
+    "the regression suite", "the vendor API docs", "the Q1 roadmap",
+    "the billing migration", "the mobile release", "the onboarding flow",
+    "the data pipeline", "the security review", "the pricing page",
+    "the search service", "the audit log", "the customer survey",
+]
+
+DEADLINES = [
+    "by Friday", "by next Monday", "by end of week", "by March 10th",
+    "by Feb 20th", "by tomorrow", "by end of sprint", "by Q2",
+    "before the demo", "by the 15th",
+]
+
+FILLERS = ["um", "uh", "you know", "like", "basically", "okay"]
+
+# {s} speaker, {o} other speaker, {t} topic, {d} deadline
+DECISIONS = [
+    "we decided to ship {t} {d}.",
+    "we agreed that {t} is the top priority.",
+    "the team approved the plan for {t}.",
+    "{o} confirmed the scope of {t}.",
+    "so the deadline for {t} is {d}.",
+    "we finalized the design of {t}.",
+]
+
+ACTIONS = [
+    "I will prepare the test plan for {t} {d}.",
+    "{o}, please send the notes on {t} {d}.",
+    "I should update the estimate for {t} {d}.",
+    "{o} will start on {t} {d}.",
+    "the vendor must deliver {t} {d}.",
+    "I will review {t} with {o} {d}.",
+]
+
+CHATTER = [
+    "I think {t} looks stable so far.",
+    "we still have open questions on {t}.",
+    "the numbers for {t} went up last week.",
+    "{o} raised a risk around {t}.",
+    "there was a small regression in {t} yesterday.",
+    "I talked to the customer about {t}.",
+    "we need more data before we commit on {t}.",
+    "can you share the latest status of {t}?",
+    "the metrics for {t} are in the shared sheet.",
+    "I am not sure {t} will fit into this sprint.",
+]
+
+# how often each kind of sentence appears
+MIX = [(CHATTER, 0.7), (ACTIONS, 0.15), (DECISIONS, 0.15)]
+
+
+# =========================================================
+# Transcripts
+# =========================================================
+def synthetic_lines(words, seed=0, speakers=4, filler_rate=0.3):
+    """
+    Yield "Speaker: sentence" lines until `words` words are out.
+    """
+    rng = random.Random(seed)
+    people = SPEAKERS[:max(2, min(speakers, len(SPEAKERS)))]
+    pools, weights = zip(*MIX)
+
+    count = 0
+    n = 0
+
+    while count < words:
+        s, o = rng.sample(people, 2)
+        template = rng.choice(rng.choices(pools, weights)[0])
+        sentence = template.format(o=o, t=rng.choice(TOPICS), d=rng.choice(DEADLINES))
+
+        if rng.random() < filler_rate:
+            sentence = f"{rng.choice(FILLERS)} {sentence}"
+
+        # a running item number keeps long transcripts from deduping away
+        line = f"{s}: {sentence[0].upper()}{sentence[1:]}"
+        if n % 3 == 2:
+            line = f"{line[:-1]} (item {n})."
+
+        count += len(line.split())
+        n += 1
+        yield line
+
+
+def synthetic_transcript(words, seed=0, speakers=4, filler_rate=0.3):
+    return "\n".join(synthetic_lines(words, seed, speakers, filler_rate))
+
+
+# =========================================================
+# Audio
+# =========================================================
+def synthetic_audio(seconds, sr=16000, channels=1, seed=0, speech_ratio=0.7):
+    """
+    float32 (frames, channels) in [-1, 1]: voiced bursts (harmonic
+    tone + noise, syllable-rate envelope) separated by quiet gaps.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * sr)
+    out = np.zeros(n, dtype=np.float32)
+
+    pos = 0
+    while pos < n:
+        talk = int(rng.uniform(1.0, 4.0) * sr)
+        gap = int(talk * (1 - speech_ratio) / speech_ratio)
+
+        seg = min(talk, n - pos)
+        t = np.arange(seg, dtype=np.float32) / sr
+
+        f0 = rng.uniform(100, 220)
+        voice = sum(np.sin(2 * np.pi * f0 * h * t) / h for h in range(1, 6))
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3, 6) * t) ** 2
+
+        out[pos:pos + seg] = 0.3 * voice * envelope / 2.3
+        pos += seg + gap
+
+    out += rng.standard_normal(n).astype(np.float32) * 1e-3
+
+    # channels differ slightly (gain), like a stereo room mic
+    gains = np.linspace(1.0, 0.8, channels, dtype=np.float32)
+    return np.clip(out[:, None] * gains, -1, 1)
+
+
+def write_wav(dest, audio, sr, sampwidth=2):
+    """
+    dest: path or binary file. audio: float (frames, channels).
+    """
+    audio = np.atleast_2d(audio.T).T
+
+    if sampwidth == 1:
+        pcm = (audio * 127 + 128).astype(np.uint8)
+    elif sampwidth == 2:
+        pcm = (audio * 32767).astype("<i2")
+    elif sampwidth == 4:
+        pcm = (audio * 2147483647).astype("<i4")
+    else:
+        raise ValueError(f"unsupported sample width {sampwidth}")
+
+    with wave.open(dest, "wb") as wf:
+        wf.setnchannels(audio.shape[1])
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(sr)
+        wf.writeframes(pcm.tobytes())
+
+
+def synthetic_wav(dest, seconds, sr=16000, channels=1, sampwidth=2, seed=0):
+    write_wav(dest, synthetic_audio(seconds, sr, channels, seed), sr, sampwidth)
+    return dest
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, default=1000)
+    ap.add_argument("--speakers", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--wav", help="write a WAV here instead of a transcript")
+    ap.add_argument("--seconds", type=float, default=60)
+    ap.add_argument("--sr", type=int, default=16000)
+    ap.add_argument("--channels", type=int, default=1)
+    ap.add_argument("--sampwidth", type=int, default=2)
+    args = ap.parse_args()
+
+    if args.wav:
+        synthetic_wav(args.wav, args.seconds, args.sr, args.channels, args.sampwidth, args.seed)
+        return
+
+    for line in synthetic_lines(args.words, args.seed, args.speakers):
+        sys.stdout.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import pytest
+
+from Backend.F_llm import ensure_nltk_data
+
+
+@pytest.fixture(scope="session")
+def nltk_data():
+    # punkt is needed by every text stage; skip where it cannot be
+    # found or fetched (offline CI without MEETING_NLTK_DIR)
+    try:
+        ensure_nltk_data()
+    except LookupError as e:
+        pytest.skip(str(e))
@@ -0,0 +1,62 @@
+# =========================================================
+# Test signals: speech-like audio and WAV files, generated
+# in-process so tests do not depend on benchmarks/
+# =========================================================
+
+import wave
+
+import numpy as np
+
+
+def speech_audio(seconds, sr=16000, channels=1, seed=0, speech_ratio=0.7):
+    """
+    float32 (frames, channels) in [-1, 1]: voiced bursts (harmonic
+    tone, syllable-rate envelope) separated by quiet gaps.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * sr)
+    out = np.zeros(n, dtype=np.float32)
+
+    pos = 0
+    while pos < n:
+        talk = int(rng.uniform(1.0, 4.0) * sr)
+        gap = int(talk * (1 - speech_ratio) / speech_ratio)
+
+        seg = min(talk, n - pos)
+        t = np.arange(seg, dtype=np.float32) / sr
+
+        f0 = rng.uniform(100, 220)
+        voice = sum(np.sin(2 * np.pi * f0 * h * t) / h for h in range(1, 6))
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3, 6) * t) ** 2
+
+        out[pos:pos + seg] = 0.3 * voice * envelope / 2.3
+        pos += seg + gap
+
+    out += rng.standard_normal(n).astype(np.float32) * 1e-3
+
+    gains = np.linspace(1.0, 0.8, channels, dtype=np.float32)
+    return np.clip(out[:, None] * gains, -1, 1)
+
+
+def write_wav(dest, audio, sr, sampwidth=2):
+    """
+    dest: path or binary file. audio: float (frames, channels).
+    PCM is rounded, so decoding gives back audio within 1 LSB.
+    """
+    audio = np.atleast_2d(audio.T).T
+    scale = float(1 << (8 * sampwidth - 1))
+
+    if sampwidth == 1:
+        pcm = (np.round(audio * 127) + 128).astype(np.uint8).tobytes()
+    elif sampwidth == 3:
+        ints = np.round(audio * (scale - 1)).astype("<i4")
+        pcm = ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    else:
+        dtype = {2: "<i2", 4: "<i4"}[sampwidth]
+        pcm = np.round(audio * (scale - 1)).astype(dtype).tobytes()
+
+    with wave.open(dest, "wb") as wf:
+        wf.setnchannels(audio.shape[1])
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(sr)
+        wf.writeframes(pcm)
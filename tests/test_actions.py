@@ -0,0 +1,56 @@
+# =========================================================
+# Action extraction: every entry point (ActionEngine) must
+# reproduce the original extractors' tasks and owners.
+# data/actions_golden.json holds transcripts (synthetic
+# meetings + fuzzed trigger soup) with the outputs of the
+# baseline C_action / B_speaker / F_llm implementations.
+# =========================================================
+
+import json
+import os
+import re
+
+import pytest
+
+from Backend.B_speaker import extract_speaker_actions
+from Backend.C_action import extract_actions
+from Backend.F_llm import generate_insights
+
+
+with open(os.path.join(os.path.dirname(__file__), "data", "actions_golden.json"), encoding="utf-8") as f:
+    CASES = json.load(f)["cases"]
+
+# the one deliberate change: a speaker label must share its line
+LABEL_THEN_NEWLINE = re.compile(r":\s*\n")
+
+
+def pairs(actions):
+    return [[a["task"], a["owner"]] for a in actions]
+
+
+def test_line_actions_match_baseline():
+    for case in CASES:
+        assert pairs(extract_actions(case["text"])) == case["line"], case["text"]
+
+
+def test_speaker_actions_match_baseline():
+    for case in CASES:
+        if LABEL_THEN_NEWLINE.search(case["text"]):
+            continue
+        assert pairs(extract_speaker_actions(case["text"])) == case["speaker"], case["text"]
+
+
+@pytest.mark.parametrize("meeting_type", ["discussion", "standup"])
+def test_insight_actions_match_baseline(nltk_data, meeting_type):
+    for case in CASES:
+        actions = generate_insights(case["text"], "", meeting_type)["action_items"]
+        assert pairs(actions) == case[f"insights_{meeting_type}"], case["text"]
+
+
+def test_speaker_label_must_share_its_line():
+    # the baseline matched "Sara:\n..." across the newline
+    case = next(c for c in CASES if c["text"] == "Sara:\nI will send the deck tomorrow.")
+    assert case["speaker"] == [["I will send the deck tomorrow.", "Sara"]]
+
+    assert extract_speaker_actions("Sara:\nI will send the deck tomorrow.") == []
+    assert pairs(extract_speaker_actions("Sara: I will send the deck tomorrow.")) == case["speaker"]
@@ -0,0 +1,60 @@
+# =========================================================
+# Deadline phrases → ISO dates against a fixed reference
+# (Wednesday 2024-02-14, a leap year)
+# =========================================================
+
+import datetime
+
+import pytest
+
+from Backend.deadlines import parse_deadline
+
+
+WEDNESDAY = datetime.date(2024, 2, 14)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("I will send it by Feb 20th.", "2024-02-20"),
+    ("due by the 20th of February", "2024-02-20"),
+    ("by 2024-05-01", "2024-05-01"),
+    ("due on March 3rd", "2024-03-03"),
+    ("by Jan 5", "2025-01-05"),                 # already passed → next year
+    ("by mid-March", "2024-03-15"),
+    ("by end of March", "2024-03-31"),
+    ("by Friday", "2024-02-16"),
+    ("by Wednesday", "2024-02-21"),             # strictly after the reference
+    ("by this Wednesday", "2024-02-14"),
+    ("by next Monday", "2024-02-19"),
+    ("by the 15th", "2024-02-15"),
+    ("by the 10th", "2024-03-10"),
+    ("by next week", "2024-02-23"),
+    ("by end of week", "2024-02-16"),
+    ("by end of month", "2024-02-29"),
+    ("by end of quarter", "2024-03-31"),
+    ("by end of year", "2024-12-31"),
+    ("by Q2", "2024-06-30"),
+    ("tomorrow", "2024-02-15"),
+    ("Let's wrap this up today", "2024-02-14"),
+])
+def test_dates(text, expected):
+    assert parse_deadline(text, WEDNESDAY) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("by end of sprint", "end of sprint"),
+    ("by Feb 30th", "feb 30th"),
+    ("no date in this sentence", ""),
+])
+def test_phrases_without_a_date(text, expected):
+    assert parse_deadline(text, WEDNESDAY) == expected
+
+
+def test_rollover_at_year_end():
+    ref = datetime.date(2024, 12, 20)
+    assert parse_deadline("by the 5th", ref) == "2025-01-05"
+    assert parse_deadline("by Q1", ref) == "2025-03-31"
+    assert parse_deadline("by early December", ref) == "2024-12-01"
+
+
+def test_first_deadline_wins():
+    assert parse_deadline("by Friday, or by next Monday at the latest", WEDNESDAY) == "2024-02-16"
@@ -0,0 +1,105 @@
+# =========================================================
+# Decoder coverage: every container/width the pipeline
+# accepts decodes to the same mono float32 signal, through
+# soundfile and through the `wave` fallback
+# =========================================================
+
+import io
+
+import numpy as np
+import pytest
+
+from Backend import decoder
+from Backend.decoder import duration, open_audio, probe
+
+from signals import speech_audio, write_wav
+
+
+SR = 16000
+SECONDS = 2
+
+
+def decode(src, block_frames=4096):
+    with open_audio(src) as dec:
+        blocks = list(dec.blocks(block_frames))
+        assert all(b.dtype == np.float32 and b.ndim == 1 for b in blocks)
+        return dec, np.concatenate(blocks)
+
+
+def wav_bytes(audio, sampwidth):
+    buf = io.BytesIO()
+    write_wav(buf, audio, SR, sampwidth)
+    buf.seek(0)
+    return buf
+
+
+@pytest.fixture(params=["soundfile", "wave"])
+def backend(request, monkeypatch):
+    if request.param == "soundfile":
+        if decoder.sf is None:
+            pytest.skip("soundfile not installed")
+    else:
+        monkeypatch.setattr(decoder, "sf", None)
+    return request.param
+
+
+@pytest.mark.parametrize("sampwidth, tol", [(1, 1 / 64), (2, 1e-4), (3, 1e-6), (4, 1e-6)])
+@pytest.mark.parametrize("channels", [1, 2])
+def test_pcm_wav(backend, sampwidth, tol, channels):
+    audio = speech_audio(SECONDS, SR, channels=channels)
+    dec, mono = decode(wav_bytes(audio, sampwidth))
+
+    assert (dec.samplerate, dec.channels, dec.frames) == (SR, channels, SECONDS * SR)
+    np.testing.assert_allclose(mono, audio.mean(axis=1), atol=tol)
+
+
+def test_wav_path(backend, tmp_path):
+    audio = speech_audio(SECONDS, SR, channels=2)
+    path = str(tmp_path / "meeting.wav")
+    write_wav(path, audio, SR)
+
+    _, mono = decode(path, block_frames=1000)
+    np.testing.assert_allclose(mono, audio.mean(axis=1), atol=1e-4)
+
+
+@pytest.mark.parametrize("fmt, tol", [("FLAC", 1e-4), ("OGG", 0.05)])
+def test_compressed(fmt, tol):
+    sf = pytest.importorskip("soundfile")
+    if fmt not in sf.available_formats():
+        pytest.skip(f"libsndfile built without {fmt}")
+
+    audio = speech_audio(SECONDS, SR, channels=2)
+    buf = io.BytesIO()
+    sf.write(buf, audio, SR, format=fmt)
+    buf.seek(0)
+
+    dec, mono = decode(buf)
+    assert (dec.format, dec.samplerate, dec.channels) == (fmt, SR, 2)
+    assert len(mono) == SECONDS * SR
+    assert np.abs(mono - audio.mean(axis=1)).max() < tol
+
+
+def test_probe_and_duration(backend):
+    buf = wav_bytes(speech_audio(SECONDS, SR), 2)
+
+    assert probe(buf) == (SR, SECONDS * SR)
+    assert buf.tell() == 0                  # left rewound for the decoder
+    assert duration(buf) == SECONDS
+
+
+def test_unknown_format_without_ffmpeg(backend, monkeypatch):
+    monkeypatch.setattr(decoder, "FFMPEG", None)
+    junk = io.BytesIO(b"ID3" + bytes(4096))
+
+    assert probe(junk) is None
+    assert duration(junk) == 0.0
+
+    with pytest.raises(ValueError, match="install ffmpeg"):
+        open_audio(junk)
+
+
+@pytest.mark.skipif(decoder.FFMPEG is None, reason="ffmpeg not on PATH")
+def test_ffmpeg_reports_decode_errors():
+    with pytest.raises(ValueError, match="ffmpeg could not decode"):
+        with decoder.FFmpegDecoder(io.BytesIO(b"not audio at all" * 64)) as dec:
+            list(dec.blocks(4096))
@@ -0,0 +1,47 @@
+# =========================================================
+# Job scheduling: shortest first, but long jobs still run
+# =========================================================
+
+from Backend.jobs import InMemoryBackend, Job
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_shortest_job_first():
+    backend = InMemoryBackend(clock=FakeClock())
+    long, short = Job({}, 3600.0), Job({}, 60.0)
+
+    backend.push(long)
+    backend.push(short)
+
+    assert backend.pop(timeout=0) is short
+    assert backend.pop(timeout=0) is long
+
+
+def test_long_job_runs_under_steady_short_load():
+    clock = FakeClock()
+    backend = InMemoryBackend(aging=1.0, clock=clock)
+
+    long = Job({}, 3600.0)
+    backend.push(long)
+
+    # a 60 s job arrives every 10 s and one job is served per arrival
+    for step in range(1000):
+        clock.now += 10
+        backend.push(Job({}, 60.0))
+
+        if backend.pop(timeout=0) is long:
+            break
+    else:
+        raise AssertionError("long job starved")
+
+    # overtakes new arrivals once (3600 - 60) / aging seconds have passed
+    assert clock.now <= 3600
+
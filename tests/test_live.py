@@ -0,0 +1,62 @@
+# =========================================================
+# Live transcription: no audio is skipped, even when
+# inference is slower than real time
+# =========================================================
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from Backend.E_live_capture import SR, AudioSource, LiveTranscriber
+
+
+class ArraySource(AudioSource):
+    """
+    Pushes an array in 100 ms blocks, `speed` x real time.
+    """
+
+    def __init__(self, audio, speed):
+        super().__init__()
+        self.audio = audio
+        self.speed = speed
+
+    def start(self, callback, on_finish=None):
+        self._on_finish = on_finish
+        threading.Thread(target=self._run, args=(callback,), daemon=True).start()
+
+    def _run(self, callback):
+        block = SR // 10
+        for i in range(0, len(self.audio), block):
+            callback(self.audio[i:i + block])
+            time.sleep(block / SR / self.speed)
+        self._finish()
+
+    def stop(self):
+        self._finish()
+
+
+def numbered_audio(blocks):
+    # every half second holds its own index, so a word per block
+    return np.repeat(np.arange(blocks, dtype=np.float32), SR // 2)
+
+
+def block_words(delay):
+    def transcribe(audio):
+        time.sleep(delay)
+        values, first = np.unique(audio, return_index=True)
+        return " ".join(f"w{int(v)}" for v in values[np.argsort(first)])
+    return transcribe
+
+
+@pytest.mark.parametrize("delay", [0.0, 0.1])
+def test_every_block_is_committed(delay):
+    blocks = 60
+    live = LiveTranscriber(ArraySource(numbered_audio(blocks), speed=30), transcribe=block_words(delay))
+
+    events = list(live.stream())
+
+    assert [int(w[1:]) for w in live.committed] == list(range(blocks))
+    assert live.dropped_seconds == 0.0
+    assert events[-1]["partial"] == ""
@@ -0,0 +1,47 @@
+# =========================================================
+# InsightSession: however a transcript arrives (any chunk
+# boundaries, mid-word or mid-sentence), insights(fresh=True)
+# equals generate_insights over the whole text
+# =========================================================
+
+import json
+import os
+import random
+
+import pytest
+
+from Backend.F_llm import InsightSession, generate_insights
+
+
+with open(os.path.join(os.path.dirname(__file__), "data", "actions_golden.json"), encoding="utf-8") as f:
+    CASES = json.load(f)["cases"]
+
+TRANSCRIPTS = {
+    # the synthetic meeting, and every fuzzed snippet run together
+    "meeting": max((c["text"] for c in CASES), key=len),
+    "snippets": " ".join(c["text"] for c in CASES),
+}
+
+
+def chunks(text, seed):
+    rng = random.Random(seed)
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 200)
+        yield text[pos:pos + size]
+        pos += size
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("meeting_type", ["discussion", "standup"])
+@pytest.mark.parametrize("name", sorted(TRANSCRIPTS))
+def test_chunked_session_matches_batch(nltk_data, name, meeting_type, seed):
+    text = TRANSCRIPTS[name]
+    session = InsightSession(title="Sync", meeting_type=meeting_type)
+
+    for piece in chunks(text, seed):
+        session.append(piece, sep="")
+
+    assert session.transcript == text
+    assert session.insights(fresh=True) == generate_insights(text, title="Sync", meeting_type=meeting_type)
+
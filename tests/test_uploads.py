@@ -0,0 +1,117 @@
+# =========================================================
+# /uploads: chunks land only at the acknowledged offset and
+# only with a matching checksum, so a client can always
+# resume from GET /uploads/{id}
+# =========================================================
+
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from Backend import G_Main
+from Backend.uploads import UploadStore
+
+
+DATA = bytes(range(256)) * 64          # 16 KiB
+CHUNK = 4096
+
+
+def sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(G_Main, "uploads", UploadStore(str(tmp_path)))
+    # no `with`: the lifespan (model warmup, job workers) is not needed
+    return TestClient(G_Main.app)
+
+
+@pytest.fixture
+def upload_id(client):
+    r = client.post("/uploads", data={"filename": "meeting.wav", "size": len(DATA)})
+    assert r.status_code == 201
+    assert r.json()["offset"] == 0
+    return r.json()["upload_id"]
+
+
+def put(client, upload_id, offset, chunk, checksum=None):
+    return client.put(
+        f"/uploads/{upload_id}",
+        params={"offset": offset},
+        content=chunk,
+        headers={"X-Chunk-SHA256": checksum or sha(chunk)},
+    )
+
+
+def offset(client, upload_id):
+    return client.get(f"/uploads/{upload_id}").json()["offset"]
+
+
+def test_chunks_in_order(client, upload_id):
+    for start in range(0, len(DATA), CHUNK):
+        r = put(client, upload_id, start, DATA[start:start + CHUNK])
+        assert r.status_code == 200
+        assert r.json()["offset"] == start + CHUNK
+
+    info = client.get(f"/uploads/{upload_id}").json()
+    assert info["complete"]
+    assert open(G_Main.uploads.path(upload_id), "rb").read() == DATA
+
+
+def test_checksum_mismatch_keeps_last_offset(client, upload_id):
+    put(client, upload_id, 0, DATA[:CHUNK])
+
+    r = put(client, upload_id, CHUNK, DATA[CHUNK:2 * CHUNK], checksum=sha(b"other"))
+    assert r.status_code == 422
+    assert r.json()["offset"] == CHUNK
+    assert offset(client, upload_id) == CHUNK
+
+    # the resend from the same offset is accepted
+    assert put(client, upload_id, CHUNK, DATA[CHUNK:2 * CHUNK]).json()["offset"] == 2 * CHUNK
+
+
+@pytest.mark.parametrize("wrong", [0, 2 * CHUNK])
+def test_offset_mismatch_is_409(client, upload_id, wrong):
+    put(client, upload_id, 0, DATA[:CHUNK])
+
+    r = put(client, upload_id, wrong, DATA[wrong:wrong + CHUNK])
+    assert r.status_code == 409
+    assert r.json()["offset"] == CHUNK
+    assert offset(client, upload_id) == CHUNK
+
+
+def test_chunk_past_declared_size(client, upload_id):
+    r = put(client, upload_id, 0, DATA + b"x")
+    assert r.status_code == 400
+    assert offset(client, upload_id) == 0
+
+
+def test_complete_before_all_chunks_is_409(client, upload_id):
+    put(client, upload_id, 0, DATA[:CHUNK])
+
+    r = client.post(f"/uploads/{upload_id}/complete")
+    assert r.status_code == 409
+    assert (r.json()["offset"], r.json()["size"]) == (CHUNK, len(DATA))
+
+
+def test_complete_checks_file_sha256(client, upload_id):
+    put(client, upload_id, 0, DATA)
+
+    r = client.post(f"/uploads/{upload_id}/complete", data={"sha256": sha(b"other")})
+    assert r.status_code == 422
+    assert G_Main.uploads.complete(upload_id, sha(DATA)) == G_Main.uploads.path(upload_id)
+
+
+@pytest.mark.parametrize("bad_id", ["0" * 32, "not-an-upload", "..." + "A" * 29])
+def test_unknown_upload_is_404(client, bad_id):
+    r = client.get(f"/uploads/{bad_id}")
+    assert (r.status_code, r.json()["error"]) == (404, "Unknown upload")
+    assert put(client, bad_id, 0, b"x").status_code == 404
+    assert client.delete(f"/uploads/{bad_id}").status_code == 404
+
+
+def test_cancel(client, upload_id):
+    assert client.delete(f"/uploads/{upload_id}").json()["status"] == "cancelled"
+    assert client.get(f"/uploads/{upload_id}").status_code == 404
@@ -0,0 +1,41 @@
+# =========================================================
+# VAD: speech must survive whatever the pause pattern,
+# silence must not
+# =========================================================
+
+import numpy as np
+import pytest
+
+from Backend.A_STT import vad_chunks
+from signals import speech_audio
+
+
+SR = 16000
+
+
+def speech_ratio(audio):
+    stats = {}
+    list(vad_chunks([audio], sr=SR, stats=stats))
+    return stats["speech_ratio"]
+
+
+@pytest.mark.parametrize("ratio", [0.999, 0.9])
+def test_continuous_speech_survives(ratio):
+    audio = speech_audio(60, sr=SR, speech_ratio=ratio)[:, 0]
+    assert speech_ratio(audio) > 0.95
+
+
+def test_steady_loud_signal_survives():
+    t = np.arange(30 * SR, dtype=np.float32) / SR
+    audio = (0.1 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)     # -20 dBFS
+    assert speech_ratio(audio) == 1.0
+
+
+def test_pauses_are_dropped():
+    audio = speech_audio(60, sr=SR, speech_ratio=0.5)[:, 0]
+    assert 0.5 < speech_ratio(audio) < 0.8
+
+
+def test_silence_is_dropped():
+    audio = np.random.default_rng(0).standard_normal(30 * SR).astype(np.float32) * 1e-3
+    assert speech_ratio(audio) == 0.0